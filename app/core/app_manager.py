@@ -1,11 +1,16 @@
 # app/core/app_manager.py
 import os
+import logging
 import threading
 from PIL import Image
-import io
 from app.core.image_processor import ImageProcessor
-from app.utils.file_utils import get_file_size_str
+from app.utils.file_utils import get_file_size_str, iter_image_files, BackgroundScanner
 from app.core.overlay_manager import OverlayManager
+from app.core.preview_cache import PreviewCache
+from app.core.size_estimator import FileSizeEstimator, encode_size
+from app.utils.logger import get_log_level
+
+logger = logging.getLogger(__name__)
 
 class AppManager:
     """
@@ -32,6 +37,11 @@ class AppManager:
         # Desteklenen formatlar
         self.supported_formats = [".jpg", ".jpeg", ".png"]
         
+        # Kaynak klasör tarama seçenekleri
+        self.scan_recursive = False
+        self.min_file_size = None  # Bayt, None ise sınır yok
+        self.max_file_size = None  # Bayt, None ise sınır yok
+        
         # Boyutlar
         self.sizes = [
             (1200, 600, "Featured"),  # Featured image
@@ -43,6 +53,21 @@ class AppManager:
         # Seçilen boyutlar
         self.selected_sizes = [True, False, False, False]
         
+        # Toplu işlemde kullanılacak işçi süreç sayısı
+        self.worker_count = os.cpu_count() or 1
+        
+        # Bellek sınırlı mod: aynı anda işlenen görüntülerin tahmini bellek toplamı (MB)
+        self.memory_limit_mb = None
+        
+        # Artımlı mod: değişmemiş çıktılar hedef klasördeki manifestle atlanır
+        self.incremental_mode = False
+        self.incremental_content_hash = False  # mtime değiştiğinde içerik özetini karşılaştır
+        
+        # Aşama profili (çözme, yeniden boyutlandırma, eklemeler, kodlama, yazma süreleri)
+        self.profile_enabled = False
+        self.profile_trace_path = None  # Verilirse tüm ölçümler JSON olarak yazılır
+        self.last_profile_report = None
+        
         # Kırpma merkezi
         self.crop_center_x = None
         self.crop_center_y = None
@@ -52,25 +77,62 @@ class AppManager:
         self.current_preview_file = None
         self.current_preview_size = None
         self.current_original_img = None
+        self.current_original_size = None
+        
+        # Önizleme işlem hattı önbelleği (kaynak, temel ve birleşik katmanlar)
+        self.preview_cache = PreviewCache()
+        
+        # Kalite kaydırıcısı için referans kalitelerden enterpolasyonlu dosya boyutu tahmini
+        self.size_estimator = FileSizeEstimator()
+        
+        # Önizleme işlem hattı arka plan iş parçacığında da çalışabilir; önbellekler
+        # ve önizleme ekleme yöneticisi bu kilitle korunur
+        self.preview_lock = threading.RLock()
+        self._preview_overlay_manager = None
+        self._preview_overlay_key = None
         
         # İşlem durumu için callback fonksiyonları
         self.on_status_update = None
         self.on_progress_update = None
     
+    def _finish_profile(self, profile_report):
+        """Profil raporunu tamamla ve istenirse JSON iz dosyasını yaz"""
+        profile_report.finish()
+        
+        if self.profile_trace_path:
+            profile_report.write_trace(self.profile_trace_path)
+            if self.on_status_update:
+                self.on_status_update(f"Profile trace written to {self.profile_trace_path}")
+    
+    def iter_image_files(self):
+        """
+        Kaynak klasördeki desteklenen görüntü dosyalarını bulundukça döndürür
+        
+        Yields:
+            Kaynak klasöre göreli dosya yolları
+        """
+        if not self.source_folder or not os.path.isdir(self.source_folder):
+            return
+        
+        yield from iter_image_files(
+            self.source_folder,
+            self.supported_formats,
+            recursive=self.scan_recursive,
+            min_size=self.min_file_size,
+            max_size=self.max_file_size
+        )
+    
     def get_image_files(self):
         """
         Kaynak klasördeki tüm desteklenen görüntü dosyalarını döndürür
         """
-        if not self.source_folder or not os.path.isdir(self.source_folder):
-            return []
-            
-        image_files = []
-        for filename in os.listdir(self.source_folder):
-            ext = os.path.splitext(filename)[1].lower()
-            if ext in self.supported_formats:
-                image_files.append(filename)
-                
-        return image_files
+        return list(self.iter_image_files())
+    
+    def set_scan_options(self, recursive=False, min_size=None, max_size=None):
+        """Kaynak klasör tarama seçeneklerini ayarla"""
+        self.scan_recursive = recursive
+        self.min_file_size = min_size
+        self.max_file_size = max_size
     
     def set_source_folder(self, folder):
         """Kaynak klasörünü ayarla"""
@@ -88,6 +150,60 @@ class AppManager:
         """Çıktı formatını ayarla"""
         self.output_format = format_name
     
+    def set_worker_count(self, count):
+        """Toplu işlem için işçi süreç sayısını ayarla"""
+        self.worker_count = max(1, int(count))
+    
+    def set_memory_limit(self, limit_mb):
+        """Toplu işlem bellek sınırını MB olarak ayarla (None ise sınır yok)"""
+        self.memory_limit_mb = max(1, int(limit_mb)) if limit_mb else None
+    
+    def set_pixel_limit(self, max_megapixels, action="downscale"):
+        """
+        Önizleme ve toplu işlemde çözülecek görüntülerin piksel sınırını ayarla
+        
+        Args:
+            max_megapixels: Megapiksel sınırı (None ise sınır yok)
+            action: Sınırı aşan görüntüler için "downscale" ya da "reject"
+        """
+        self.image_processor.set_pixel_limit(max_megapixels, action)
+        self.invalidate_preview_cache()
+    
+    def run_preflight(self, files=None):
+        """
+        Aday dosyaların yalnızca başlıklarını okuyarak çözme maliyetlerini tahmin eder
+        
+        Args:
+            files: Kaynak klasöre göreli dosya adları (None ise kaynak klasör taranır)
+            
+        Returns:
+            PreflightReport nesnesi
+        """
+        from app.core.preflight import PreflightReport
+        
+        if files is None:
+            files = self.iter_image_files()
+        
+        sizes = [(width, height) for selected, (width, height, _) in zip(self.selected_sizes, self.sizes)
+                 if selected]
+        return PreflightReport().run(self.image_processor, self.source_folder, files, sizes)
+    
+    def set_incremental_mode(self, enabled, content_hash=False):
+        """Artımlı toplu işlem modunu ayarla"""
+        self.incremental_mode = enabled
+        self.incremental_content_hash = content_hash
+    
+    def set_profiling(self, enabled, trace_path=None):
+        """
+        Toplu işlemde aşama profilini ayarla
+        
+        Args:
+            enabled: True ise her görüntü ve boyut için aşama süreleri ölçülür
+            trace_path: Tüm ölçümlerin yazılacağı JSON iz dosyası (isteğe bağlı)
+        """
+        self.profile_enabled = enabled
+        self.profile_trace_path = trace_path if enabled else None
+    
     def set_crop_active(self, active):
         """Özel kırpma modunu etkinleştir/devre dışı bırak"""
         self.is_cropping_active = active
@@ -96,69 +212,271 @@ class AppManager:
         if not active:
             self.crop_center_x = None
             self.crop_center_y = None
-            print("Crop mode disabled, reset crop center to None")
+            logger.debug("Crop mode disabled, reset crop center to None")
         else:
-            print("Crop mode enabled")
+            logger.debug("Crop mode enabled")
     
     def set_crop_center(self, x, y):
         """Kırpma merkezini ayarla"""
         if not self.is_cropping_active:
-            print("Warning: Trying to set crop center when crop mode is not active")
+            logger.warning("Trying to set crop center when crop mode is not active")
             return
             
         self.crop_center_x = x
         self.crop_center_y = y
-        print(f"Crop center set to: x={x}, y={y}")
+        logger.debug("Crop center set to: x=%s, y=%s", x, y)
     
     def reset_crop(self):
         """Kırpma merkezini sıfırla"""
         self.crop_center_x = None
         self.crop_center_y = None
-        print("Crop center reset to None")
+        logger.debug("Crop center reset to None")
     
     def toggle_size(self, index, value):
         """Belirli boyut seçimini değiştir"""
         if 0 <= index < len(self.selected_sizes):
             self.selected_sizes[index] = value
     
-    def load_preview_image(self, filename, size_index):
+    def add_size(self, width, height, name=None, selected=True):
+        """
+        Boyut listesine yeni bir hedef boyut ekler
+        
+        Returns:
+            Eklenen (ya da zaten var olan) boyutun indeksi
+        """
+        for index, (size_width, size_height, size_name) in enumerate(self.sizes):
+            if (size_width, size_height) == (width, height):
+                self.selected_sizes[index] = selected
+                return index
+        
+        self.sizes.append((width, height, name or f"{width}x{height}"))
+        self.selected_sizes.append(selected)
+        return len(self.sizes) - 1
+    
+    def _get_preview_source(self, img_path):
+        """
+        Önizleme için çözülmüş kaynak görüntüyü önbellekten ya da diskten döndürür
+        
+        Returns:
+            (kaynak anahtarı, PIL Image nesnesi, orijinal (genişlik, yükseklik))
+        """
+        # Kaynak katmanı - dosya değişmedikçe bir kez çöz
+        source_key = (img_path, os.path.getmtime(img_path))
+        source = self.preview_cache.get("source", source_key)
+        
+        if source is None:
+            # Tüm önizleme boyutlarını karşılayacak ölçekte çöz
+            original_img, original_size = self.image_processor.open_image(
+                img_path, [(w, h) for w, h, _ in self.sizes]
+            )
+            original_img.load()
+            source = (original_img, original_size)
+            self.preview_cache.put("source", source_key, source, original_img)
+        
+        return (source_key,) + source
+    
+    def get_preview_state(self):
+        """
+        Önizleme render'ını etkileyen ayarların anlık görüntüsünü döndürür
+        
+        Arka plan iş parçacığında yapılan önizleme render'ları bu anlık görüntüyü
+        kullanır, böylece arayüzde aynı anda yapılan değişikliklerden etkilenmez.
+        """
+        return {
+            "overlay": self.overlay_manager.get_config(),
+            "crop_center": (self.crop_center_x, self.crop_center_y),
+            "quality": self.quality,
+            "output_format": self.output_format
+        }
+    
+    def _get_preview_overlay_manager(self, state):
+        """
+        Anlık görüntüdeki ekleme ayarlarını uygulayan önizleme ekleme yöneticisini döndürür
+        
+        Anlık görüntü yoksa (state None) canlı ekleme yöneticisi kullanılır.
+        """
+        if state is None:
+            return self.overlay_manager
+        
+        overlay_key = repr(sorted(state["overlay"].items()))
+        if self._preview_overlay_manager is None:
+            self._preview_overlay_manager = OverlayManager()
+        
+        # Ayarlar değişmediyse yeniden uygulama (önbellekler korunur)
+        if overlay_key != self._preview_overlay_key:
+            self._preview_overlay_manager.apply_config(state["overlay"])
+            self._preview_overlay_key = overlay_key
+        
+        return self._preview_overlay_manager
+    
+    def invalidate_preview_cache(self):
+        """Önizleme önbelleğini temizle (dosyaları diskten yeniden okumaya zorlar)"""
+        with self.preview_lock:
+            self.preview_cache.invalidate()
+    
+    def _get_preview_base(self, source_key, original_img, width, height, preview_size=None, crop_center=None):
+        """
+        Yeniden boyutlandırılmış ve kırpılmış temel görüntüyü önbellekten ya da hesaplayarak döndürür
+        
+        Args:
+            crop_center: (x, y) kırpma merkezi (None ise geçerli kırpma merkezi)
+        
+        Returns:
+            (temel anahtarı, PIL Image nesnesi)
+        """
+        crop_x, crop_y = crop_center if crop_center is not None else (self.crop_center_x, self.crop_center_y)
+        
+        # Temel katman - yeniden boyutlandırılmış ve kırpılmış görüntü
+        base_key = (source_key, width, height, crop_x, crop_y)
+        base_img = self.preview_cache.get("base", base_key)
+        
+        if base_img is None:
+            base_img = self.image_processor.resize_image_with_custom_crop(
+                original_img, 
+                width, 
+                height, 
+                crop_x, 
+                crop_y
+            )
+            self.preview_cache.put("base", base_key, base_img)
+        
+        if preview_size is None:
+            return base_key, base_img
+        
+        # Tuval çözünürlüğüne küçültülmüş temel görüntü
+        display_key = (base_key, preview_size)
+        display_img = self.preview_cache.get("base", display_key)
+        
+        if display_img is None:
+            display_img = base_img.resize(preview_size, Image.LANCZOS)
+            self.preview_cache.put("base", display_key, display_img)
+        
+        return display_key, display_img
+    
+    def _get_preview_composite(self, base_key, base_img, reference_width, overlay_manager=None):
+        """
+        Eklemeler uygulanmış görüntüyü önbellekten ya da hesaplayarak döndürür
+        
+        Args:
+            overlay_manager: Kullanılacak ekleme yöneticisi (None ise canlı yönetici)
+        
+        Returns:
+            (birleşik anahtarı, PIL Image nesnesi)
+        """
+        overlay_manager = overlay_manager or self.overlay_manager
+        
+        # Birleşik katman - metin ve grafik eklemeleri uygulanmış görüntü
+        composite_key = (base_key, overlay_manager.get_config_key())
+        composite_img = self.preview_cache.get("composite", composite_key)
+        
+        if composite_img is None:
+            composite_img = overlay_manager.apply_overlay(base_img, reference_width)
+            self.preview_cache.put("composite", composite_key, composite_img)
+        
+        return composite_key, composite_img
+    
+    def load_preview_image(self, filename, size_index, preview_size=None, state=None):
         """
         Belirli bir görüntüyü önizleme için yükler
+        
+        Args:
+            filename: Kaynak klasördeki dosya adı
+            size_index: self.sizes içindeki hedef boyutun indeksi
+            preview_size: (genişlik, yükseklik) tuval çözünürlüğü. Verilirse eklemeler
+                doğrudan bu çözünürlükte uygulanır ve tam boyutlu görüntü oluşturulmaz;
+                bu durumda tahmini dosya boyutu None döner (bkz. estimate_preview_file_size).
+            state: get_preview_state() anlık görüntüsü (None ise geçerli ayarlar).
+                Arka plan iş parçacığından çağrılırken verilmelidir.
         """
         if not self.source_folder or not filename:
             return None, None, None, None
             
         try:
             img_path = os.path.join(self.source_folder, filename)
-            original_img = Image.open(img_path)
-            self.current_original_img = original_img.copy()
-            
             width, height, name = self.sizes[size_index]
             
-            # Görüntüyü yeniden boyutlandır ve kırp
-            resized_img = self.image_processor.resize_image_with_custom_crop(
-                original_img, 
-                width, 
-                height, 
-                self.crop_center_x, 
-                self.crop_center_y
-            )
-            
-            # Metin ve grafik eklemeleri uygula
-            resized_img = self.overlay_manager.apply_overlay(resized_img)
+            with self.preview_lock:
+                source_key, original_img, self.current_original_size = self._get_preview_source(img_path)
+                self.current_original_img = original_img
+                
+                crop_center = state["crop_center"] if state else None
+                overlay_manager = self._get_preview_overlay_manager(state)
+                
+                base_key, base_img = self._get_preview_base(source_key, original_img, width, height,
+                                                            preview_size, crop_center)
+                composite_key, resized_img = self._get_preview_composite(base_key, base_img, width,
+                                                                         overlay_manager)
+                
+                # Tahmini dosya boyutunu hesapla (yalnızca tam boyutlu görüntü için)
+                estimated_size = None
+                if preview_size is None:
+                    quality = state["quality"] if state else self.quality
+                    estimated_size = self.size_estimator.estimate(
+                        composite_key, resized_img, self.get_estimate_format(filename, state), quality
+                    )
             
             # Orijinal dosya boyutunu al
             original_file_size = os.path.getsize(img_path)
             
-            # Tahmini dosya boyutunu hesapla
-            estimated_size = self.estimate_file_size(resized_img)
-            
             return original_img, resized_img, original_file_size, estimated_size
             
         except Exception as e:
-            print(f"Error loading image: {str(e)}")
+            logger.error("Error loading image %s: %s", filename, e)
             return None, None, 0, 0
     
+    def get_estimate_format(self, filename, state=None):
+        """
+        Dosya boyutu tahmininde kullanılacak kodlama formatını döndürür
+        """
+        output_format = state["output_format"] if state else self.output_format
+        if output_format in ("JPEG", "PNG", "WebP"):
+            return output_format
+        
+        # Same as input - kaynak uzantısına göre
+        if os.path.splitext(filename)[1].lower() == ".png":
+            return "PNG"
+        return "JPEG"
+    
+    def estimate_preview_file_size(self, filename, size_index, exact=False, state=None):
+        """
+        Önizleme görüntüsünün tam boyutlu çıktısı için tahmini dosya boyutunu hesaplar
+        
+        Args:
+            filename: Kaynak klasördeki dosya adı
+            size_index: self.sizes içindeki hedef boyutun indeksi
+            exact: True ise seçili kalitede gerçek kodlama yapılır; False ise
+                önbellekteki referans kalitelerden enterpolasyon yapılır (hızlı)
+            state: get_preview_state() anlık görüntüsü (None ise geçerli ayarlar)
+        """
+        if not self.source_folder or not filename:
+            return 0
+        
+        try:
+            img_path = os.path.join(self.source_folder, filename)
+            width, height, name = self.sizes[size_index]
+            
+            with self.preview_lock:
+                source_key, original_img, _ = self._get_preview_source(img_path)
+                
+                crop_center = state["crop_center"] if state else None
+                overlay_manager = self._get_preview_overlay_manager(state)
+                
+                base_key, base_img = self._get_preview_base(source_key, original_img, width, height,
+                                                            crop_center=crop_center)
+                composite_key, full_img = self._get_preview_composite(base_key, base_img, width,
+                                                                      overlay_manager)
+                
+                save_format = self.get_estimate_format(filename, state)
+                quality = state["quality"] if state else self.quality
+                
+                if exact:
+                    return self.size_estimator.estimate_exact(composite_key, full_img, save_format, quality)
+                return self.size_estimator.estimate(composite_key, full_img, save_format, quality)
+            
+        except Exception as e:
+            logger.error("Error estimating file size for %s: %s", filename, e)
+            return 0
+    
     def estimate_file_size(self, img):
         """
         Belirli bir görüntünün mevcut ayarlarla tahmini dosya boyutunu hesaplar
@@ -167,165 +485,204 @@ class AppManager:
             return 0
             
         try:
-            # Geçici bir bellek arabelleğine kaydet
-            img_byte_arr = io.BytesIO()
-            
-            # Formata göre kaydet
-            if self.output_format == "JPEG":
-                img.save(img_byte_arr, format='JPEG', quality=self.quality, optimize=True)
-            elif self.output_format == "PNG":
-                img.save(img_byte_arr, format='PNG', optimize=True)
-            elif self.output_format == "WebP":
-                img.save(img_byte_arr, format='WebP', quality=self.quality, optimize=True)
-            else:
-                # Varsayılan olarak JPEG
-                img.save(img_byte_arr, format='JPEG', quality=self.quality, optimize=True)
-            
-            # Boyutu al
-            size_bytes = img_byte_arr.tell()
-            return size_bytes
+            # Formata göre belleğe kodla (varsayılan olarak JPEG)
+            save_format = self.output_format if self.output_format in ("JPEG", "PNG", "WebP") else "JPEG"
+            return encode_size(img, save_format, self.quality)
             
         except Exception as e:
-            print(f"Error estimating file size: {str(e)}")
+            logger.error("Error estimating file size: %s", e)
             return 0
     
-    def process_images(self):
+    def get_batch_settings(self):
+        """
+        Toplu işleme için ayarların seçilebilir (picklable) bir anlık görüntüsünü döndürür
+        
+        İşçi süreçleri bu sözlükten kendi ImageProcessor ve OverlayManager
+        nesnelerini kurar, böylece işlem sırasında yapılan arayüz değişiklikleri
+        devam eden işi etkilemez.
+        """
+        # Özel kırpma merkezi sadece önizleme dosyası için kullanılır
+        use_custom_crop = (self.is_cropping_active and 
+                        self.crop_center_x is not None and 
+                        self.crop_center_y is not None)
+        
+        return {
+            "source_folder": self.source_folder,
+            "destination_folder": self.destination_folder,
+            "quality": self.quality,
+            "output_format": self.output_format,
+            "sizes": [size_data for selected, size_data in zip(self.selected_sizes, self.sizes) if selected],
+            "crop_center": (self.crop_center_x, self.crop_center_y) if use_custom_crop else None,
+            "crop_file": self.current_preview_file if use_custom_crop else None,
+            "processor": self.image_processor.get_config(),
+            "overlay": self.overlay_manager.get_config(),
+            "incremental": self.incremental_mode,
+            "content_hash": self.incremental_mode and self.incremental_content_hash,
+            "profile": self.profile_enabled,
+            "memory_limit": self.memory_limit_mb * 1024 * 1024 if self.memory_limit_mb else None,
+            "log_level": get_log_level()
+        }
+    
+    def process_images(self, wait=False):
         """
         Tüm görüntüleri işleme başlat
+        
+        Args:
+            wait: True ise işlem çağıran iş parçacığında yapılır ve bitene kadar beklenir
+                (arayüzsüz kullanım için)
+        
+        Returns:
+            İşlemi iptal etmek, duraklatmak ve izlemek için BatchJob nesnesi
         """
-        threading.Thread(target=self._process_images_thread, daemon=True).start()
+        # Süreç havuzu modülleri yalnızca toplu işlemde gerekir (açılış süresini kısaltır)
+        from app.core.batch_job import BatchJob
+        
+        job = BatchJob()
+        
+        if wait:
+            self._process_images_thread(job)
+        else:
+            threading.Thread(target=self._process_images_thread, args=(job,), daemon=True).start()
+        
+        return job
     
-    def _process_images_thread(self):
+    def _process_images_thread(self, job):
         """
         Arka planda görüntüleri işle
+        
+        Görüntüler BatchEngine ile paralel işlenir, durum ve ilerleme
+        callback'leri bu iş parçacığından giriş sırasıyla çağrılır.
+        
+        Args:
+            job: Sayaçları güncellenecek ve iptal/duraklatma olayları izlenecek BatchJob
         """
+        from app.core.batch_engine import BatchEngine
+        from app.core.manifest import BatchManifest
+        from app.core.profiler import ProfileReport
+        
+        error = None
+        profile_report = None
         try:
-            # Görüntü dosyalarını bul
-            images = self.get_image_files()
+            settings = self.get_batch_settings()
             
-            if not images:
-                if self.on_status_update:
-                    self.on_status_update("No supported images found in the source folder")
-                return
+            if settings["profile"]:
+                profile_report = ProfileReport()
+                self.last_profile_report = profile_report
+            sizes_count = len(settings["sizes"])
+            completed = 0
+            skipped = 0
+            
+            overlay_info = ""
+            if self.overlay_manager.text_enabled or self.overlay_manager.graphic_enabled:
+                overlay_info = " (with overlays)"
             
             if self.on_status_update:
-                self.on_status_update(f"Found {len(images)} images. Processing...")
+                self.on_status_update("Scanning source folder and processing images...")
             
-            # İlerleme çubuğu için toplam işlemleri hesapla
-            selected_sizes_count = sum(1 for s in self.selected_sizes if s)
-            total_operations = len(images) * selected_sizes_count
-            completed = 0
+            # Görüntü dosyaları arka planda taranır, ilk dosya bulunur bulunmaz işleme başlar
+            images = BackgroundScanner(self.iter_image_files())
+            engine = BatchEngine(settings, self.worker_count)
+            
+            # Artımlı modda önceki çalıştırmanın manifestini yükle
+            manifest = None
+            manifest_pending = 0
+            if settings["incremental"]:
+                manifest = BatchManifest(settings["destination_folder"])
+                manifest.load()
             
-            # Her görüntüyü işle
-            for img_file in images:
-                try:
-                    # Görüntüyü aç
-                    img_path = os.path.join(self.source_folder, img_file)
-                    img = Image.open(img_path)
-                    filename, ext = os.path.splitext(img_file)
+            # Sonuçlar giriş sırasıyla gelir
+            for result in engine.run(images, manifest, job):
+                img_file = result["file"]
+                job.add_result(result)
+                
+                if profile_report is not None:
+                    profile_report.add_result(result)
+                
+                if images.finished and job.total_files is None:
+                    job.set_total_files(images.count)
+                
+                if manifest is not None and result["source"] is not None:
+                    manifest.update(img_file, result["source"], result["outputs"], result["source_changed"])
                     
-                    # Özel kırpma merkezini sadece önizleme dosyası için kullan
-                    use_custom_crop = (self.is_cropping_active and 
-                                    self.crop_center_x is not None and 
-                                    self.crop_center_y is not None and 
-                                    img_file == self.current_preview_file)
+                    # Uzun işlerde kesinti durumunda ilerlemeyi kaybetmemek için ara kayıt
+                    manifest_pending += 1
+                    if manifest_pending >= 500:
+                        manifest.save()
+                        manifest_pending = 0
+                
+                for output in result["outputs"]:
+                    width, height = output["width"], output["height"]
+                    orig_size = output["orig_size"]
+                    new_size = output["new_size"]
+                    reduction = (1 - (new_size / orig_size)) * 100 if orig_size > 0 else 0
+                    
+                    completed += 1
+                    
+                    # Toplam yalnızca tarama bittiğinde kesinleşir
+                    if images.finished:
+                        total_operations = images.count * sizes_count
+                        
+                        # İlerleme güncellemesi
+                        if self.on_progress_update:
+                            self.on_progress_update((completed / total_operations) * 100)
+                    else:
+                        total_operations = "?"
                     
-                    # Çıktı formatını belirle
-                    if self.output_format == "Same as input":
-                        out_ext = ext
-                        save_format = None
-                    elif self.output_format == "JPEG":
-                        out_ext = ".jpg"
-                        save_format = "JPEG"
-                    elif self.output_format == "PNG":
-                        out_ext = ".png"
-                        save_format = "PNG"
-                    elif self.output_format == "WebP":
-                        out_ext = ".webp"
-                        save_format = "WebP"
+                    # Dosya boyutlarını gösterim için biçimlendir
+                    orig_size_str = get_file_size_str(orig_size)
+                    new_size_str = get_file_size_str(new_size)
                     
-                    # Her seçilen boyut için işle
-                    for i, (selected, size_data) in enumerate(zip(self.selected_sizes, self.sizes)):
-                        if selected:
-                            width, height, size_name = size_data
-                            
-                            # Özel kırpma kullan (uygulanabilirse)
-                            if use_custom_crop:
-                                resized_img = self.image_processor.resize_image_with_custom_crop(
-                                    img.copy(), 
-                                    width, height, 
-                                    self.crop_center_x, 
-                                    self.crop_center_y
-                                )
-                            else:
-                                resized_img = self.image_processor.resize_image_with_custom_crop(
-                                    img.copy(), 
-                                    width, height, 
-                                    None, None
-                                )
-                            
-                            # Metin ve grafik eklemeleri uygula
-                            resized_img = self.overlay_manager.apply_overlay(resized_img)
-                            
-                            # Boyuta özgü alt klasör oluştur
-                            size_folder = f"{width}x{height}"
-                            out_folder = os.path.join(self.destination_folder, size_folder)
-                            os.makedirs(out_folder, exist_ok=True)
-                            
-                            # Görüntüyü kaydet
-                            out_file = os.path.join(out_folder, f"{filename}{out_ext}")
-                            
-                            # Orijinal ve yeni dosya boyutlarını takip et
-                            orig_size = os.path.getsize(img_path)
-                            
-                            if save_format in ["JPEG", "WebP"]:
-                                resized_img.save(out_file, format=save_format, quality=self.quality, optimize=True)
-                            elif save_format == "PNG":
-                                resized_img.save(out_file, format="PNG", optimize=True)
-                            else:  # Same as input
-                                if ext.lower() in ['.jpg', '.jpeg']:
-                                    resized_img.save(out_file, quality=self.quality, optimize=True)
-                                else:
-                                    resized_img.save(out_file, optimize=True)
-                            
-                            # Yeni dosya boyutunu al
-                            new_size = os.path.getsize(out_file)
-                            reduction = (1 - (new_size / orig_size)) * 100 if orig_size > 0 else 0
-                            
-                            completed += 1
-                            progress = (completed / total_operations) * 100
-                            
-                            # İlerleme güncellemesi
-                            if self.on_progress_update:
-                                self.on_progress_update(progress)
-                            
-                            # Dosya boyutlarını gösterim için biçimlendir
-                            orig_size_str = get_file_size_str(orig_size)
-                            new_size_str = get_file_size_str(new_size)
-                            
-                            crop_info = ""
-                            if use_custom_crop:
-                                crop_info = " (with custom crop)"
-                                
-                            overlay_info = ""
-                            if self.overlay_manager.text_enabled or self.overlay_manager.graphic_enabled:
-                                overlay_info = " (with overlays)"
-                                
-                            # Durum güncellemesi
-                            if self.on_status_update:
-                                self.on_status_update(
-                                    f"Processed {completed}/{total_operations}: {img_file} ({width}x{height})"
-                                    f"{crop_info}{overlay_info} - {orig_size_str} → {new_size_str} ({reduction:.1f}% smaller)"
-                                )
+                    if output["skipped"]:
+                        skipped += 1
+                        if self.on_status_update:
+                            self.on_status_update(
+                                f"Skipped {completed}/{total_operations}: {img_file} ({width}x{height}) - unchanged"
+                            )
+                        continue
+                    
+                    crop_info = ""
+                    if output["custom_crop"]:
+                        crop_info = " (with custom crop)"
+                        
+                    # Durum güncellemesi
+                    if self.on_status_update:
+                        self.on_status_update(
+                            f"Processed {completed}/{total_operations}: {img_file} ({width}x{height})"
+                            f"{crop_info}{overlay_info} - {orig_size_str} → {new_size_str} ({reduction:.1f}% smaller)"
+                        )
                 
-                except Exception as e:
+                if result["error"]:
                     if self.on_status_update:
-                        self.on_status_update(f"Error processing {img_file}: {str(e)}")
+                        self.on_status_update(f"Error processing {img_file}: {result['error']}")
+            
+            if manifest is not None:
+                manifest.save()
+            
+            if profile_report is not None:
+                self._finish_profile(profile_report)
+            
+            if job.is_cancelled:
+                if self.on_status_update:
+                    self.on_status_update(
+                        f"Processing cancelled - {job.files_done} file(s) done, {job.files_failed} failed"
+                    )
+                return
+            
+            if images.count == 0:
+                if self.on_status_update:
+                    self.on_status_update("No supported images found in the source folder")
+                return
             
             if self.on_status_update:
+                if skipped:
+                    self.on_status_update(f"Skipped {skipped} unchanged output(s)")
                 self.on_status_update("All images processed successfully!")
                 self.on_progress_update(100)  # İlerleme çubuğunu tamamla
         
         except Exception as e:
+            error = str(e)
             if self.on_status_update:
-                self.on_status_update(f"Error: {str(e)}")
\ No newline at end of file
+                self.on_status_update(f"Error: {error}")
+        
+        finally:
+            job.finish(error)
\ No newline at end of file
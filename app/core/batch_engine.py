@@ -0,0 +1,462 @@
+# app/core/batch_engine.py
+import os
+import signal
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from PIL import Image
+from app.core.image_processor import ImageProcessor
+from app.core.overlay_manager import OverlayManager
+from app.core.manifest import get_settings_hash, get_file_hash
+from app.core.output_writer import OutputWriter
+from app.core.profiler import StageProfiler, get_peak_rss
+from app.utils.logger import setup_logging
+
+# Her işçi sürecinde bir kez kurulan işleme bağlamı
+_worker_context = None
+
+
+def _init_worker(settings, cancel_event=None, resume_event=None):
+    """İşçi süreci başlatıcısı - ayar anlık görüntüsünden bağlamı kurar"""
+    global _worker_context
+
+    # Ctrl+C ana süreçte işlenir; işçiler iptal olayıyla durdurulur
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    # Spawn ile başlatılan süreçler günlük ayarlarını devralmaz
+    setup_logging(settings.get("log_level"))
+
+    _worker_context = BatchContext(settings, cancel_event, resume_event)
+
+
+def _process_in_worker(img_file, previous=None):
+    """İşçi sürecinde tek bir dosyayı işler"""
+    return _worker_context.process_file(img_file, previous)
+
+
+class BatchContext:
+    """
+    Toplu iş ayarlarının anlık görüntüsünden işleme nesnelerini kuran ve
+    tek tek dosyaları işleyen sınıf
+    """
+
+    def __init__(self, settings, cancel_event=None, resume_event=None):
+        """
+        Args:
+            settings: Toplu iş ayarlarının anlık görüntüsü
+            cancel_event: Ayarlandığında işlemin durmasını isteyen olay (isteğe bağlı)
+            resume_event: Ayarlı değilken işlemin beklemesini sağlayan olay (isteğe bağlı)
+        """
+        self.settings = settings
+        self.cancel_event = cancel_event
+        self.resume_event = resume_event
+
+        # Görüntü işleme motoru ve ekleme yöneticisi bu bağlama özeldir
+        self.image_processor = ImageProcessor()
+        self.image_processor.apply_config(settings["processor"])
+
+        # Grafik dosyasının imzası yüklemeden önce alınır (arada değişirse sonraki
+        # çalıştırmada çıktılar yeniden üretilir)
+        self.graphic_signature = self.get_graphic_signature()
+
+        self.overlay_manager = OverlayManager()
+        self.overlay_manager.apply_config(settings["overlay"])
+
+        # Kodlama ve disk yazma işlemleri çözme/yeniden boyutlandırma ile örtüşür.
+        # Bellek sınırı varsa aynı anda yalnızca bir çıktı kodlanır ve en fazla
+        # bir çıktı kuyrukta bekler.
+        if settings.get("memory_limit"):
+            self.writer = OutputWriter(worker_count=1, max_pending=2)
+        else:
+            self.writer = OutputWriter()
+
+        # Aşama süreleri yalnızca profil açıksa ölçülür
+        self.profiler = StageProfiler(settings.get("profile", False))
+        if self.profiler.enabled:
+            self.image_processor.set_profiler(self.profiler)
+            self.overlay_manager.set_profiler(self.profiler)
+            self.writer.set_profiler(self.profiler)
+
+    def close(self):
+        """Bekleyen yazmaları bitir ve yazıcıyı kapat"""
+        self.writer.close()
+
+    def get_output_format(self, ext):
+        """
+        Çıktı uzantısını ve kaydetme formatını döndürür
+        """
+        output_format = self.settings["output_format"]
+
+        if output_format == "JPEG":
+            return ".jpg", "JPEG"
+        elif output_format == "PNG":
+            return ".png", "PNG"
+        elif output_format == "WebP":
+            return ".webp", "WebP"
+        else:  # Same as input
+            return ext, None
+
+    def should_stop(self):
+        """
+        İşlem duraklatılmışsa sürdürülene kadar bekler, iptal istendiyse True döndürür
+        """
+        if self.resume_event is not None:
+            self.resume_event.wait()
+        return self.cancel_event is not None and self.cancel_event.is_set()
+
+    def get_save_options(self, save_format, ext):
+        """
+        Kaydetme formatını ve parametrelerini döndürür
+
+        Returns:
+            (PIL formatı, kaydetme parametreleri) ikilisi
+        """
+        quality = self.settings["quality"]
+
+        if save_format is None:  # Same as input
+            save_format = Image.registered_extensions().get(ext.lower())
+
+        if save_format in ["JPEG", "WebP"]:
+            params = {"quality": quality, "optimize": True}
+        else:
+            params = {"optimize": True}
+
+        return save_format, params
+
+    def get_source_signature(self, img_path, previous_source=None):
+        """
+        Kaynak dosyanın imzasını (boyut, mtime, isteğe bağlı içerik özeti) döndürür
+
+        İçerik özeti yalnızca içerik karşılaştırması açıksa ve boyut aynı kalıp
+        mtime değiştiyse hesaplanır; mtime aynıysa önceki özet taşınır.
+
+        Args:
+            img_path: Kaynak dosyanın tam yolu
+            previous_source: Manifestteki önceki imza (yoksa None)
+
+        Returns:
+            (imza sözlüğü, kaynak değişmedi mi) ikilisi
+        """
+        stat = os.stat(img_path)
+        source = {"size": stat.st_size, "mtime": stat.st_mtime, "hash": None}
+
+        if previous_source is None or previous_source.get("size") != source["size"]:
+            if self.settings.get("content_hash"):
+                source["hash"] = get_file_hash(img_path)
+            return source, False
+
+        if previous_source.get("mtime") == source["mtime"]:
+            source["hash"] = previous_source.get("hash")
+            return source, True
+
+        if not self.settings.get("content_hash"):
+            return source, False
+
+        # mtime değişti ama içerik aynı olabilir (örn. dosya yeniden kopyalandı)
+        source["hash"] = get_file_hash(img_path)
+        previous_hash = previous_source.get("hash")
+        return source, previous_hash is not None and source["hash"] == previous_hash
+
+    def get_graphic_signature(self):
+        """
+        Eklenen grafik dosyasının imzasını döndürür
+
+        Aynı yoldaki dosya değiştirildiğinde çıktıların yeniden üretilmesi için
+        render ayarları özetine eklenir. İçerik karşılaştırması açıksa içerik
+        özeti, değilse boyut ve mtime kullanılır.
+
+        Returns:
+            İmza sözlüğü ya da grafik eklemesi kapalıysa None
+        """
+        overlay = self.settings["overlay"]
+        graphic_path = overlay.get("graphic_path")
+        if not (overlay.get("graphic_enabled") and graphic_path):
+            return None
+
+        try:
+            if self.settings.get("content_hash"):
+                return {"hash": get_file_hash(graphic_path)}
+            stat = os.stat(graphic_path)
+            return {"size": stat.st_size, "mtime": stat.st_mtime}
+        except OSError:
+            return {"missing": True}
+
+    def get_render_settings_hash(self, width, height, use_custom_crop):
+        """
+        Tek bir çıktı boyutunu etkileyen tüm ayarların özetini döndürür
+        """
+        render_settings = {
+            "size": (width, height),
+            "quality": self.settings["quality"],
+            "output_format": self.settings["output_format"],
+            "processor": self.settings["processor"],
+            "overlay": self.settings["overlay"],
+            "crop_center": self.settings["crop_center"] if use_custom_crop else None
+        }
+
+        # Grafiksiz ayarların özeti önceki sürümlerle aynı kalır
+        if self.graphic_signature is not None:
+            render_settings["graphic"] = self.graphic_signature
+
+        return get_settings_hash(render_settings)
+
+    def process_file(self, img_file, previous=None):
+        """
+        Tek bir görüntüyü seçilen tüm boyutlarda işler
+
+        Artımlı modda, kaynağı ve render ayarları değişmemiş ve çıktı dosyası
+        hâlâ mevcut olan boyutlar yeniden üretilmez.
+
+        Args:
+            img_file: Kaynak klasördeki dosya adı
+            previous: Bu dosyanın manifestteki önceki kaydı (yoksa None)
+
+        Returns:
+            Dosya adı, kaynak imzası, çıktı bilgileri, iptal durumu, varsa hata
+            mesajı ve profil açıksa aşama ölçümleri (timings, peak_rss) içeren sözlük
+        """
+        result = {"file": img_file, "source": None, "source_changed": True, "outputs": [],
+                  "cancelled": False, "error": None}
+
+        self.profiler.set_labels(img_file)
+        with self.profiler.stage("file"):
+            self._process_file(img_file, previous, result)
+
+        if self.profiler.enabled:
+            result["timings"] = self.profiler.drain()
+            result["peak_rss"] = get_peak_rss()
+
+        return result
+
+    def _process_file(self, img_file, previous, result):
+        """process_file gövdesi - sonuçları result sözlüğüne yazar"""
+        try:
+            if self.should_stop():
+                result["cancelled"] = True
+                return
+
+            sizes = self.settings["sizes"]
+            destination_folder = self.settings["destination_folder"]
+            img_path = os.path.join(self.settings["source_folder"], img_file)
+            filename, ext = os.path.splitext(img_file)
+
+            # Özel kırpma merkezini sadece önizleme dosyası için kullan
+            crop_center = self.settings["crop_center"]
+            use_custom_crop = crop_center is not None and img_file == self.settings["crop_file"]
+            center_x, center_y = crop_center if use_custom_crop else (None, None)
+
+            out_ext, save_format = self.get_output_format(ext)
+
+            # Kaynak imzası (orijinal dosya boyutu da buradan alınır)
+            previous_source = previous["source"] if previous else None
+            source, source_unchanged = self.get_source_signature(img_path, previous_source)
+            result["source"] = source
+            result["source_changed"] = not source_unchanged
+            orig_size = source["size"]
+
+            # Hangi boyutların yeniden üretilmesi gerektiğini belirle
+            pending_sizes = []
+            for width, height, size_name in sizes:
+                size_key = f"{width}x{height}"
+                out_path = os.path.join(size_key, f"{filename}{out_ext}")
+                out_file = os.path.join(destination_folder, out_path)
+                settings_hash = self.get_render_settings_hash(width, height, use_custom_crop)
+
+                previous_output = previous["outputs"].get(size_key) if previous else None
+                if (source_unchanged and previous_output is not None
+                        and previous_output["settings"] == settings_hash
+                        and previous_output["path"] == out_path
+                        and os.path.exists(out_file)):
+                    # Boyut manifestten alınır (ağ depolamasında ek stat çağrısı yapılmaz)
+                    new_size = previous_output.get("size")
+                    if new_size is None:
+                        new_size = os.path.getsize(out_file)
+
+                    result["outputs"].append({
+                        "width": width,
+                        "height": height,
+                        "orig_size": orig_size,
+                        "new_size": new_size,
+                        "custom_crop": use_custom_crop,
+                        "path": out_path,
+                        "settings": settings_hash,
+                        "skipped": True
+                    })
+                else:
+                    pending_sizes.append((width, height, out_path, out_file, settings_hash))
+
+            if not pending_sizes:
+                return
+
+            # Görüntüyü aç ve çöz (mümkünse azaltılmış çözünürlükte)
+            target_sizes = [(width, height) for width, height, _, _, _ in pending_sizes]
+            with self.profiler.stage("decode"):
+                img, original_size = self.image_processor.open_image(img_path, target_sizes)
+                img.load()
+
+            resized_images = self.image_processor.resize_to_sizes(
+                img, target_sizes, center_x, center_y
+            )
+
+            save_format, save_params = self.get_save_options(save_format, ext)
+
+            # Her seçilen boyut için işle - kodlama ve yazma yazıcı iş parçacıklarında,
+            # sonraki boyutun işlenmesiyle eş zamanlı yapılır
+            writes = []
+            try:
+                # Boyutlar üreteçten sırayla alınır; her boyutun yeniden boyutlandırma
+                # ölçümleri, üreteç ilerletilmeden önce ayarlanan etiketle kaydedilir
+                size_keys = [f"{width}x{height}" for width, height in target_sizes]
+                self.profiler.set_labels(img_file, size_keys[0])
+
+                for index, resized_img in enumerate(resized_images):
+                    width, height, out_path, out_file, settings_hash = pending_sizes[index]
+
+                    # Boyutlar arasında iptal ve duraklatma kontrolü
+                    if self.should_stop():
+                        result["cancelled"] = True
+                        break
+
+                    # Metin ve grafik eklemeleri uygula (yeniden boyutlandırılmış görüntü
+                    # bu döngüye ait olduğundan kopyalanmadan değiştirilir)
+                    resized_img = self.overlay_manager.apply_overlay(resized_img, in_place=True)
+
+                    # Boyuta özgü alt klasör yazıcıda bir kez oluşturulur
+                    # (alt klasörlerdeki dosyalar için yapı korunur)
+                    future = self.writer.submit(resized_img, out_file, save_format, save_params)
+                    writes.append((future, width, height, out_path, settings_hash))
+
+                    if index + 1 < len(size_keys):
+                        self.profiler.set_labels(img_file, size_keys[index + 1])
+            finally:
+                # Piramit seviyelerini ve çözülmüş kaynağı hemen bırak
+                resized_images.close()
+                img.close()
+
+                # Gönderilen tüm yazmaların bitmesini bekle (hata olsa bile yarım dosya kalmaz)
+                for future, *_ in writes:
+                    future.exception()
+
+            # Boyutlar kodlanmış veriden alınır
+            for future, width, height, out_path, settings_hash in writes:
+                result["outputs"].append({
+                    "width": width,
+                    "height": height,
+                    "orig_size": orig_size,
+                    "new_size": future.result(),
+                    "custom_crop": use_custom_crop,
+                    "path": out_path,
+                    "settings": settings_hash,
+                    "skipped": False
+                })
+
+        except Exception as e:
+            result["error"] = str(e)
+
+
+class BatchEngine:
+    """
+    Görüntüleri bir süreç havuzunda paralel olarak işleyen toplu iş motoru
+    """
+
+    def __init__(self, settings, worker_count=None):
+        """
+        Args:
+            settings: AppManager.get_batch_settings() tarafından üretilen seçilebilir (picklable) ayar sözlüğü
+            worker_count: İşçi süreç sayısı (None ise CPU sayısı)
+        """
+        self.settings = settings
+        self.worker_count = max(1, worker_count or os.cpu_count() or 1)
+
+        # Bellek sınırı varsa dosyaların tahmini bellek kullanımı başlıklarından hesaplanır
+        self.memory_limit = settings.get("memory_limit")
+        self.image_processor = ImageProcessor()
+        self.image_processor.apply_config(settings["processor"])
+
+    def estimate_memory(self, img_file):
+        """
+        Bir dosyanın işlenmesi için gereken tahmini belleği döndürür
+
+        Başlığı okunamayan dosyalar için 0 döner; hata işçide raporlanır.
+        """
+        img_path = os.path.join(self.settings["source_folder"], img_file)
+        sizes = [(width, height) for width, height, _ in self.settings["sizes"]]
+        try:
+            return self.image_processor.estimate_memory(img_path, sizes)
+        except Exception:
+            return 0
+
+    def run(self, images, manifest=None, job=None):
+        """
+        Görüntüleri işler ve sonuçları giriş sırasıyla döndürür
+
+        Args:
+            images: İşlenecek dosya adları (liste veya üreteç)
+            manifest: Artımlı mod için BatchManifest (None ise tüm çıktılar üretilir)
+            job: İptal ve duraklatma olaylarını sağlayan BatchJob (isteğe bağlı)
+
+        Yields:
+            BatchContext.process_file sonuç sözlükleri, giriş sırasıyla.
+            İptal edildiğinde henüz başlamamış dosyalar için sonuç üretilmez.
+        """
+        cancel_event = job.cancel_event if job else None
+        resume_event = job.resume_event if job else None
+
+        if self.worker_count == 1:
+            # Tek işçi - havuz kurma maliyetinden kaçın
+            context = BatchContext(self.settings, cancel_event, resume_event)
+            try:
+                for img_file in images:
+                    if context.should_stop():
+                        return
+                    previous = manifest.get(img_file) if manifest else None
+                    yield context.process_file(img_file, previous)
+            finally:
+                context.close()
+            return
+
+        # Tk iş parçacıklarıyla fork güvenli olmadığından spawn kullan
+        mp_context = multiprocessing.get_context("spawn")
+
+        # Bellekte bekleyen iş sayısını sınırla
+        max_pending = self.worker_count * 4
+
+        with ProcessPoolExecutor(max_workers=self.worker_count, mp_context=mp_context,
+                                 initializer=_init_worker,
+                                 initargs=(self.settings, cancel_event, resume_event)) as executor:
+            pending = deque()  # (future, tahmini bellek) çiftleri
+            in_flight = 0
+
+            for img_file in images:
+                if cancel_event is not None and cancel_event.is_set():
+                    break
+
+                # Bellek sınırı aşılacaksa önce en eski sonuçları bekle.
+                # Sınırdan büyük tek bir görüntü tek başına işlenir.
+                cost = 0
+                if self.memory_limit:
+                    cost = self.estimate_memory(img_file)
+                    while pending and in_flight + cost > self.memory_limit:
+                        future, done_cost = pending.popleft()
+                        in_flight -= done_cost
+                        yield future.result()
+
+                previous = manifest.get(img_file) if manifest else None
+                pending.append((executor.submit(_process_in_worker, img_file, previous), cost))
+                in_flight += cost
+
+                # Kuyruk doluysa en eski sonucu sırayla bekle
+                if len(pending) >= max_pending:
+                    future, done_cost = pending.popleft()
+                    in_flight -= done_cost
+                    yield future.result()
+
+            # İptal edildiyse henüz başlamamış işleri bırak
+            if cancel_event is not None and cancel_event.is_set():
+                for future, _ in pending:
+                    future.cancel()
+
+            while pending:
+                future, _ = pending.popleft()
+                if not future.cancelled():
+                    yield future.result()
@@ -0,0 +1,203 @@
+# app/core/batch_job.py
+import time
+import threading
+import multiprocessing
+
+
+class BatchJob:
+    """
+    Çalışan bir toplu işlemin tanıtıcısı
+
+    İşlemi iptal etme, duraklatma ve sürdürme olanağı ile canlı sayaçlar
+    (tamamlanan, hatalı, okunan/yazılan bayt, verim) ve tahmini kalan süre sunar.
+
+    İptal ve duraklatma olayları işçi süreçleriyle paylaşılabilen
+    multiprocessing olaylarıdır; işçiler bunları görüntüler ve boyutlar
+    arasında kontrol eder.
+    """
+
+    RUNNING = "running"
+    PAUSED = "paused"
+    CANCELLED = "cancelled"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+    def __init__(self):
+        # İşçilerle paylaşılan olaylar (spawn bağlamında oluşturulur)
+        mp_context = multiprocessing.get_context("spawn")
+        self.cancel_event = mp_context.Event()
+        self.resume_event = mp_context.Event()  # Ayarlıysa çalışır, değilse duraklatılmış
+        self.resume_event.set()
+
+        self.state = self.RUNNING
+        self.error = None
+
+        # Sayaçlar
+        self.total_files = None  # Tarama bitene kadar bilinmez
+        self.files_done = 0
+        self.files_failed = 0
+        self.outputs_done = 0
+        self.outputs_skipped = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+
+        # Zamanlama (duraklatılan süre hariç tutulur)
+        self.start_time = time.monotonic()
+        self.end_time = None
+        self.paused_at = None
+        self.paused_duration = 0.0
+
+        self._lock = threading.Lock()
+        self._finished = threading.Event()
+
+    def cancel(self):
+        """İşlemi iptal et - devam eden görüntü bittikten sonra işçiler durur"""
+        with self._lock:
+            if self._finished.is_set():
+                return
+            self.cancel_event.set()
+            self._resume_locked()  # Duraklatılmış işçileri uyandır
+
+    def pause(self):
+        """İşlemi duraklat - işçiler bir sonraki görüntü ya da boyutta bekler"""
+        with self._lock:
+            if self._finished.is_set() or self.cancel_event.is_set() or self.paused_at is not None:
+                return
+            self.resume_event.clear()
+            self.paused_at = time.monotonic()
+            self.state = self.PAUSED
+
+    def resume(self):
+        """Duraklatılmış işlemi sürdür"""
+        with self._lock:
+            self._resume_locked()
+
+    def _resume_locked(self):
+        """Kilit alınmışken duraklatmayı kaldır"""
+        if self.paused_at is not None:
+            self.paused_duration += time.monotonic() - self.paused_at
+            self.paused_at = None
+            if self.state == self.PAUSED:
+                self.state = self.RUNNING
+        self.resume_event.set()
+
+    @property
+    def is_cancelled(self):
+        """İptal istendiyse True"""
+        return self.cancel_event.is_set()
+
+    @property
+    def is_paused(self):
+        """İşlem duraklatılmışsa True"""
+        return self.paused_at is not None
+
+    @property
+    def is_finished(self):
+        """İşlem bittiyse (tamamlandı, iptal edildi ya da hata) True"""
+        return self._finished.is_set()
+
+    def wait(self, timeout=None):
+        """
+        İşlem bitene kadar bekle
+
+        Returns:
+            İşlem bittiyse True, zaman aşımında False
+        """
+        return self._finished.wait(timeout)
+
+    def set_total_files(self, total_files):
+        """Tarama bittiğinde toplam dosya sayısını ayarla"""
+        self.total_files = total_files
+
+    def add_result(self, result):
+        """
+        BatchContext.process_file sonucunu sayaçlara ekle
+        """
+        with self._lock:
+            if result["error"]:
+                self.files_failed += 1
+            elif not result["cancelled"]:
+                self.files_done += 1
+
+            if result["source"] is not None:
+                self.bytes_in += result["source"]["size"]
+
+            for output in result["outputs"]:
+                if output["skipped"]:
+                    self.outputs_skipped += 1
+                else:
+                    self.outputs_done += 1
+                    self.bytes_out += output["new_size"]
+
+    def finish(self, error=None):
+        """İşlemi bitmiş olarak işaretle (işlem iş parçacığı tarafından çağrılır)"""
+        with self._lock:
+            if self.paused_at is not None:
+                self._resume_locked()
+            self.end_time = time.monotonic()
+            self.error = error
+
+            if error is not None:
+                self.state = self.FAILED
+            elif self.cancel_event.is_set():
+                self.state = self.CANCELLED
+            else:
+                self.state = self.COMPLETED
+
+            self._finished.set()
+
+    def get_elapsed(self):
+        """Duraklatılan süre hariç geçen süre (saniye)"""
+        end_time = self.end_time if self.end_time is not None else time.monotonic()
+        paused = self.paused_duration
+        if self.paused_at is not None:
+            paused += end_time - self.paused_at
+        return max(0.0, end_time - self.start_time - paused)
+
+    def get_throughput(self):
+        """
+        Verimi döndürür
+
+        Returns:
+            (saniyedeki dosya, saniyedeki okunan bayt) ikilisi
+        """
+        elapsed = self.get_elapsed()
+        if elapsed <= 0:
+            return 0.0, 0.0
+        files = self.files_done + self.files_failed
+        return files / elapsed, self.bytes_in / elapsed
+
+    def get_eta(self):
+        """
+        Tahmini kalan süreyi saniye olarak döndürür
+
+        Toplam dosya sayısı henüz bilinmiyorsa ya da verim ölçülemiyorsa None döner.
+        """
+        if self.total_files is None or self.is_finished:
+            return None
+
+        files_per_second, _ = self.get_throughput()
+        if files_per_second <= 0:
+            return None
+
+        remaining = self.total_files - self.files_done - self.files_failed
+        return max(0, remaining) / files_per_second
+
+    def get_stats(self):
+        """Sayaçların tutarlı bir anlık görüntüsünü sözlük olarak döndürür"""
+        with self._lock:
+            files_per_second, bytes_per_second = self.get_throughput()
+            return {
+                "state": self.state,
+                "total_files": self.total_files,
+                "files_done": self.files_done,
+                "files_failed": self.files_failed,
+                "outputs_done": self.outputs_done,
+                "outputs_skipped": self.outputs_skipped,
+                "bytes_in": self.bytes_in,
+                "bytes_out": self.bytes_out,
+                "elapsed": self.get_elapsed(),
+                "files_per_second": files_per_second,
+                "bytes_per_second": bytes_per_second,
+                "eta": self.get_eta()
+            }
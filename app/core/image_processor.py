@@ -1,13 +1,314 @@
 # app/core/image_processor.py
+import math
+import logging
 from PIL import Image
+from app.core.profiler import NULL_PROFILER
+
+logger = logging.getLogger(__name__)
 
 class ImageProcessor:
     """
     Görüntü işleme fonksiyonlarını sağlayan sınıf
     """
     
+    # Çoklu boyut modunda ara görüntülerin hedefin en az kaç katı olacağı.
+    # 2 katlık ara görüntüden LANCZOS ile küçültülen çıktılar, doğrudan
+    # orijinalden küçültülenlerden piksel başına ortalama 1 gri seviyeden
+    # (0-255) daha az farklılık gösterir.
+    PYRAMID_OVERSAMPLE = 2
+    
+    # Piksel sınırı varsayılan olarak kapalıdır; Pillow yine de 89 MP üzerinde
+    # uyarır ve 178 MP üzerindeki dosyaları hiç açmaz. Küçük makineler için
+    # önerilen sınır (megapiksel) CLI ve ön kontrol raporunda kullanılır.
+    DEFAULT_MAX_MEGAPIXELS = None
+    SUGGESTED_MAX_MEGAPIXELS = 100
+    
+    # JPEG DCT ölçeklemenin desteklediği küçültme oranları
+    DRAFT_SCALES = (1, 2, 4, 8)
+    
     def __init__(self):
-        pass
+        # Birden fazla boyut için tek bir küçültme piramidi kullan
+        self.multi_size_mode = True
+        
+        # JPEG dosyalarını DCT ölçekleme ile azaltılmış çözünürlükte çöz
+        self.draft_mode = True
+        
+        # Piksel sınırını aşan görüntüler: "downscale" (JPEG ise azaltılmış çöz) ya da "reject"
+        self.max_megapixels = self.DEFAULT_MAX_MEGAPIXELS
+        self.oversize_action = "downscale"
+        
+        # Aşama süreleri (varsayılan olarak ölçüm yapılmaz)
+        self.profiler = NULL_PROFILER
+    
+    def set_profiler(self, profiler):
+        """Aşama sürelerini kaydedecek StageProfiler nesnesini ayarla"""
+        self.profiler = profiler
+    
+    def set_multi_size_mode(self, enabled):
+        """Çoklu boyut (piramit) modunu etkinleştir/devre dışı bırak"""
+        self.multi_size_mode = enabled
+    
+    def set_draft_mode(self, enabled):
+        """Azaltılmış çözünürlükte JPEG çözmeyi etkinleştir/devre dışı bırak"""
+        self.draft_mode = enabled
+    
+    def set_pixel_limit(self, max_megapixels, action="downscale"):
+        """
+        Çözülecek görüntülerin piksel sınırını ayarla
+        
+        Args:
+            max_megapixels: Megapiksel sınırı (None ise sınır yok)
+            action: Sınırı aşan görüntüler için "downscale" ya da "reject"
+        """
+        if action not in ("downscale", "reject"):
+            raise ValueError(f"Unknown oversize action: {action}")
+        self.max_megapixels = max_megapixels
+        self.oversize_action = action
+    
+    def get_config(self):
+        """İşleme ayarlarını seçilebilir (picklable) bir sözlük olarak döndürür"""
+        return {
+            'multi_size_mode': self.multi_size_mode,
+            'draft_mode': self.draft_mode,
+            'max_megapixels': self.max_megapixels,
+            'oversize_action': self.oversize_action
+        }
+    
+    def apply_config(self, config):
+        """get_config() ile üretilmiş ayarları uygular"""
+        self.multi_size_mode = config.get('multi_size_mode', self.multi_size_mode)
+        self.draft_mode = config.get('draft_mode', self.draft_mode)
+        self.max_megapixels = config.get('max_megapixels', self.max_megapixels)
+        self.oversize_action = config.get('oversize_action', self.oversize_action)
+    
+    def _get_level_size(self, source_size, width, height):
+        """
+        Hedef boyutu kırpmadan önce kaplayacak ara görüntü boyutunu hesaplar
+        
+        Returns:
+            (genişlik, yükseklik) ya da kaynak yeterince büyük değilse None
+        """
+        source_width, source_height = source_size
+        scale = max(width / source_width, height / source_height) * self.PYRAMID_OVERSAMPLE
+        
+        if scale >= 1:
+            return None
+        
+        return math.ceil(source_width * scale), math.ceil(source_height * scale)
+    
+    def _get_draft_size(self, source_size, sizes):
+        """
+        Tüm hedef boyutları kaplayan en küçük çözme boyutunu hesaplar
+        
+        Returns:
+            (genişlik, yükseklik) ya da tam çözünürlük gerekiyorsa None
+        """
+        draft_size = None
+        
+        for width, height in sizes:
+            level_size = self._get_level_size(source_size, width, height)
+            if level_size is None:
+                return None
+            if draft_size is None or level_size[0] > draft_size[0]:
+                draft_size = level_size
+        
+        return draft_size
+    
+    def open_image(self, path, sizes=None):
+        """
+        Görüntüyü açar ve mümkünse azaltılmış çözünürlükte çözülmesini ayarlar
+        
+        JPEG dosyaları için Pillow'un draft() desteği kullanılır; görüntü, en
+        büyük hedef boyutu hâlâ kaplayan en küçük 2'nin kuvveti ölçekte (1/2,
+        1/4, 1/8) çözülür. Piksel sınırını aşan görüntüler çözülmeden önce
+        reddedilir ya da (JPEG ise) sınırın altına inecek ölçekte çözülür.
+        
+        Args:
+            path: Görüntü dosyasının yolu
+            sizes: (genişlik, yükseklik) hedef boyutlarının listesi
+            
+        Returns:
+            (PIL Image nesnesi, orijinal (genişlik, yükseklik)) çifti
+            
+        Raises:
+            ValueError: Görüntü piksel sınırını aşıyor ve küçültülerek çözülemiyor
+        """
+        img = Image.open(path)
+        original_size = img.size
+        
+        plan = self.get_decode_plan(original_size, img.format, sizes)
+        if plan["action"] == "reject":
+            img.close()
+            raise ValueError(plan["reason"])
+        
+        scale = plan["scale"]
+        if scale > 1:
+            # Pillow ölçeği istenen boyuttan hesaplar; tam bölünen boyut aynı ölçeği verir
+            img.draft(img.mode, (original_size[0] // scale, original_size[1] // scale))
+        
+        return img, original_size
+    
+    def read_header(self, path):
+        """
+        Görüntünün yalnızca başlığını okur (pikseller çözülmez)
+        
+        Returns:
+            {"size": (genişlik, yükseklik), "mode", "format"} sözlüğü
+        """
+        with Image.open(path) as img:
+            return {"size": img.size, "mode": img.mode, "format": img.format}
+    
+    def _get_draft_scale(self, source_size, image_format, sizes):
+        """
+        Hedef boyutlar için JPEG draft() küçültme oranını hesaplar (1, 2, 4 ya da 8)
+        """
+        if not (self.draft_mode and sizes and image_format == "JPEG"):
+            return 1
+        
+        draft_size = self._get_draft_size(source_size, sizes)
+        if draft_size is None:
+            return 1
+        
+        # Pillow'un draft() içinde seçtiği oran
+        source_width, source_height = source_size
+        scale = min(source_width // draft_size[0], source_height // draft_size[1])
+        return max(s for s in self.DRAFT_SCALES if scale >= s)
+    
+    def get_decode_plan(self, source_size, image_format, sizes=None):
+        """
+        Görüntünün hangi ölçekte çözüleceğini ve piksel sınırına uyup uymadığını belirler
+        
+        Args:
+            source_size: Başlıktaki (genişlik, yükseklik)
+            image_format: Başlıktaki PIL formatı
+            sizes: (genişlik, yükseklik) hedef boyutlarının listesi
+            
+        Returns:
+            {"scale", "decode_size", "action", "reason"} sözlüğü. action "ok",
+            "downscale" (sınır nedeniyle küçültülerek çözülecek) ya da "reject" olur.
+        """
+        source_width, source_height = source_size
+        scale = self._get_draft_scale(source_size, image_format, sizes)
+        action, reason = "ok", None
+        
+        if self.max_megapixels:
+            limit = self.max_megapixels * 1_000_000
+            megapixels = source_width * source_height / 1_000_000
+            
+            if math.ceil(source_width / scale) * math.ceil(source_height / scale) > limit:
+                # Sınırın altına inen en küçük DCT ölçeği (yalnızca JPEG)
+                fitting = [s for s in self.DRAFT_SCALES
+                           if s > scale and math.ceil(source_width / s) * math.ceil(source_height / s) <= limit]
+                
+                if self.oversize_action == "downscale" and image_format == "JPEG" and fitting:
+                    scale, action = fitting[0], "downscale"
+                else:
+                    action = "reject"
+                    if self.oversize_action == "downscale":
+                        reason = (f"Image is {megapixels:.0f} MP, over the {self.max_megapixels:g} MP limit, "
+                                  f"and {image_format} cannot be reduced while decoding")
+                    else:
+                        reason = f"Image is {megapixels:.0f} MP, over the {self.max_megapixels:g} MP limit"
+        
+        return {
+            "scale": scale,
+            "decode_size": (math.ceil(source_width / scale), math.ceil(source_height / scale)),
+            "action": action,
+            "reason": reason
+        }
+    
+    def estimate_decode_cost(self, header, sizes):
+        """
+        Başlık bilgisinden çözme ve işleme maliyetini tahmin eder
+        
+        Bellek tahmini çözülmüş kaynağı, ilk piramit seviyesini ve her çıktı
+        için yeniden boyutlandırılmış görüntü, kırpma ve ekleme katmanını içerir.
+        
+        Args:
+            header: read_header() sonucu
+            sizes: (genişlik, yükseklik) hedef boyutlarının listesi
+            
+        Returns:
+            get_decode_plan() sonucu ile "decode_pixels", "decode_bytes" ve
+            "memory" (bayt) alanlarını içeren sözlük. Reddedilen görüntüler için
+            çözme yapılmadığından maliyetler 0 olur.
+        """
+        plan = self.get_decode_plan(header["size"], header["format"], sizes)
+        
+        if plan["action"] == "reject":
+            plan.update(decode_pixels=0, decode_bytes=0, memory=0)
+            return plan
+        
+        # Pillow çok kanallı görüntüleri piksel başına 4 bayt olarak saklar
+        pixel_bytes = 4 if Image.getmodebands(header["mode"]) > 1 else 1
+        decode_pixels = plan["decode_size"][0] * plan["decode_size"][1]
+        decode_bytes = decode_pixels * pixel_bytes
+        
+        # Piramidin ilk seviyesi en fazla kaynağın dörtte biri kadardır
+        memory = decode_bytes + decode_bytes // 4
+        for width, height in sizes:
+            memory += width * height * 4 * 3
+        
+        plan.update(decode_pixels=decode_pixels, decode_bytes=decode_bytes, memory=memory)
+        return plan
+    
+    def estimate_memory(self, path, sizes):
+        """
+        Bir görüntünün işlenmesi için gereken en yüksek belleği tahmin eder
+        
+        Yalnızca dosya başlığı okunur (bkz. estimate_decode_cost).
+        
+        Returns:
+            Bayt cinsinden tahmini bellek kullanımı
+        """
+        return self.estimate_decode_cost(self.read_header(path), sizes)["memory"]
+    
+    def resize_to_sizes(self, img, sizes, center_x=None, center_y=None):
+        """
+        Görüntüyü birden fazla hedef boyuta yeniden boyutlandırır ve kırpar
+        
+        Çoklu boyut modunda kaynak yalnızca bir kez tam çözünürlükte küçültülür;
+        diğer boyutlar bu ara görüntüden ya da birbirlerinden türetilir.
+        
+        Args:
+            img: PIL Image nesnesi
+            sizes: (genişlik, yükseklik) çiftlerinin listesi
+            center_x: Kırpma merkezi X koordinatı (0-1 aralığında)
+            center_y: Kırpma merkezi Y koordinatı (0-1 aralığında)
+            
+        Yields:
+            Her boyut için yeniden boyutlandırılmış ve kırpılmış PIL Image nesnesi, sizes sırasıyla
+        """
+        if not self.multi_size_mode or len(sizes) < 2:
+            for width, height in sizes:
+                # resize yeni bir görüntü döndürdüğünden kaynağın kopyalanması gerekmez
+                yield self.resize_image_with_custom_crop(img, width, height, center_x, center_y)
+            return
+        
+        # Piramit seviyeleri, en büyükten başlayarak
+        levels = [img]
+        
+        for width, height in sizes:
+            level_size = self._get_level_size(img.size, width, height)
+            
+            if level_size is None:
+                # Kaynak hedeften küçük ya da çok yakın - doğrudan kaynağı kullan
+                source = img
+            else:
+                # Bu boyutu kaplayan en küçük seviyeyi seç
+                level_width, level_height = level_size
+                source = min(
+                    (level for level in levels if level.width >= level_width and level.height >= level_height),
+                    key=lambda level: level.width
+                )
+                
+                # Seviye hâlâ gerekenden çok büyükse yeni bir seviye oluştur
+                if source.width >= level_width * 2:
+                    with self.profiler.stage("resize"):
+                        source = source.resize(level_size, Image.LANCZOS)
+                    levels.append(source)
+            
+            yield self.resize_image_with_custom_crop(source, width, height, center_x, center_y)
     
     def resize_image_with_custom_crop(self, img, width, height, center_x=None, center_y=None):
         """
@@ -30,18 +331,12 @@ class ImageProcessor:
         target_ratio = width / height
         original_ratio = original_width / original_height
         
-        # Debug bilgisi
-        print(f"Crop center: x={center_x}, y={center_y}")
-        print(f"Original size: {original_width}x{original_height}, ratio: {original_ratio}")
-        print(f"Target size: {width}x{height}, ratio: {target_ratio}")
-        
         if original_ratio > target_ratio:
             # Görüntü hedeften daha geniş - yükseklikle eşleştir ve genişliği kırp
             new_height = height
             new_width = int(new_height * original_ratio)
-            resized = img.resize((new_width, new_height), Image.LANCZOS)
-            
-            print(f"Image is wider, resized to: {new_width}x{new_height}")
+            with self.profiler.stage("resize"):
+                resized = img.resize((new_width, new_height), Image.LANCZOS)
             
             # Kırpma boyutlarını hesapla
             if center_x is not None:
@@ -55,13 +350,10 @@ class ImageProcessor:
                 # Kırpma alanının sınırlar içinde olduğundan emin ol
                 left = max(0, min(left, new_width - width))
                 right = left + width
-                
-                print(f"Custom crop: x={scaled_center_x}, left={left}, right={right}")
             else:
                 # Varsayılan merkezi kırpma
                 left = (new_width - width) // 2
                 right = left + width
-                print(f"Default center crop: left={left}, right={right}")
                 
             top = 0
             bottom = height
@@ -70,9 +362,8 @@ class ImageProcessor:
             # Görüntü hedeften daha uzun - genişlikle eşleştir ve yüksekliği kırp
             new_width = width
             new_height = int(new_width / original_ratio)
-            resized = img.resize((new_width, new_height), Image.LANCZOS)
-            
-            print(f"Image is taller, resized to: {new_width}x{new_height}")
+            with self.profiler.stage("resize"):
+                resized = img.resize((new_width, new_height), Image.LANCZOS)
             
             # Kırpma boyutlarını hesapla
             if center_y is not None:
@@ -86,18 +377,20 @@ class ImageProcessor:
                 # Kırpma alanının sınırlar içinde olduğundan emin ol
                 top = max(0, min(top, new_height - height))
                 bottom = top + height
-                
-                print(f"Custom crop: y={scaled_center_y}, top={top}, bottom={bottom}")
             else:
                 # Varsayılan merkezi kırpma
                 top = (new_height - height) // 2
                 bottom = top + height
-                print(f"Default center crop: top={top}, bottom={bottom}")
                 
             left = 0
             right = width
         
         # Kırpma işlemini gerçekleştir
-        cropped = resized.crop((left, top, right, bottom))
-        print(f"Final cropped size: {cropped.size}")
+        with self.profiler.stage("crop"):
+            cropped = resized.crop((left, top, right, bottom))
+        
+        # Hata ayıklama bilgisi - biçimlendirme yalnızca DEBUG seviyesi açıksa yapılır
+        logger.debug("Resized %dx%d -> %dx%d, crop box %s (center x=%s, y=%s)",
+                     original_width, original_height, new_width, new_height,
+                     (left, top, right, bottom), center_x, center_y)
         return cropped
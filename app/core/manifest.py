@@ -0,0 +1,110 @@
+# app/core/manifest.py
+import os
+import json
+import hashlib
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Hedef klasörde tutulan manifest dosyasının adı
+MANIFEST_FILENAME = ".slidemaker_manifest.json"
+MANIFEST_VERSION = 1
+
+
+def get_settings_hash(settings):
+    """
+    Render ayarlarını temsil eden kısa bir özet döndürür
+
+    Args:
+        settings: JSON'a dönüştürülebilir ayar sözlüğü
+    """
+    data = json.dumps(settings, sort_keys=True, default=str)
+    return hashlib.sha1(data.encode("utf-8")).hexdigest()
+
+
+def get_file_hash(path, chunk_size=1024 * 1024):
+    """
+    Dosya içeriğinin SHA-256 özetini parça parça okuyarak hesaplar
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class BatchManifest:
+    """
+    Artımlı toplu işlem için hedef klasörde tutulan manifest
+
+    Her kaynak dosya için kaynak imzası (boyut, mtime, isteğe bağlı içerik özeti)
+    ve her çıktı boyutu için çıktı yolu ile render ayarlarının özeti saklanır.
+    Girdileri değişmemiş çıktılar sonraki çalıştırmalarda atlanır.
+
+    Yapı:
+        {"version": 1, "files": {kaynak yolu: {"source": {...}, "outputs": {"WxH": {...}}}}}
+    """
+
+    def __init__(self, destination_folder):
+        self.path = os.path.join(destination_folder, MANIFEST_FILENAME)
+        self.files = {}
+        self.dirty = False
+
+    def load(self):
+        """Manifesti diskten yükler; yoksa ya da okunamazsa boş başlar"""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            self.files = {}
+            return
+
+        if data.get("version") != MANIFEST_VERSION:
+            self.files = {}
+            return
+
+        self.files = data.get("files", {})
+
+    def save(self):
+        """Manifesti geçici dosyaya yazıp yeniden adlandırarak kaydeder"""
+        if not self.dirty:
+            return
+
+        temp_path = self.path + ".tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump({"version": MANIFEST_VERSION, "files": self.files}, f)
+            os.replace(temp_path, self.path)
+            self.dirty = False
+        except OSError as e:
+            logger.error("Error saving manifest %s: %s", self.path, e)
+
+    def get(self, img_file):
+        """Bir kaynak dosyanın önceki kaydını döndürür (yoksa None)"""
+        return self.files.get(img_file)
+
+    def update(self, img_file, source, outputs, source_changed=True):
+        """
+        Bir kaynak dosyanın kaydını günceller
+
+        Args:
+            img_file: Kaynak klasöre göreli dosya yolu
+            source: Kaynak imzası sözlüğü (size, mtime, hash)
+            outputs: Çıktı bilgileri listesi (width, height, path, settings, new_size)
+            source_changed: Kaynak içeriği önceki kayda göre değiştiyse True
+        """
+        entry = self.files.setdefault(img_file, {"source": source, "outputs": {}})
+
+        # Kaynak değiştiyse bu çalıştırmada üretilmeyen boyutların kayıtları artık geçersiz
+        if source_changed:
+            entry["outputs"] = {}
+        entry["source"] = source
+
+        for output in outputs:
+            entry["outputs"][f"{output['width']}x{output['height']}"] = {
+                "path": output["path"],
+                "settings": output["settings"],
+                "size": output["new_size"]
+            }
+
+        self.dirty = True
@@ -0,0 +1,130 @@
+# app/core/output_writer.py
+import io
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from app.core.profiler import NULL_PROFILER
+
+# Varsayılan yazıcı iş parçacığı sayısı (işçi süreç başına)
+DEFAULT_WRITER_THREADS = 2
+
+# Varsayılan olarak aynı anda kodlanan/yazılan en fazla çıktı sayısı
+DEFAULT_MAX_PENDING = 8
+
+
+def encode_image(img, save_format, params):
+    """
+    Görüntüyü belleğe kodlar
+
+    Returns:
+        Kodlanmış dosya içeriği (bytes)
+    """
+    buffer = io.BytesIO()
+    img.save(buffer, format=save_format, **params)
+    return buffer.getvalue()
+
+
+def write_atomic(out_file, data):
+    """
+    Veriyi önce aynı klasörde geçici bir dosyaya yazar ve sonra yeniden adlandırır
+
+    Böylece yarıda kalan bir yazma işlemi çıktı dosyası olarak kalmaz.
+    """
+    temp_file = out_file + ".part"
+    try:
+        with open(temp_file, "wb") as f:
+            f.write(data)
+        os.replace(temp_file, out_file)
+    except BaseException:
+        if os.path.exists(temp_file):
+            os.remove(temp_file)
+        raise
+
+
+class OutputWriter:
+    """
+    Çıktıları arka plan iş parçacıklarında kodlayıp diske yazan boru hattı aşaması
+
+    Kodlama ve yazma bir iş parçacığı havuzunda yapılır; bu sırada çağıran
+    iş parçacığı sonraki görüntüyü çözmeye ve yeniden boyutlandırmaya devam
+    eder. Bekleyen iş sayısı sınırlıdır - sınır dolduğunda submit bir yer
+    açılana kadar bekler, böylece bellekte tutulan görüntü sayısı sınırlı kalır.
+    Çıktı klasörleri yazıcı başına yalnızca bir kez oluşturulur.
+    """
+
+    def __init__(self, worker_count=DEFAULT_WRITER_THREADS, max_pending=DEFAULT_MAX_PENDING):
+        """
+        Args:
+            worker_count: Yazıcı iş parçacığı sayısı
+            max_pending: Aynı anda kuyrukta ya da işlemde olabilecek en fazla çıktı
+        """
+        self.worker_count = max(1, worker_count)
+        self._executor = None
+        self._slots = threading.BoundedSemaphore(max(1, max_pending))
+        self._created_dirs = set()
+        self._dirs_lock = threading.Lock()
+
+        # Aşama süreleri (varsayılan olarak ölçüm yapılmaz)
+        self.profiler = NULL_PROFILER
+
+    def set_profiler(self, profiler):
+        """Kodlama ve yazma sürelerini kaydedecek StageProfiler nesnesini ayarla"""
+        self.profiler = profiler
+
+    def ensure_dir(self, folder):
+        """Klasörü daha önce oluşturulmadıysa oluştur"""
+        with self._dirs_lock:
+            if folder in self._created_dirs:
+                return
+            os.makedirs(folder, exist_ok=True)
+            self._created_dirs.add(folder)
+
+    def submit(self, img, out_file, save_format, params):
+        """
+        Görüntüyü kodlanıp yazılmak üzere kuyruğa ekle
+
+        Args:
+            img: Kaydedilecek PIL görüntüsü (kuyruktayken değiştirilmemelidir)
+            out_file: Çıktı dosyasının tam yolu
+            save_format: PIL kaydetme formatı
+            params: Kaydetme parametreleri (kalite, optimize vb.)
+
+        Returns:
+            Sonucu yazılan bayt sayısı olan Future nesnesi
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.worker_count,
+                                                thread_name_prefix="OutputWriter")
+
+        # Ölçümler gönderen iş parçacığının dosya/boyut etiketleriyle kaydedilir
+        labels = self.profiler.get_labels()
+
+        # Kuyruk doluysa bir yazma bitene kadar bekle
+        self._slots.acquire()
+        try:
+            future = self._executor.submit(self._write, img, out_file, save_format, params, labels)
+        except BaseException:
+            self._slots.release()
+            raise
+
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def _write(self, img, out_file, save_format, params, labels=(None, None)):
+        """Yazıcı iş parçacığında görüntüyü kodla ve yaz"""
+        self.profiler.set_labels(*labels)
+
+        with self.profiler.stage("encode"):
+            data = encode_image(img, save_format, params)
+
+        with self.profiler.stage("write"):
+            self.ensure_dir(os.path.dirname(out_file))
+            write_atomic(out_file, data)
+
+        return len(data)
+
+    def close(self):
+        """Bekleyen yazmaların bitmesini bekle ve iş parçacıklarını kapat"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
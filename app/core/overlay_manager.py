@@ -1,7 +1,13 @@
 # app/core/overlay_manager.py
 from PIL import Image, ImageDraw, ImageFont
+from collections import OrderedDict
 import os
 import math
+import logging
+from app.utils.font_registry import get_font_registry
+from app.core.profiler import NULL_PROFILER
+
+logger = logging.getLogger(__name__)
 
 class OverlayManager:
     """
@@ -28,9 +34,17 @@ class OverlayManager:
         self.graphic_enabled = False
         self.graphic_image = None
         
-        # Eklenmiş fontu sakla
-        self._cached_font = None
-        self._cached_font_size = None
+        # Yeniden boyutlandırılmış ve opaklığı ayarlanmış grafik önbelleği
+        # (çıktı genişliği, grafik boyutu, opaklık) anahtarıyla
+        self._scaled_graphic_cache = OrderedDict()
+        self._scaled_graphic_cache_limit = 16
+        
+        # Hazır ekleme katmanı önbelleği (boyut, referans genişlik, ayarlar) anahtarıyla
+        self._overlay_layer_cache = OrderedDict()
+        self._overlay_layer_cache_limit = 8
+        
+        # Aşama süreleri (varsayılan olarak ölçüm yapılmaz)
+        self.profiler = NULL_PROFILER
         
         # Manuel metin konumlandırma için yeni özellikler
         self.text_position_manual = False
@@ -54,6 +68,7 @@ class OverlayManager:
         self.text_color = (255, 255, 255)  # Beyaz
         self.text_outline_color = (0, 0, 0)  # Siyah  
         self.text_outline_width = 1
+        self.text_outline_mode = "stroke"  # stroke (tek geçiş), offset (kaydırılmış kopyalar)
         self.text_position = "bottom"  # bottom, top, center
         self.text_opacity = 100  # 0-100
         self.text_font = "Arial"
@@ -68,9 +83,6 @@ class OverlayManager:
     def set_text_size(self, size):
         """Metin boyutunu ayarla"""
         self.text_size = size
-        # Önbelleği temizle
-        self._cached_font = None
-        self._cached_font_size = None
     
     def set_text_color(self, color):
         """Metin rengini ayarla, RGB tuple olarak"""
@@ -84,6 +96,16 @@ class OverlayManager:
         """Metin dış çizgi kalınlığını ayarla"""
         self.text_outline_width = width
     
+    def set_text_outline_mode(self, mode):
+        """
+        Dış çizgi çizim yöntemini ayarla
+        
+        "stroke" Pillow'un yerel kontur desteğiyle tek geçişte çizer;
+        "offset" metni her kaydırma için ayrı ayrı çizer.
+        """
+        if mode in ("stroke", "offset"):
+            self.text_outline_mode = mode
+    
     def set_text_position(self, position):
         """Metin konumunu ayarla"""
         if position == "custom":
@@ -104,9 +126,6 @@ class OverlayManager:
     def set_text_font(self, font_name):
         """Metin fontunu ayarla"""
         self.text_font = font_name
-        # Önbelleği temizle
-        self._cached_font = None
-        self._cached_font_size = None
     
     def set_text_enabled(self, enabled):
         """Metin eklemeyi etkinleştir/devre dışı bırak"""
@@ -114,13 +133,16 @@ class OverlayManager:
     
     def set_graphic(self, path):
         """Eklenecek grafik dosyasını ayarla"""
+        self._scaled_graphic_cache.clear()
+        self._overlay_layer_cache.clear()
+        
         if path and os.path.exists(path):
             self.graphic_path = path
             try:
                 self.graphic_image = Image.open(path).convert("RGBA")
                 return True
             except Exception as e:
-                print(f"Error loading graphic image: {str(e)}")
+                logger.error("Error loading graphic image %s: %s", path, e)
                 self.graphic_path = None
                 self.graphic_image = None
                 return False
@@ -144,11 +166,17 @@ class OverlayManager:
     
     def set_graphic_size(self, size_percent):
         """Grafik boyutunu hedef görüntünün yüzdesi olarak ayarla"""
-        self.graphic_size = max(1, min(100, size_percent))
+        size_percent = max(1, min(100, size_percent))
+        if size_percent != self.graphic_size:
+            self.graphic_size = size_percent
+            self._scaled_graphic_cache.clear()
     
     def set_graphic_opacity(self, opacity):
         """Grafik opaklığını ayarla (0-100)"""
-        self.graphic_opacity = max(0, min(100, opacity))
+        opacity = max(0, min(100, opacity))
+        if opacity != self.graphic_opacity:
+            self.graphic_opacity = opacity
+            self._scaled_graphic_cache.clear()
     
     def set_graphic_enabled(self, enabled):
         """Grafik eklemeyi etkinleştir/devre dışı bırak"""
@@ -172,94 +200,91 @@ class OverlayManager:
         """Belirli bir şekli kaldır"""
         if 0 <= index < len(self.shapes):
             self.shapes.pop(index)
-            
+
+    def set_profiler(self, profiler):
+        """Aşama sürelerini kaydedecek StageProfiler nesnesini ayarla"""
+        self.profiler = profiler
+
+    def get_config(self):
+        """
+        Ekleme ayarlarını seçilebilir (picklable) bir sözlük olarak döndürür
+
+        Grafik görüntüsünün kendisi yerine yolu saklanır, böylece ayarlar
+        başka bir sürece aktarılabilir.
+        """
+        return {
+            'text': self.text,
+            'text_size': self.text_size,
+            'text_color': self.text_color,
+            'text_outline_color': self.text_outline_color,
+            'text_outline_width': self.text_outline_width,
+            'text_outline_mode': self.text_outline_mode,
+            'text_position': self.text_position,
+            'text_opacity': self.text_opacity,
+            'text_font': self.text_font,
+            'text_enabled': self.text_enabled,
+            'text_position_manual': self.text_position_manual,
+            'text_x_position': self.text_x_position,
+            'text_y_position': self.text_y_position,
+            'graphic_path': self.graphic_path,
+            'graphic_position': self.graphic_position,
+            'graphic_size': self.graphic_size,
+            'graphic_opacity': self.graphic_opacity,
+            'graphic_enabled': self.graphic_enabled,
+            'graphic_position_manual': self.graphic_position_manual,
+            'graphic_x_position': self.graphic_x_position,
+            'graphic_y_position': self.graphic_y_position,
+            'shapes': [dict(shape) for shape in self.shapes],
+            'shapes_enabled': self.shapes_enabled,
+            'texts': list(self.texts)
+        }
+
+    def get_config_key(self):
+        """
+        Ekleme ayarlarını temsil eden, önbellek anahtarı olarak kullanılabilecek bir dize döndürür
+        """
+        return repr(sorted(self.get_config().items()))
+
+    def apply_config(self, config):
+        """
+        get_config() ile üretilmiş ayarları uygular
+        """
+        graphic_path = config.get('graphic_path')
+
+        for key, value in config.items():
+            if key != 'graphic_path':
+                setattr(self, key, value)
+
+        self.shapes = [dict(shape) for shape in config.get('shapes', [])]
+        self._overlay_layer_cache.clear()
+
+        # Grafiği yalnızca yolu değiştiyse dosyadan yeniden yükle
+        # (ölçeklenmiş grafik önbelleği opaklık ve boyutu anahtarında taşır)
+        if 'graphic_path' in config and (graphic_path != self.graphic_path or
+                                         (graphic_path and self.graphic_image is None)):
+            self.set_graphic(graphic_path)
+
     def _get_font(self, base_size=None):
         """
         Belirtilen boyut için font nesnesi döndürür
+        
+        Font yolları paylaşılan font dizininden bulunur, font nesneleri
+        (yol, boyut) anahtarıyla önbelleğe alınır.
         """
         size = base_size if base_size is not None else self.text_size
-        
-        # Önbellekten font varsa ve boyutu aynıysa kullan
-        if self._cached_font and self._cached_font_size == size:
-            return self._cached_font
-        
-        try:
-            # Windows için sistem font dizinini bul
-            if os.name == 'nt':  # Windows
-                font_dir = os.path.join(os.environ['WINDIR'], 'Fonts')
-                font_files = {
-                    'arial': os.path.join(font_dir, 'arial.ttf'),
-                    'times new roman': os.path.join(font_dir, 'times.ttf'),
-                    'courier new': os.path.join(font_dir, 'cour.ttf'),
-                    'georgia': os.path.join(font_dir, 'georgia.ttf'),
-                    'verdana': os.path.join(font_dir, 'verdana.ttf')
-                }
-                
-                font_name = self.text_font.lower()
-                if font_name in font_files and os.path.exists(font_files[font_name]):
-                    font_path = font_files[font_name]
-                    font = ImageFont.truetype(font_path, size)
-                else:
-                    print(f"Font not found in system: {self.text_font}")
-                    # Varsayılan PIL fontunu kullan
-                    font = ImageFont.load_default()
-            else:
-                # Linux/Mac için genel font yolları
-                # Linux için yaygın font dizinleri
-                font_dirs = [
-                    '/usr/share/fonts',
-                    '/usr/local/share/fonts',
-                    os.path.expanduser('~/.fonts')
-                ]
-                
-                # Font adı ile font dosyası adı eşlemesi
-                font_name_mapping = {
-                    'arial': ['arial.ttf', 'Arial.ttf', 'DejaVuSans.ttf'],
-                    'times new roman': ['times.ttf', 'Times.ttf', 'TimesNewRoman.ttf', 'DejaVuSerif.ttf'],
-                    'courier new': ['cour.ttf', 'CourierNew.ttf', 'DejaVuSansMono.ttf'],
-                    'georgia': ['georgia.ttf', 'Georgia.ttf'],
-                    'verdana': ['verdana.ttf', 'Verdana.ttf']
-                }
-                
-                # Eşleşen font adlarını bul
-                font_name = self.text_font.lower()
-                font_path = None
-                
-                if font_name in font_name_mapping:
-                    for dir_path in font_dirs:
-                        if font_path:
-                            break
-                        for root, dirs, files in os.walk(dir_path):
-                            if font_path:
-                                break
-                            for possible_name in font_name_mapping[font_name]:
-                                if possible_name in files:
-                                    font_path = os.path.join(root, possible_name)
-                                    break
-                
-                if font_path and os.path.exists(font_path):
-                    font = ImageFont.truetype(font_path, size)
-                else:
-                    print(f"Font not found in system: {self.text_font}")
-                    # Varsayılan PIL fontunu kullan
-                    font = ImageFont.load_default()
-            
-            # Önbelleğe al
-            self._cached_font = font
-            self._cached_font_size = size
-            
-            return font
-        except Exception as e:
-            print(f"Error loading font: {str(e)}, using default")
-            # Varsayılan font (PIL'in dahili fontu)
-            return ImageFont.load_default()
+        return get_font_registry().get_font(self.text_font, size)
     
-    def apply_overlay(self, img):
+    def apply_overlay(self, img, reference_width=None, in_place=False):
         """
         Görüntüye ayarlanan metin, grafik ve şekil eklemelerini uygular
         
         Args:
             img: PIL Image nesnesi
+            reference_width: Görüntünün temsil ettiği tam boyutlu çıktının genişliği.
+                Verilirse (örn. önizleme çözünürlüğünde) font boyutu, kenar boşlukları
+                ve çizgi kalınlıkları tam boyutlu çıktıyla aynı görünecek şekilde ölçeklenir.
+            in_place: True ise RGB görüntüler kopyalanmadan doğrudan değiştirilir
+                (görüntü çağırana aitse ve başka yerde kullanılmıyorsa)
             
         Returns:
             Eklemeler uygulanmış PIL Image nesnesi
@@ -267,30 +292,116 @@ class OverlayManager:
         if not self.text_enabled and not self.graphic_enabled and not self.shapes_enabled:
             return img
         
-        # RGBA moduna dönüştür (şeffaflık için gerekli)
-        result = img.convert("RGBA")
+        if reference_width is None:
+            reference_width = img.width
+        
+        # Tüm eklemeleri içeren hazır katman (aynı boyut ve ayarlar için yeniden kullanılır)
+        overlay_layer = self._get_overlay_layer(img.size, reference_width)
+        
+        with self.profiler.stage("overlay.composite"):
+            if img.mode == "RGB":
+                # Opak kaynakta katmanı kendi alfa kanalıyla yapıştırmak alpha_composite ile
+                # aynı sonucu verir; ara RGBA kopyaları oluşturulmaz
+                result = img if in_place else img.copy()
+                result.paste(overlay_layer, (0, 0), overlay_layer)
+                return result
+            
+            # RGBA moduna dönüştür (şeffaflık için gerekli) ve tek seferde birleştir
+            result = Image.alpha_composite(img.convert("RGBA"), overlay_layer)
+            
+            # RGB moduna geri dönüştür (çıktı için)
+            if result.mode == "RGBA":
+                background = Image.new("RGB", result.size, (255, 255, 255))
+                background.paste(result, mask=result.split()[3])  # Alpha kanalını maske olarak kullan
+                return background
+            else:
+                return result
+
+    def _get_overlay_layer(self, size, reference_width):
+        """
+        Şekil, grafik ve metin eklemelerini içeren şeffaf RGBA katmanını döndürür
+        
+        Katman yalnızca çıktı boyutuna ve ekleme ayarlarına bağlı olduğundan
+        (boyut, referans genişlik, ayarlar) anahtarıyla önbelleğe alınır; toplu
+        işlemde her görüntüye tek bir birleştirme işlemi uygulanır.
+        """
+        key = (size, reference_width, self.get_config_key())
+        
+        overlay_layer = self._overlay_layer_cache.get(key)
+        if overlay_layer is not None:
+            self._overlay_layer_cache.move_to_end(key)
+            return overlay_layer
+        
+        # Tam boyutlu çıktıya göre ölçek
+        scale = size[0] / reference_width
+        
+        overlay_layer = Image.new("RGBA", size, (0, 0, 0, 0))
         
         # Şekil eklemelerini uygula
         if self.shapes_enabled and self.shapes:
-            result = self._apply_shapes(result)
+            with self.profiler.stage("overlay.shapes"):
+                overlay_layer = self._apply_shapes(overlay_layer, scale)
         
         # Grafik ekleme uygula
         if self.graphic_enabled and self.graphic_image:
-            result = self._apply_graphic(result)
+            with self.profiler.stage("overlay.graphic"):
+                overlay_layer = self._apply_graphic(overlay_layer, scale)
         
         # Metin ekleme uygula
         if self.text_enabled and self.text.strip():
-            result = self._apply_text(result)
+            with self.profiler.stage("overlay.text"):
+                overlay_layer = self._apply_text(overlay_layer, scale)
         
-        # RGB moduna geri dönüştür (çıktı için)
-        if result.mode == "RGBA":
-            background = Image.new("RGB", result.size, (255, 255, 255))
-            background.paste(result, mask=result.split()[3])  # Alpha kanalını maske olarak kullan
-            return background
-        else:
-            return result
+        self._overlay_layer_cache[key] = overlay_layer
+        if len(self._overlay_layer_cache) > self._overlay_layer_cache_limit:
+            self._overlay_layer_cache.popitem(last=False)
+        
+        return overlay_layer
+
+    def get_drag_sprite(self, element, size, reference_width=None):
+        """
+        Sürükleme sırasında tuvalde taşınacak tek bir eklemenin görüntüsünü döndürür
+        
+        Args:
+            element: "text" ya da "graphic"
+            size: (genişlik, yükseklik) önizleme çözünürlüğü
+            reference_width: Tam boyutlu çıktının genişliği (bkz. apply_overlay)
+            
+        Returns:
+            (RGBA görüntü, (dx, dy)) - dx, dy görüntünün sol üst köşesinin eklemenin
+            merkez noktasına göre konumudur. Ekleme yoksa (None, None) döner.
+        """
+        if reference_width is None:
+            reference_width = size[0]
+        scale = size[0] / reference_width
+        
+        if element == "graphic":
+            if not self.graphic_image:
+                return None, None
+            sprite = self._get_scaled_graphic(size[0])
+            return sprite, (-(sprite.width // 2), -(sprite.height // 2))
+        
+        if element == "text":
+            if not self.text.strip():
+                return None, None
+            
+            # Metni önizleme boyutunda, merkeze yerleştirilmiş olarak çiz ve kırp
+            center = (size[0] // 2, size[1] // 2)
+            layer = self._apply_text(Image.new("RGBA", size, (0, 0, 0, 0)), scale, center)
+            bbox = layer.getbbox()
+            if bbox is None:
+                return None, None
+            return layer.crop(bbox), (bbox[0] - center[0], bbox[1] - center[1])
+        
+        return None, None
+    
+    def _scale_line_width(self, line_width, scale):
+        """Çizgi kalınlığını ölçekler, görünür kalması için en az 1 piksel"""
+        if line_width <= 0:
+            return 0
+        return max(1, int(round(line_width * scale)))
 
-    def _apply_shapes(self, img):
+    def _apply_shapes(self, img, scale=1.0):
         """
         Görüntüye şekiller ekler
         """
@@ -307,7 +418,7 @@ class OverlayManager:
             # Renk ve opaklık
             fill_color = shape.get('fill_color', None)
             outline_color = shape.get('outline_color', None)
-            outline_width = shape.get('outline_width', 1)
+            outline_width = self._scale_line_width(shape.get('outline_width', 1), scale)
             
             # Koordinatları görüntü boyutuna göre ölçeklendir
             if shape_type == 'rectangle':
@@ -388,17 +499,25 @@ class OverlayManager:
         result = Image.alpha_composite(img, shape_layer)
         return result
     
-    def _apply_text(self, img):
+    def _apply_text(self, img, scale=1.0, center=None):
         """
         Görüntüye metin ekler
+        
+        Args:
+            center: (x, y) piksel cinsinden metin merkezi (None ise konum ayarı kullanılır)
         """
         width, height = img.size
         
-        # Metin boyutunu görüntü boyutuna göre ölçeklendir
-        scaled_size = int(self.text_size * width / 1000)
+        # Metin boyutunu tam boyutlu çıktının genişliğine göre ölçeklendir
+        scaled_size = int(self.text_size * (width / scale) / 1000)
         if scaled_size < 10:
             scaled_size = 10  # Minimum boyut
         
+        # Önizleme çözünürlüğüne indir
+        scaled_size = max(1, int(round(scaled_size * scale)))
+        margin = int(round(20 * scale))
+        outline_width = self._scale_line_width(self.text_outline_width, scale)
+        
         font = self._get_font(scaled_size)
         
         # Metin için yeni bir şeffaf katman oluştur
@@ -421,16 +540,19 @@ class OverlayManager:
                 text_height = scaled_size + 4
         
         # Metin konumu
-        if self.text_position_manual:
+        if center is not None:
+            text_x = center[0] - (text_width // 2)
+            text_y = center[1] - (text_height // 2)
+        elif self.text_position_manual:
             # Özel konum kullan
             text_x = int(self.text_x_position * width) - (text_width // 2)
             text_y = int(self.text_y_position * height) - (text_height // 2)
         elif self.text_position == "bottom":
             text_x = (width - text_width) // 2
-            text_y = height - text_height - 20  # alttan 20px boşluk
+            text_y = height - text_height - margin  # alttan 20px boşluk
         elif self.text_position == "top":
             text_x = (width - text_width) // 2
-            text_y = 20  # üstten 20px boşluk
+            text_y = margin  # üstten 20px boşluk
         else:  # center
             text_x = (width - text_width) // 2
             text_y = (height - text_height) // 2    
@@ -445,23 +567,30 @@ class OverlayManager:
             # Zaten 4 eleman varsa (RGBA), sadece alpha değerini güncelle
             text_color = self.text_color[:3] + (alpha,)
         
-        # Dış çizgi varsa önce onu çiz
-        if self.text_outline_width > 0:
-            # Eğer RGB tuple'ı 3 elemanlıysa alpha ekle, aksi takdirde mevcut alpha'yı güncelle
-            if len(self.text_outline_color) == 3:
-                outline_color = self.text_outline_color + (alpha,)
-            else:
-                # Zaten 4 eleman varsa (RGBA), sadece alpha değerini güncelle
-                outline_color = self.text_outline_color[:3] + (alpha,)
-            
+        # Eğer RGB tuple'ı 3 elemanlıysa alpha ekle, aksi takdirde mevcut alpha'yı güncelle
+        if len(self.text_outline_color) == 3:
+            outline_color = self.text_outline_color + (alpha,)
+        else:
+            # Zaten 4 eleman varsa (RGBA), sadece alpha değerini güncelle
+            outline_color = self.text_outline_color[:3] + (alpha,)
+        
+        # Yerel kontur desteği yalnızca TrueType fontlarda vardır
+        use_stroke = (outline_width > 0 and self.text_outline_mode == "stroke" and
+                      isinstance(font, ImageFont.FreeTypeFont))
+        
+        if use_stroke:
+            # Dış çizgi ve metni çizgi kalınlığından bağımsız olarak tek geçişte çiz
+            draw.text((text_x, text_y), self.text, font=font, fill=text_color,
+                      stroke_width=outline_width, stroke_fill=outline_color)
+        elif outline_width > 0:
             # Çizgi kalınlığı için metni konumun etrafına çiz
-            for offset_x in range(-self.text_outline_width, self.text_outline_width + 1):
-                for offset_y in range(-self.text_outline_width, self.text_outline_width + 1):
+            for offset_x in range(-outline_width, outline_width + 1):
+                for offset_y in range(-outline_width, outline_width + 1):
                     if offset_x == 0 and offset_y == 0:
                         continue  # Ana metni atla, bunu en son çizeceğiz
                     
                     # Çizgi kalınlığı 1 ise sadece ana yönleri çiz
-                    if self.text_outline_width == 1:
+                    if outline_width == 1:
                         if abs(offset_x) + abs(offset_y) != 1:
                             continue
                     
@@ -469,13 +598,14 @@ class OverlayManager:
                            font=font, fill=outline_color)
         
         # Ana metni çiz
-        draw.text((text_x, text_y), self.text, font=font, fill=text_color)
+        if not use_stroke:
+            draw.text((text_x, text_y), self.text, font=font, fill=text_color)
         
         # Birleştirme işlemi
         result = Image.alpha_composite(img, txt_layer)
         return result
     
-    def _apply_graphic(self, img):
+    def _apply_graphic(self, img, scale=1.0):
         """
         Görüntüye grafik ekler
         """
@@ -483,22 +613,11 @@ class OverlayManager:
             return img
         
         width, height = img.size
+        margin = int(round(20 * scale))
         
-        # Grafik boyutunu hesapla (hedef görüntünün yüzdesi)
-        target_width = int(width * self.graphic_size / 100)
-        
-        # Orijinal en-boy oranını koru
-        graphic_width, graphic_height = self.graphic_image.size
-        aspect_ratio = graphic_width / graphic_height
-        target_height = int(target_width / aspect_ratio)
-        
-        # Grafiği yeniden boyutlandır
-        resized_graphic = self.graphic_image.resize((target_width, target_height), Image.LANCZOS)
-        
-        # Opaklığı ayarla
-        if self.graphic_opacity < 100:
-            alpha_factor = self.graphic_opacity / 100
-            resized_graphic = self._adjust_opacity(resized_graphic, alpha_factor)
+        # Grafiği yeniden boyutlandır ve opaklığı ayarla (önbellekten)
+        resized_graphic = self._get_scaled_graphic(width)
+        target_width, target_height = resized_graphic.size
         
         # Grafik konumu
         if self.graphic_position_manual:
@@ -506,27 +625,66 @@ class OverlayManager:
             graphic_x = int(self.graphic_x_position * width) - (target_width // 2)
             graphic_y = int(self.graphic_y_position * height) - (target_height // 2)
         elif self.graphic_position == "bottom-right":
-            graphic_x = width - target_width - 20
-            graphic_y = height - target_height - 20
+            graphic_x = width - target_width - margin
+            graphic_y = height - target_height - margin
         elif self.graphic_position == "bottom-left":
-            graphic_x = 20
-            graphic_y = height - target_height - 20
+            graphic_x = margin
+            graphic_y = height - target_height - margin
         elif self.graphic_position == "top-right":
-            graphic_x = width - target_width - 20
-            graphic_y = 20
+            graphic_x = width - target_width - margin
+            graphic_y = margin
         elif self.graphic_position == "top-left":
-            graphic_x = 20
-            graphic_y = 20
+            graphic_x = margin
+            graphic_y = margin
         else:  # center
             graphic_x = (width - target_width) // 2
             graphic_y = (height - target_height) // 2
         
-        # Şeffaf bir katman oluştur ve grafiği yapıştır
-        result = img.copy()
-        result.paste(resized_graphic, (graphic_x, graphic_y), resized_graphic)
+        # Şeffaf bir katman oluştur, grafiği yapıştır ve birleştir
+        graphic_layer = Image.new("RGBA", img.size, (0, 0, 0, 0))
+        graphic_layer.paste(resized_graphic, (graphic_x, graphic_y))
         
+        result = Image.alpha_composite(img, graphic_layer)
         return result
     
+    def _get_scaled_graphic(self, width):
+        """
+        Belirli bir çıktı genişliği için yeniden boyutlandırılmış ve opaklığı ayarlanmış grafiği döndürür
+        
+        Grafik boyutu yalnızca çıktı genişliğine bağlı olduğundan sonuç (çıktı
+        genişliği, grafik boyutu, opaklık) anahtarıyla önbelleğe alınır; toplu
+        işlemde grafik her çıktı boyutu için yalnızca bir kez işlenir. Önbellek
+        set_graphic, set_graphic_size ve set_graphic_opacity ile temizlenir.
+        """
+        key = (width, self.graphic_size, self.graphic_opacity)
+        
+        resized_graphic = self._scaled_graphic_cache.get(key)
+        if resized_graphic is not None:
+            self._scaled_graphic_cache.move_to_end(key)
+            return resized_graphic
+        
+        # Grafik boyutunu hesapla (hedef görüntünün yüzdesi)
+        target_width = max(1, int(width * self.graphic_size / 100))
+        
+        # Orijinal en-boy oranını koru
+        graphic_width, graphic_height = self.graphic_image.size
+        aspect_ratio = graphic_width / graphic_height
+        target_height = max(1, int(target_width / aspect_ratio))
+        
+        # Grafiği yeniden boyutlandır
+        resized_graphic = self.graphic_image.resize((target_width, target_height), Image.LANCZOS)
+        
+        # Opaklığı ayarla
+        if self.graphic_opacity < 100:
+            alpha_factor = self.graphic_opacity / 100
+            resized_graphic = self._adjust_opacity(resized_graphic, alpha_factor)
+        
+        self._scaled_graphic_cache[key] = resized_graphic
+        if len(self._scaled_graphic_cache) > self._scaled_graphic_cache_limit:
+            self._scaled_graphic_cache.popitem(last=False)
+        
+        return resized_graphic
+    
     def _adjust_opacity(self, img, alpha_factor):
         """
         Görüntü opaklığını ayarlar
@@ -534,14 +692,7 @@ class OverlayManager:
         if img.mode != 'RGBA':
             img = img.convert('RGBA')
         
-        data = list(img.getdata())
-        new_data = []
-        
-        for pixel in data:
-            # Alfa kanalını (4. değer) ayarla
-            r, g, b, a = pixel
-            a = int(a * alpha_factor)
-            new_data.append((r, g, b, a))
-        
-        img.putdata(new_data)
+        # Alfa kanalını tek bir arama tablosuyla (C tarafında) ölçekle
+        alpha = img.getchannel('A').point(lambda a: int(a * alpha_factor))
+        img.putalpha(alpha)
         return img
\ No newline at end of file
@@ -0,0 +1,123 @@
+# app/core/preflight.py
+import os
+from PIL import Image
+
+
+def preflight_file(image_processor, img_path, sizes):
+    """
+    Tek bir dosyanın başlığını okur ve çözme maliyetini tahmin eder
+
+    Args:
+        image_processor: Piksel sınırı ve çözme ayarlarını sağlayan ImageProcessor
+        img_path: Görüntü dosyasının tam yolu
+        sizes: (genişlik, yükseklik) hedef boyutlarının listesi
+
+    Returns:
+        Başlık bilgisi (width, height, mode, format, megapixels), çözme planı
+        (scale, decode_size, action, reason) ve maliyet tahmini (decode_pixels,
+        decode_bytes, memory) içeren sözlük. Başlığı okunamayan dosyalar için
+        action "error" olur.
+    """
+    entry = {"width": None, "height": None, "mode": None, "format": None, "megapixels": None,
+             "scale": None, "decode_size": None, "decode_pixels": 0, "decode_bytes": 0,
+             "memory": 0, "action": "error", "reason": None}
+
+    try:
+        header = image_processor.read_header(img_path)
+    except Image.DecompressionBombError as e:
+        # Pillow'un kendi sınırını aşan dosyalar başlıkları okunurken reddedilir
+        entry.update(action="reject", reason=str(e))
+        return entry
+    except Exception as e:
+        entry["reason"] = str(e)
+        return entry
+
+    width, height = header["size"]
+    entry.update(width=width, height=height, mode=header["mode"], format=header["format"],
+                 megapixels=width * height / 1_000_000)
+    entry.update(image_processor.estimate_decode_cost(header, sizes))
+    return entry
+
+
+class PreflightReport:
+    """
+    Toplu işlem öncesinde tüm aday dosyaların başlık bilgilerini ve tahmini
+    çözme maliyetlerini toplayan sınıf
+
+    Yalnızca dosya başlıkları okunur; hiçbir görüntü çözülmez.
+    """
+
+    def __init__(self):
+        self.entries = []
+
+    def add(self, img_file, entry):
+        """Bir dosyanın preflight_file sonucunu ekle"""
+        entry = dict(entry, file=img_file)
+        self.entries.append(entry)
+        return entry
+
+    def run(self, image_processor, source_folder, files, sizes):
+        """
+        Dosyaların başlıklarını sırayla oku ve rapora ekle
+
+        Args:
+            image_processor: Piksel sınırı ve çözme ayarlarını sağlayan ImageProcessor
+            source_folder: Kaynak klasör
+            files: Kaynak klasöre göreli dosya adları
+            sizes: (genişlik, yükseklik) hedef boyutlarının listesi
+
+        Returns:
+            Bu rapor nesnesi
+        """
+        for img_file in files:
+            img_path = os.path.join(source_folder, img_file)
+            self.add(img_file, preflight_file(image_processor, img_path, sizes))
+        return self
+
+    def get_counts(self):
+        """İşlem türüne göre dosya sayılarını döndürür ({"ok", "downscale", "reject", "error"})"""
+        counts = {"ok": 0, "downscale": 0, "reject": 0, "error": 0}
+        for entry in self.entries:
+            counts[entry["action"]] += 1
+        return counts
+
+    def get_problems(self):
+        """Reddedilen ya da başlığı okunamayan dosyaların kayıtlarını döndürür"""
+        return [entry for entry in self.entries if entry["action"] in ("reject", "error")]
+
+    def get_over_limit(self, max_megapixels):
+        """Başlığa göre verilen megapiksel sınırını aşan dosyaların kayıtlarını döndürür"""
+        return [entry for entry in self.entries
+                if entry["megapixels"] is not None and entry["megapixels"] > max_megapixels]
+
+    def format_summary(self):
+        """Raporu okunabilir bir tablo olarak döndürür (bellek MB cinsinden)"""
+        lines = [f"{'File':<40}{'Size':>13}{'MP':>8}{'Format':>8}{'Decode':>13}{'Mem MB':>9}  Action"]
+
+        for entry in self.entries:
+            size = f"{entry['width']}x{entry['height']}" if entry["width"] else "-"
+            megapixels = f"{entry['megapixels']:.1f}" if entry["megapixels"] is not None else "-"
+            decode = "-"
+            if entry["decode_pixels"]:
+                decode = f"{entry['decode_size'][0]}x{entry['decode_size'][1]}"
+            action = entry["action"]
+            if entry["reason"]:
+                action = f"{action}: {entry['reason']}"
+
+            lines.append(
+                f"{entry['file']:<40}{size:>13}{megapixels:>8}{entry['format'] or '-':>8}"
+                f"{decode:>13}{entry['memory'] / (1024 * 1024):>9.1f}  {action}"
+            )
+
+        counts = self.get_counts()
+        total_memory = sum(entry["memory"] for entry in self.entries)
+        largest = max((entry["memory"] for entry in self.entries), default=0)
+        lines.append(
+            f"{len(self.entries)} file(s): {counts['ok']} ok, {counts['downscale']} downscaled, "
+            f"{counts['reject']} rejected, {counts['error']} unreadable; "
+            f"largest working set {largest / (1024 * 1024):.1f} MB, "
+            f"total decode {sum(entry['decode_bytes'] for entry in self.entries) / (1024 * 1024):.1f} MB, "
+            f"total working sets {total_memory / (1024 * 1024):.1f} MB"
+        )
+
+        return "\n".join(lines)
@@ -0,0 +1,111 @@
+# app/core/preview_cache.py
+from collections import OrderedDict
+
+# Pillow'un piksel başına ayırdığı bayt sayısı. Çok kanallı modlar (RGB dahil)
+# 32 bitlik piksellerde saklanır; listede olmayan modlar için 4 bayt varsayılır.
+PIXEL_BYTES = {
+    "1": 1,
+    "L": 1,
+    "P": 1,
+    "I;16": 2,
+    "I;16L": 2,
+    "I;16B": 2,
+    "I;16N": 2
+}
+
+
+def get_image_memory_size(img):
+    """
+    PIL görüntüsünün bellekte kapladığı yaklaşık bayt sayısını döndürür
+    """
+    if img is None:
+        return 0
+    return img.width * img.height * PIXEL_BYTES.get(img.mode, 4)
+
+
+class PreviewCache:
+    """
+    Önizleme işlem hattı için katmanlı, LRU tabanlı ve bellek bütçeli önbellek
+
+    Katmanlar:
+        source: Çözülmüş kaynak görüntü - (yol, mtime) anahtarıyla
+        base: Yeniden boyutlandırılmış ve kırpılmış görüntü - (kaynak, boyut, kırpma merkezi) anahtarıyla
+        composite: Eklemeler uygulanmış görüntü - (base, ekleme ayarları) anahtarıyla
+
+    Tüm katmanlar tek bir bellek bütçesini paylaşır; bütçe aşıldığında en uzun
+    süredir kullanılmayan girdi çıkarılır.
+    """
+
+    LAYERS = ("source", "base", "composite")
+
+    def __init__(self, memory_budget=256 * 1024 * 1024):
+        """
+        Args:
+            memory_budget: Önbelleğin kullanabileceği en fazla bayt sayısı
+        """
+        self.memory_budget = memory_budget
+        self.memory_used = 0
+        self._entries = OrderedDict()
+
+    def set_memory_budget(self, memory_budget):
+        """Bellek bütçesini ayarla ve gerekirse girdileri çıkar"""
+        self.memory_budget = memory_budget
+        self._evict()
+
+    def get(self, layer, key):
+        """
+        Önbellekteki değeri döndürür ve girdiyi en son kullanılan olarak işaretler
+
+        Returns:
+            Önbellekteki değer ya da yoksa None
+        """
+        entry = self._entries.get((layer, key))
+        if entry is None:
+            return None
+
+        self._entries.move_to_end((layer, key))
+        return entry[0]
+
+    def put(self, layer, key, value, img=None):
+        """
+        Değeri önbelleğe ekler
+
+        Args:
+            layer: Katman adı (LAYERS içinden)
+            key: Katman içindeki anahtar
+            value: Saklanacak değer
+            img: Bellek hesabı için kullanılacak görüntü (None ise value kullanılır)
+        """
+        size = get_image_memory_size(img if img is not None else value)
+
+        # Bütçeden büyük girdileri saklama
+        if size > self.memory_budget:
+            return
+
+        self._remove((layer, key))
+        self._entries[(layer, key)] = (value, size)
+        self.memory_used += size
+        self._evict()
+
+    def invalidate(self, layer=None):
+        """
+        Bir katmanı ya da tüm önbelleği temizler
+
+        Args:
+            layer: Temizlenecek katman adı (None ise tüm katmanlar)
+        """
+        for entry_key in list(self._entries):
+            if layer is None or entry_key[0] == layer:
+                self._remove(entry_key)
+
+    def _remove(self, entry_key):
+        """Tek bir girdiyi çıkar"""
+        entry = self._entries.pop(entry_key, None)
+        if entry is not None:
+            self.memory_used -= entry[1]
+
+    def _evict(self):
+        """Bellek bütçesi aşıldığı sürece en eski girdileri çıkar"""
+        while self.memory_used > self.memory_budget and self._entries:
+            entry_key = next(iter(self._entries))
+            self._remove(entry_key)
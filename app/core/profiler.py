@@ -0,0 +1,251 @@
+# app/core/profiler.py
+import json
+import math
+import sys
+import threading
+import time
+
+try:
+    import resource
+except ImportError:  # Windows - en yüksek bellek kullanımı ölçülemez
+    resource = None
+
+
+def get_peak_rss():
+    """
+    Geçerli sürecin en yüksek bellek kullanımını (peak RSS) döndürür
+
+    Returns:
+        Bayt cinsinden en yüksek bellek kullanımı ya da ölçülemiyorsa None
+    """
+    if resource is None:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # ru_maxrss Linux'ta KB, macOS'ta bayt cinsindendir
+    if sys.platform == "darwin":
+        return peak
+    return peak * 1024
+
+
+def _percentile(sorted_values, percent):
+    """Sıralı listeden en yakın sıra yöntemiyle yüzdelik değeri döndürür"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(percent / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class _NullStage:
+    """Profil kapalıyken kullanılan, hiçbir şey ölçmeyen aşama"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+_NULL_STAGE = _NullStage()
+
+
+class _Stage:
+    """Bir aşamanın duvar saati ve CPU süresini ölçen bağlam yöneticisi"""
+
+    __slots__ = ("profiler", "name", "labels", "wall_start", "cpu_start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        # Etiketler aşama başladığında alınır (aşama içinde değişebilir)
+        self.labels = self.profiler.get_labels()
+        self.wall_start = time.perf_counter()
+        self.cpu_start = time.thread_time()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.profiler.record(
+            self.name,
+            time.perf_counter() - self.wall_start,
+            time.thread_time() - self.cpu_start,
+            self.labels
+        )
+        return False
+
+
+class StageProfiler:
+    """
+    İşleme aşamalarının (çözme, yeniden boyutlandırma, kırpma, eklemeler,
+    kodlama, yazma) sürelerini kaydeden sınıf
+
+    Her kayıt aşama adı, dosya, çıktı boyutu, duvar saati süresi ve iş
+    parçacığı CPU süresini içerir. Dosya ve boyut etiketleri iş parçacığına
+    özeldir; böylece yazıcı iş parçacıklarındaki aşamalar da doğru çıktıya
+    atanır. Profil kapalıyken stage() ölçüm yapmayan paylaşılan bir nesne
+    döndürür.
+    """
+
+    def __init__(self, enabled=True):
+        """
+        Args:
+            enabled: False ise hiçbir ölçüm kaydedilmez
+        """
+        self.enabled = enabled
+        self._records = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def set_labels(self, file=None, size=None):
+        """Bu iş parçacığında kaydedilecek aşamaların dosya ve boyut etiketlerini ayarla"""
+        self._local.labels = (file, size)
+
+    def get_labels(self):
+        """Bu iş parçacığının (dosya, boyut) etiketlerini döndürür"""
+        return getattr(self._local, "labels", (None, None))
+
+    def stage(self, name):
+        """
+        Bir aşamayı ölçen bağlam yöneticisi döndürür
+
+        Örnek:
+            with profiler.stage("resize"):
+                img = img.resize(...)
+        """
+        if not self.enabled:
+            return _NULL_STAGE
+        return _Stage(self, name)
+
+    def record(self, name, wall, cpu, labels=None):
+        """
+        Ölçülmüş bir aşamayı kaydet
+
+        Args:
+            name: Aşama adı
+            wall: Duvar saati süresi (saniye)
+            cpu: İş parçacığı CPU süresi (saniye)
+            labels: (dosya, boyut) etiketleri (None ise iş parçacığının etiketleri)
+        """
+        file, size = labels if labels is not None else self.get_labels()
+        with self._lock:
+            self._records.append({
+                "stage": name,
+                "file": file,
+                "size": size,
+                "wall": wall,
+                "cpu": cpu
+            })
+
+    def drain(self):
+        """Kaydedilen ölçümleri döndür ve listeyi boşalt"""
+        with self._lock:
+            records = self._records
+            self._records = []
+        return records
+
+
+# Profil kapalıyken varsayılan olarak kullanılan profil nesnesi
+NULL_PROFILER = StageProfiler(enabled=False)
+
+
+class ProfileReport:
+    """
+    Bir toplu işlemin aşama ölçümlerini toplayan ve özetleyen sınıf
+
+    Özet her aşama için duvar saati ve CPU süresinin p50/p95/max değerlerini
+    içerir; isteğe bağlı olarak tüm ölçümler JSON iz dosyasına yazılır.
+    """
+
+    def __init__(self):
+        self.records = []
+        self.peak_rss = None
+        self.start_time = time.time()
+        self.end_time = None
+
+    def add_result(self, result):
+        """BatchContext.process_file sonucundaki ölçümleri ekle"""
+        self.records.extend(result.get("timings") or [])
+        self.add_peak_rss(result.get("peak_rss"))
+
+    def add_peak_rss(self, peak_rss):
+        """Bir sürecin en yüksek bellek kullanımını ekle (süreçlerin en yükseği saklanır)"""
+        if peak_rss is not None and (self.peak_rss is None or peak_rss > self.peak_rss):
+            self.peak_rss = peak_rss
+
+    def finish(self):
+        """Çalıştırmayı bitmiş olarak işaretle ve ana sürecin bellek kullanımını ekle"""
+        self.end_time = time.time()
+        self.add_peak_rss(get_peak_rss())
+
+    def get_summary(self):
+        """
+        Aşama başına özet istatistikleri döndürür
+
+        Returns:
+            {aşama: {"count", "wall_total", "wall_p50", "wall_p95", "wall_max",
+            "cpu_total", "cpu_p50", "cpu_p95", "cpu_max"}} sözlüğü (saniye),
+            aşamalar ilk görülme sırasıyla
+        """
+        stages = {}
+        for record in self.records:
+            values = stages.setdefault(record["stage"], ([], []))
+            values[0].append(record["wall"])
+            values[1].append(record["cpu"])
+
+        summary = {}
+        for name, (walls, cpus) in stages.items():
+            walls.sort()
+            cpus.sort()
+            summary[name] = {
+                "count": len(walls),
+                "wall_total": sum(walls),
+                "wall_p50": _percentile(walls, 50),
+                "wall_p95": _percentile(walls, 95),
+                "wall_max": walls[-1],
+                "cpu_total": sum(cpus),
+                "cpu_p50": _percentile(cpus, 50),
+                "cpu_p95": _percentile(cpus, 95),
+                "cpu_max": cpus[-1]
+            }
+
+        return summary
+
+    def format_summary(self):
+        """Özeti okunabilir bir tablo olarak döndürür (süreler milisaniye)"""
+        lines = [
+            f"{'Stage':<18}{'Count':>7}{'Total s':>10}"
+            f"{'p50 ms':>10}{'p95 ms':>10}{'Max ms':>10}{'CPU p50':>10}{'CPU p95':>10}"
+        ]
+
+        for name, stats in self.get_summary().items():
+            lines.append(
+                f"{name:<18}{stats['count']:>7}{stats['wall_total']:>10.2f}"
+                f"{stats['wall_p50'] * 1000:>10.1f}{stats['wall_p95'] * 1000:>10.1f}"
+                f"{stats['wall_max'] * 1000:>10.1f}{stats['cpu_p50'] * 1000:>10.1f}"
+                f"{stats['cpu_p95'] * 1000:>10.1f}"
+            )
+
+        if self.peak_rss is not None:
+            lines.append(f"Peak RSS: {self.peak_rss / (1024 * 1024):.1f} MB")
+
+        return "\n".join(lines)
+
+    def write_trace(self, path):
+        """
+        Özeti ve tüm aşama ölçümlerini JSON iz dosyasına yaz
+
+        Args:
+            path: İz dosyasının yolu
+        """
+        trace = {
+            "start_time": self.start_time,
+            "end_time": self.end_time,
+            "peak_rss": self.peak_rss,
+            "summary": self.get_summary(),
+            "events": self.records
+        }
+
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(trace, f, indent=2)
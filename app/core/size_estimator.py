@@ -0,0 +1,125 @@
+# app/core/size_estimator.py
+import io
+import math
+from collections import OrderedDict
+
+# Enterpolasyon için kodlanan referans kalite değerleri
+ANCHOR_QUALITIES = (1, 5, 10, 20, 30, 40, 50, 60, 70, 75, 80, 85, 90, 95, 100)
+
+# Kaliteden bağımsız formatlar (kalite ayarı çıktı boyutunu etkilemez)
+LOSSLESS_FORMATS = ("PNG",)
+
+
+def encode_size(img, save_format, quality):
+    """
+    Görüntüyü belleğe kodlar ve bayt cinsinden boyutunu döndürür
+
+    Çıktı kaydıyla aynı seçenekler (optimize=True) kullanılır.
+    """
+    buffer = io.BytesIO()
+
+    if save_format in LOSSLESS_FORMATS:
+        img.save(buffer, format=save_format, optimize=True)
+    else:
+        img.save(buffer, format=save_format, quality=quality, optimize=True)
+
+    return buffer.tell()
+
+
+class FileSizeEstimator:
+    """
+    Kalite kaydırıcısı için hızlı dosya boyutu tahmini yapan sınıf
+
+    Her (görüntü, format) için yalnızca istenen kaliteyi çevreleyen referans
+    kaliteler bir kez kodlanır ve önbelleğe alınır. Diğer kaliteler için boyut,
+    referans noktaları arasında logaritmik ölçekte doğrusal enterpolasyonla
+    tahmin edilir. Gerçek kodlama (estimate_exact) sonuçları da nokta olarak
+    eklenir ve sonraki tahminleri iyileştirir.
+    """
+
+    def __init__(self, max_images=32):
+        """
+        Args:
+            max_images: Ölçümleri saklanacak en fazla (görüntü, format) sayısı
+        """
+        self.max_images = max_images
+        self._measurements = OrderedDict()
+
+    def _get_points(self, image_key, save_format):
+        """(görüntü, format) için ölçülmüş kalite -> boyut sözlüğünü döndürür"""
+        key = (image_key, save_format)
+        points = self._measurements.get(key)
+
+        if points is None:
+            points = {}
+            self._measurements[key] = points
+            while len(self._measurements) > self.max_images:
+                self._measurements.popitem(last=False)
+        else:
+            self._measurements.move_to_end(key)
+
+        return points
+
+    def _measure(self, points, img, save_format, quality):
+        """Bir kalite için ölçüm yoksa kodlayarak ekler"""
+        if quality not in points:
+            points[quality] = encode_size(img, save_format, quality)
+        return points[quality]
+
+    def estimate(self, image_key, img, save_format, quality):
+        """
+        Dosya boyutunu tahmin eder
+
+        Args:
+            image_key: Görüntüyü (içerik ve eklemeler dahil) tanımlayan anahtar
+            img: Kodlanacak PIL görüntüsü (yalnızca eksik ölçümler için kullanılır)
+            save_format: "JPEG", "WebP" ya da "PNG"
+            quality: 1-100 arası kalite
+
+        Returns:
+            Bayt cinsinden tahmini dosya boyutu
+        """
+        points = self._get_points(image_key, save_format)
+
+        # Kayıpsız formatlarda kalite önemsizdir - tek ölçüm yeterli
+        if save_format in LOSSLESS_FORMATS:
+            return self._measure(points, img, save_format, 0)
+
+        if quality in points:
+            return points[quality]
+
+        # İstenen kaliteyi çevreleyen referans kaliteleri bul
+        lower = max((q for q in ANCHOR_QUALITIES if q <= quality), default=ANCHOR_QUALITIES[0])
+        upper = min((q for q in ANCHOR_QUALITIES if q >= quality), default=ANCHOR_QUALITIES[-1])
+
+        # Daha yakın ölçülmüş noktalar varsa onları kullan
+        lower = max([q for q in points if lower <= q <= quality] + [lower])
+        upper = min([q for q in points if quality <= q <= upper] + [upper])
+
+        lower_size = self._measure(points, img, save_format, lower)
+        upper_size = self._measure(points, img, save_format, upper)
+
+        if upper == lower or lower_size <= 0 or upper_size <= 0:
+            return lower_size
+
+        # Boyut kaliteyle yaklaşık üstel büyüdüğünden log ölçekte enterpolasyon
+        ratio = (quality - lower) / (upper - lower)
+        log_size = math.log(lower_size) + ratio * (math.log(upper_size) - math.log(lower_size))
+        return int(round(math.exp(log_size)))
+
+    def estimate_exact(self, image_key, img, save_format, quality):
+        """
+        Görüntüyü istenen kalitede gerçekten kodlayarak boyutunu döndürür
+
+        Sonuç önbelleğe eklenir, böylece aynı kalite tekrar kodlanmaz.
+        """
+        points = self._get_points(image_key, save_format)
+
+        if save_format in LOSSLESS_FORMATS:
+            quality = 0
+
+        return self._measure(points, img, save_format, quality)
+
+    def clear(self):
+        """Tüm ölçümleri temizle"""
+        self._measurements.clear()
@@ -1,8 +1,13 @@
 # app/gui/main_window.py
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk, colorchooser
-from PIL import Image, ImageTk
 import os
+import logging
+from app.utils.file_utils import get_file_size_str
+from app.gui.ui_bridge import UIBridge
+from app.gui.preview_scheduler import PreviewScheduler
+
+logger = logging.getLogger(__name__)
 
 class MainWindow:
     """
@@ -12,8 +17,6 @@ class MainWindow:
     def __init__(self, root, app_manager):
         self.root = root
         self.app_manager = app_manager
-        print(f"MainWindow init: source_folder = {self.app_manager.source_folder}")
-        print(f"MainWindow init: destination_folder = {self.app_manager.destination_folder}")
         
         # GUI bileşenleri
         self.source_entry = None
@@ -32,10 +35,25 @@ class MainWindow:
         self.progress = None
         self.status_label = None
         self.process_button = None
+        self.pause_button = None
+        self.cancel_button = None
+        self.job_stats_label = None
+        
+        # Çalışan toplu işlem (BatchJob) ve istatistik güncelleme zamanlayıcısı
+        self.current_job = None
+        self.job_stats_after_id = None
         
         # Boyut onay kutuları
         self.size_checkbuttons = []
         
+        # Şekil sekmesi bileşenleri (sekme ilk açıldığında oluşturulur)
+        self.shape_fill_btn = None
+        self.shape_outline_btn = None
+        self.shape_listbox = None
+        
+        # Henüz oluşturulmamış sekmeler: sekme çerçevesi -> oluşturma fonksiyonu
+        self.lazy_tabs = {}
+        
         # Ekleme kontrol değişkenleri
         self.text_enabled_var = tk.BooleanVar(value=False)
         self.text_var = tk.StringVar(value="")
@@ -79,6 +97,9 @@ class MainWindow:
         self.original_preview_height = 0
         self.current_size_index = 0
         
+        # Önizleme ve dosya boyutu tahmini arka planda, birleştirilerek render edilir
+        self.preview_scheduler = PreviewScheduler(self.root, debounce_ms=40)
+        
         # Sürükleme değişkenleri
         self.drag_start_x = None
         self.drag_start_y = None
@@ -99,9 +120,19 @@ class MainWindow:
         self.graphic_x_position = 0.9  # Sağ olarak başla (0-1 aralığı)
         self.graphic_y_position = 0.9  # Alt olarak başla (0-1 aralığı)
         
-        # Callback fonksiyonlarını ayarla
-        self.app_manager.on_status_update = self.update_status
-        self.app_manager.on_progress_update = self.update_progress
+        # Sürükleme sırasında tuvalde taşınan ekleme görüntüsü ve arka plan
+        self.drag_sprite = None
+        self.drag_sprite_item = None
+        self.drag_sprite_offset = (0, 0)
+        self.drag_base_img = None
+        
+        # Callback fonksiyonlarını ayarla - işlem iş parçacığından gelen bildirimler
+        # kuyruk üzerinden Tk ana döngüsünde, birleştirilerek uygulanır
+        self.ui_bridge = UIBridge(self.root, self.update_status, self.update_progress,
+                                  is_important=self.is_important_status)
+        self.app_manager.on_status_update = self.ui_bridge.post_status
+        self.app_manager.on_progress_update = self.ui_bridge.post_progress
+        self.ui_bridge.start()
         
         # Arayüzü oluştur
         self.setup_ui()
@@ -143,6 +174,10 @@ class MainWindow:
                                     mode='determinate')
         self.progress.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
         
+        # Toplu işlem istatistikleri (verim ve tahmini kalan süre)
+        self.job_stats_label = ttk.Label(progress_frame, text="")
+        self.job_stats_label.pack(side=tk.LEFT, padx=5)
+        
         # Durum etiketi
         self.status_label = ttk.Label(bottom_frame, text="Hazır")
         self.status_label.pack(side=tk.LEFT, pady=5, padx=5)
@@ -218,6 +253,17 @@ class MainWindow:
         format_combo.pack(side=tk.LEFT, padx=5)
         format_combo.bind("<<ComboboxSelected>>", self.on_format_changed)
         
+        # Paralel işçi sayısı
+        ttk.Label(format_frame, text="İşçi Sayısı:").pack(side=tk.LEFT, padx=5)
+        self.worker_count_var = tk.IntVar(value=self.app_manager.worker_count)
+        ttk.Spinbox(format_frame, from_=1, to=max(1, os.cpu_count() or 1), textvariable=self.worker_count_var,
+                width=4).pack(side=tk.LEFT, padx=5)
+        
+        # Artımlı mod - değişmemiş çıktıları atla
+        self.incremental_var = tk.BooleanVar(value=self.app_manager.incremental_mode)
+        ttk.Checkbutton(format_frame, text="Değişmeyenleri Atla", 
+                       variable=self.incremental_var).pack(side=tk.LEFT, padx=5)
+        
         # Sıfırlama düğmesi
         ttk.Button(format_frame, text="Tümünü Sıfırla", command=self.reset_application).pack(side=tk.RIGHT, padx=5)
         
@@ -324,10 +370,11 @@ class MainWindow:
         graphic_tab = ttk.Frame(notebook)
         notebook.add(graphic_tab, text="Grafik")
         
-        # Her sekmenin içeriğini oluştur
+        # Metin sekmesi hemen, seyrek kullanılan sekmeler ilk seçildiklerinde oluşturulur
         self.setup_text_tab(text_tab)
-        self.setup_shape_tab(shape_tab)  # Yeni şekil sekmesi
-        self.setup_graphic_tab(graphic_tab)
+        self.lazy_tabs[str(shape_tab)] = lambda: self.setup_shape_tab(shape_tab)
+        self.lazy_tabs[str(graphic_tab)] = lambda: self.setup_graphic_tab(graphic_tab)
+        notebook.bind("<<NotebookTabChanged>>", self.on_overlay_tab_changed)
         
         # İşlem düğmesini alt kısıma ekle
         process_frame = ttk.Frame(parent_frame)
@@ -337,6 +384,24 @@ class MainWindow:
                              command=self.start_processing)
         self.process_button.pack(fill=tk.X, padx=5, pady=10)
         
+        # Çalışan işlemi duraklatma ve iptal düğmeleri
+        job_control_frame = ttk.Frame(process_frame)
+        job_control_frame.pack(fill=tk.X)
+        
+        self.pause_button = ttk.Button(job_control_frame, text="Duraklat", 
+                                      command=self.toggle_pause_processing, state=tk.DISABLED)
+        self.pause_button.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+        
+        self.cancel_button = ttk.Button(job_control_frame, text="İptal", 
+                                       command=self.cancel_processing, state=tk.DISABLED)
+        self.cancel_button.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+        
+    def on_overlay_tab_changed(self, event):
+        """Seçilen sekme henüz oluşturulmadıysa içeriğini oluştur"""
+        setup_tab = self.lazy_tabs.pop(event.widget.select(), None)
+        if setup_tab:
+            setup_tab()
+    
     def setup_text_tab(self, parent_frame):
         """Metin sekmesini oluştur"""
         # Metin ekleme bölümü
@@ -497,6 +562,9 @@ class MainWindow:
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         self.shape_listbox.config(yscrollcommand=scrollbar.set)
         
+        # Sekme açılmadan önce çizilmiş şekilleri listele
+        self.update_shape_list()
+        
         # Şekil silme düğmesi
         shape_buttons_frame = ttk.Frame(shape_list_frame)
         shape_buttons_frame.pack(fill=tk.X, pady=5)
@@ -643,6 +711,10 @@ class MainWindow:
     
     def update_shape_list(self):
         """Şekil listesini güncelle"""
+        # Şekil sekmesi henüz oluşturulmadı
+        if self.shape_listbox is None:
+            return
+        
         shapes = self.app_manager.overlay_manager.shapes
         self.shape_listbox.delete(0, tk.END)
         
@@ -690,6 +762,9 @@ class MainWindow:
 
     def update_preview_files(self):
         """Önizleme için kullanılabilir dosyaların listesini güncelle"""
+        # Diskten yeniden okumaya zorla
+        self.app_manager.invalidate_preview_cache()
+        
         images = self.app_manager.get_image_files()
         
         if not images:
@@ -861,8 +936,9 @@ class MainWindow:
                     self.text_dragging = True
                     self.text_drag_start_x = event.x
                     self.text_drag_start_y = event.y
+                    self.begin_overlay_drag("text")
                     self.crop_instructions.config(text="METİN eklemesini sürüklüyor...")
-                    print("Text dragging started")
+                    logger.debug("Text dragging started")
                     return
             
             # Grafik sürükleme algılama
@@ -878,8 +954,9 @@ class MainWindow:
                     self.graphic_dragging = True
                     self.graphic_drag_start_x = event.x
                     self.graphic_drag_start_y = event.y
+                    self.begin_overlay_drag("graphic")
                     self.crop_instructions.config(text="GRAFİK eklemesini sürüklüyor...")
-                    print("Graphic dragging started")
+                    logger.debug("Graphic dragging started")
                     return
             
             # Kırpma modu etkinse
@@ -988,8 +1065,8 @@ class MainWindow:
             self.app_manager.overlay_manager.set_text_manual_position(
                 self.text_x_position, self.text_y_position)
             
-            # Metin konumunu güncelle ve yeniden çiz
-            self.update_preview_image()
+            # Metni tuvalde taşı - gerçek render bırakıldığında yapılır
+            self.move_overlay_drag("text")
             self.crop_instructions.config(text=f"Metin konumu: ({int(self.text_x_position*100)}%, {int(self.text_y_position*100)}%)")
             return
             
@@ -1008,8 +1085,8 @@ class MainWindow:
             self.app_manager.overlay_manager.set_graphic_manual_position(
                 self.graphic_x_position, self.graphic_y_position)
             
-            # Grafik konumunu güncelle ve yeniden çiz
-            self.update_preview_image()
+            # Grafiği tuvalde taşı - gerçek render bırakıldığında yapılır
+            self.move_overlay_drag("graphic")
             self.crop_instructions.config(text=f"Grafik konumu: ({int(self.graphic_x_position*100)}%, {int(self.graphic_y_position*100)}%)")
             return
             
@@ -1112,7 +1189,10 @@ class MainWindow:
             
             # Seçiciyi güncelle
             self.text_position_var.set("custom")
-            print(f"Text position finalized: {self.text_x_position:.2f}, {self.text_y_position:.2f}")
+            logger.debug("Text position finalized: %.2f, %.2f", self.text_x_position, self.text_y_position)
+            
+            # Gerçek birleşik önizlemeyi render et
+            self.end_overlay_drag()
             return
             
 # Grafik sürükleme
@@ -1127,7 +1207,10 @@ class MainWindow:
             
             # Seçiciyi güncelle
             self.graphic_position_var.set("custom")
-            print(f"Graphic position finalized: {self.graphic_x_position:.2f}, {self.graphic_y_position:.2f}")
+            logger.debug("Graphic position finalized: %.2f, %.2f", self.graphic_x_position, self.graphic_y_position)
+            
+            # Gerçek birleşik önizlemeyi render et
+            self.end_overlay_drag()
             return
             
         # Kırpma sürükleme
@@ -1184,62 +1267,92 @@ class MainWindow:
             size_index = 0
             self.current_size_index = 0
         
-        # AppManager'dan önizleme görüntüsünü yükle
+        # Önizleme için küçült
+        width, height, _ = self.app_manager.sizes[size_index]
+        
+        # Tuval boyutunu al
+        max_preview_width = self.preview_canvas.winfo_width() - 10
+        max_preview_height = self.preview_canvas.winfo_height() - 10
+        
+        if max_preview_width <= 1 or max_preview_height <= 1:
+            # Tuval henüz gerçekleştirilmemiş, varsayılan boyutları kullan
+            max_preview_width = 590
+            max_preview_height = 290
+        
+        scale_factor = min(max_preview_width / width, max_preview_height / height)
+        
+        preview_width = int(width * scale_factor)
+        preview_height = int(height * scale_factor)
+        
+        # Manuel metin konumlandırma
+        if self.text_enabled_var.get() and self.text_position_manual:
+            # Özel metin konumu kullan
+            self.app_manager.overlay_manager.set_text_position("custom")
+            self.app_manager.overlay_manager.set_text_manual_position(
+                self.text_x_position, self.text_y_position)
+        else:
+            # Normal metin konumu kullan
+            self.app_manager.overlay_manager.set_text_position(self.text_position_var.get())
+        
+        # Manuel grafik konumlandırma
+        if self.graphic_enabled_var.get() and self.graphic_position_manual:
+            # Özel grafik konumu kullan
+            self.app_manager.overlay_manager.set_graphic_position("custom")
+            self.app_manager.overlay_manager.set_graphic_manual_position(
+                self.graphic_x_position, self.graphic_y_position)
+        else:
+            # Normal grafik konumu kullan
+            self.app_manager.overlay_manager.set_graphic_position(self.graphic_position_var.get())
+        
+        # Tıklama konumu hesaplaması için orijinal önizleme boyutunu sakla
+        self.original_preview_width = preview_width
+        self.original_preview_height = preview_height
+        
+        # Render arka planda, ayarların anlık görüntüsüyle yapılır - eklemeler doğrudan
+        # tuval çözünürlüğünde uygulanır. Art arda gelen isteklerden yalnızca sonuncusu çizilir.
+        state = self.app_manager.get_preview_state()
+        params = {
+            "file": selected_file,
+            "size_index": size_index,
+            "width": width,
+            "height": height,
+            "preview_width": preview_width,
+            "preview_height": preview_height
+        }
+        
+        self.preview_scheduler.submit(
+            "preview",
+            lambda: self.app_manager.load_preview_image(
+                selected_file, size_index, (preview_width, preview_height), state
+            ),
+            lambda result: self.show_preview_image(params, result)
+        )
+    
+    def show_preview_image(self, params, result):
+        """
+        Arka planda render edilen önizlemeyi tuvale çiz (ana iş parçacığında çağrılır)
+        
+        Args:
+            params: update_preview_image tarafından hazırlanan istek bilgileri
+            result: load_preview_image sonucu
+        """
+        selected_file = params["file"]
+        width = params["width"]
+        height = params["height"]
+        preview_width = params["preview_width"]
+        preview_height = params["preview_height"]
+        
         try:
-            original_img, resized_img, original_file_size, estimated_size = self.app_manager.load_preview_image(
-                selected_file, size_index
-            )
+            original_img, preview_img, original_file_size, estimated_size = result
             
-            if original_img is None or resized_img is None:
+            if original_img is None or preview_img is None:
                 self.preview_canvas.delete("all")
                 self.preview_label.config(text="Önizleme yüklenirken hata oluştu")
                 return
-                
-            # Önizleme için küçült
-            width, height, _ = self.app_manager.sizes[size_index]
-            
-            # Tuval boyutunu al
-            max_preview_width = self.preview_canvas.winfo_width() - 10
-            max_preview_height = self.preview_canvas.winfo_height() - 10
-            
-            if max_preview_width <= 1 or max_preview_height <= 1:
-                # Tuval henüz gerçekleştirilmemiş, varsayılan boyutları kullan
-                max_preview_width = 590
-                max_preview_height = 290
-            
-            scale_factor = min(max_preview_width / width, max_preview_height / height)
-            
-            preview_width = int(width * scale_factor)
-            preview_height = int(height * scale_factor)
-            
-            # Tıklama konumu hesaplaması için orijinal önizleme boyutunu sakla
-            self.original_preview_width = preview_width
-            self.original_preview_height = preview_height
-            
-            # Manuel metin konumlandırma
-            if self.text_enabled_var.get() and self.text_position_manual:
-                # Özel metin konumu kullan
-                self.app_manager.overlay_manager.set_text_position("custom")
-                self.app_manager.overlay_manager.set_text_manual_position(
-                    self.text_x_position, self.text_y_position)
-            else:
-                # Normal metin konumu kullan
-                self.app_manager.overlay_manager.set_text_position(self.text_position_var.get())
-            
-            # Manuel grafik konumlandırma
-            if self.graphic_enabled_var.get() and self.graphic_position_manual:
-                # Özel grafik konumu kullan
-                self.app_manager.overlay_manager.set_graphic_position("custom")
-                self.app_manager.overlay_manager.set_graphic_manual_position(
-                    self.graphic_x_position, self.graphic_y_position)
-            else:
-                # Normal grafik konumu kullan
-                self.app_manager.overlay_manager.set_graphic_position(self.graphic_position_var.get())
-            
-            # Eklemeleri uygula
-            preview_img = resized_img.resize((preview_width, preview_height), Image.LANCZOS)
             
             # Görüntüyü tkinter PhotoImage'e dönüştür
+            # ImageTk ilk önizlemede yüklenir (açılış süresini kısaltır)
+            from PIL import ImageTk
             self.preview_img = ImageTk.PhotoImage(preview_img)
             
             # Tuvali güncelle
@@ -1259,75 +1372,11 @@ class MainWindow:
             
             self.preview_canvas.create_image(img_x, img_y, image=self.preview_img, anchor=tk.CENTER, tags="preview")
             
-            # Manuel metin konumu için gösterge
+            # Manuel metin ve grafik konumları için göstergeler
             if self.text_enabled_var.get() and self.text_position_manual:
-                # Hesaplanan konumda metin göstergesi çiz
-                x_pos = img_x - (preview_width // 2) + int(self.text_x_position * preview_width)
-                y_pos = img_y - (preview_height // 2) + int(self.text_y_position * preview_height)
-                
-                # Daha belirgin bir metin konumu göstergesi çiz
-                # Arka plan daire
-                self.preview_canvas.create_oval(
-                    x_pos-15, y_pos-15, x_pos+15, y_pos+15,
-                    fill="blue", outline="white", width=2, tags="text_overlay"
-                )
-                
-                # İç daire
-                self.preview_canvas.create_oval(
-                    x_pos-7, y_pos-7, x_pos+7, y_pos+7,
-                    fill="white", outline="blue", width=1, tags="text_overlay"
-                )
-                
-                # Metin etiket
-                self.preview_canvas.create_text(
-                    x_pos, y_pos-25,
-                    text="Metin Konumu",
-                    fill="white", font=("Arial", 10, "bold"),
-                    tags="text_overlay"
-                )
-                
-                # Koordinat bilgisi
-                self.preview_canvas.create_text(
-                    x_pos, y_pos+25,
-                    text=f"({int(self.text_x_position*100)}%, {int(self.text_y_position*100)}%)",
-                    fill="white", font=("Arial", 8),
-                    tags="text_overlay"
-                )
-
-            # Manuel grafik konumu için gösterge
+                self.draw_position_indicator("text", img_x, img_y, preview_width, preview_height)
             if self.graphic_enabled_var.get() and self.graphic_position_manual:
-                # Hesaplanan konumda grafik göstergesi çiz
-                x_pos = img_x - (preview_width // 2) + int(self.graphic_x_position * preview_width)
-                y_pos = img_y - (preview_height // 2) + int(self.graphic_y_position * preview_height)
-                
-                # Daha belirgin bir grafik konumu göstergesi çiz
-                # Arka plan kare
-                self.preview_canvas.create_rectangle(
-                    x_pos-15, y_pos-15, x_pos+15, y_pos+15,
-                    fill="green", outline="white", width=2, tags="graphic_overlay"
-                )
-                
-                # İç kare
-                self.preview_canvas.create_rectangle(
-                    x_pos-7, y_pos-7, x_pos+7, y_pos+7,
-                    fill="white", outline="green", width=1, tags="graphic_overlay"
-                )
-                
-                # Grafik etiket
-                self.preview_canvas.create_text(
-                    x_pos, y_pos-25,
-                    text="Grafik Konumu",
-                    fill="white", font=("Arial", 10, "bold"),
-                    tags="graphic_overlay"
-                )
-                
-                # Koordinat bilgisi
-                self.preview_canvas.create_text(
-                    x_pos, y_pos+25,
-                    text=f"({int(self.graphic_x_position*100)}%, {int(self.graphic_y_position*100)}%)",
-                    fill="white", font=("Arial", 8),
-                    tags="graphic_overlay"
-                )
+                self.draw_position_indicator("graphic", img_x, img_y, preview_width, preview_height)
             
             # Özel kırpma etkinse kırpma merkezi işaretçisini çiz
             if (self.app_manager.is_cropping_active and 
@@ -1365,13 +1414,11 @@ class MainWindow:
                 # Tahmini kırpma bölgesini çiz
                 self.draw_crop_region_preview()
             
-            # Bilgi etiketini güncelle
-            original_size = original_img.size
+            # Bilgi etiketini güncelle (azaltılmış çözme öncesi boyut)
+            original_size = self.app_manager.current_original_size or original_img.size
             
             # Dosya boyutlarını formatla
-            from app.utils.file_utils import get_file_size_str
             original_size_str = get_file_size_str(original_file_size)
-            estimated_size_str = get_file_size_str(estimated_size)
             
             # En boy oranlarını hesapla
             original_ratio = original_size[0] / original_size[1]
@@ -1398,18 +1445,167 @@ class MainWindow:
                     f"Hedef: {width}x{height} | {crop_info}{overlay_info}"
             )
             
-            # Dosya boyutu tahminini güncelle
-            self.filesize_label.config(text=f"Tahmini boyut: {estimated_size_str}")
-            
             # AppManager'ın geçerli önizleme dosyasını ve boyutunu sakla
             self.app_manager.current_preview_file = selected_file
             self.app_manager.current_preview_size = (width, height)
             
+            # Tam boyutlu çıktının dosya boyutu tahmini kullanıcı durduğunda hesaplanır
+            self.schedule_file_size_estimation()
+            
         except Exception as e:
             self.preview_canvas.delete("all")
             self.preview_label.config(text=f"Önizleme hatası: {str(e)}")
-            print(f"Preview error: {str(e)}")
+            logger.exception("Preview error")
 
+    def draw_position_indicator(self, element, img_x, img_y, preview_width, preview_height):
+        """
+        Manuel konumlandırılan metin ya da grafik için tuvalde konum göstergesi çiz
+        
+        Args:
+            element: "text" ya da "graphic"
+            img_x, img_y: Önizleme görüntüsünün tuvaldeki merkezi
+            preview_width, preview_height: Önizleme görüntüsünün boyutu
+        """
+        if element == "text":
+            rel_x, rel_y = self.text_x_position, self.text_y_position
+            color, label, tag = "blue", "Metin Konumu", "text_overlay"
+            create_shape = self.preview_canvas.create_oval
+        else:
+            rel_x, rel_y = self.graphic_x_position, self.graphic_y_position
+            color, label, tag = "green", "Grafik Konumu", "graphic_overlay"
+            create_shape = self.preview_canvas.create_rectangle
+        
+        # Hesaplanan konumda gösterge çiz
+        x_pos = img_x - (preview_width // 2) + int(rel_x * preview_width)
+        y_pos = img_y - (preview_height // 2) + int(rel_y * preview_height)
+        
+        # Dış şekil (metin için daire, grafik için kare)
+        create_shape(
+            x_pos-15, y_pos-15, x_pos+15, y_pos+15,
+            fill=color, outline="white", width=2, tags=tag
+        )
+        
+        # İç şekil
+        create_shape(
+            x_pos-7, y_pos-7, x_pos+7, y_pos+7,
+            fill="white", outline=color, width=1, tags=tag
+        )
+        
+        # Etiket
+        self.preview_canvas.create_text(
+            x_pos, y_pos-25,
+            text=label,
+            fill="white", font=("Arial", 10, "bold"),
+            tags=tag
+        )
+        
+        # Koordinat bilgisi
+        self.preview_canvas.create_text(
+            x_pos, y_pos+25,
+            text=f"({int(rel_x*100)}%, {int(rel_y*100)}%)",
+            fill="white", font=("Arial", 8),
+            tags=tag
+        )
+    
+    def begin_overlay_drag(self, element):
+        """
+        Metin ya da grafik sürüklemesini başlat
+        
+        Sürükleme sırasında önizleme yeniden render edilmez: ekleme, önizleme
+        çözünürlüğünde bir kez çizilip tuvalde hafif bir görüntü öğesi olarak
+        taşınır. Eklemenin eski konumunu içermeyen arka plan arka planda
+        hazırlanır ve hazır olduğunda değiştirilir. Gerçek birleşik görüntü
+        bırakıldığında (end_overlay_drag) render edilir.
+        
+        Args:
+            element: "text" ya da "graphic"
+        """
+        from PIL import ImageTk
+        
+        # Bekleyen önizleme render'ları sürükleme öğelerini silmesin
+        self.preview_scheduler.cancel("preview")
+        
+        preview_size = (self.original_preview_width, self.original_preview_height)
+        reference_width = self.app_manager.sizes[self.current_size_index][0]
+        
+        sprite, offset = self.app_manager.overlay_manager.get_drag_sprite(
+            element, preview_size, reference_width
+        )
+        if sprite is None:
+            self.drag_sprite = None
+            return
+        
+        self.drag_sprite = ImageTk.PhotoImage(sprite)
+        self.drag_sprite_offset = offset
+        self.drag_sprite_item = self.preview_canvas.create_image(
+            0, 0, image=self.drag_sprite, anchor=tk.NW, tags="drag_sprite"
+        )
+        self.move_overlay_drag(element)
+        
+        # Sürüklenen eklemeyi içermeyen arka planı arka planda render et
+        state = self.app_manager.get_preview_state()
+        state["overlay"] = dict(state["overlay"])
+        state["overlay"][f"{element}_enabled"] = False
+        selected_file = self.app_manager.current_preview_file
+        size_index = self.current_size_index
+        
+        self.preview_scheduler.submit(
+            "drag_base",
+            lambda: self.app_manager.load_preview_image(selected_file, size_index, preview_size, state),
+            self.show_drag_base,
+            0
+        )
+    
+    def show_drag_base(self, result):
+        """Sürüklenen eklemeyi içermeyen arka planı tuvale yerleştir (ana iş parçacığı)"""
+        if not (self.text_dragging or self.graphic_dragging):
+            return
+        
+        from PIL import ImageTk
+        
+        _, preview_img, _, _ = result
+        if preview_img is None:
+            return
+        
+        self.drag_base_img = ImageTk.PhotoImage(preview_img)
+        self.preview_canvas.itemconfig("preview", image=self.drag_base_img)
+    
+    def move_overlay_drag(self, element):
+        """Sürüklenen eklemeyi ve konum göstergesini tuvalde yeni konuma taşı"""
+        canvas_width = self.preview_canvas.winfo_width()
+        canvas_height = self.preview_canvas.winfo_height()
+        img_x = canvas_width // 2
+        img_y = canvas_height // 2
+        preview_width = self.original_preview_width
+        preview_height = self.original_preview_height
+        
+        if element == "text":
+            rel_x, rel_y = self.text_x_position, self.text_y_position
+        else:
+            rel_x, rel_y = self.graphic_x_position, self.graphic_y_position
+        
+        if self.drag_sprite is not None:
+            x_pos = img_x - (preview_width // 2) + int(rel_x * preview_width)
+            y_pos = img_y - (preview_height // 2) + int(rel_y * preview_height)
+            self.preview_canvas.coords(
+                self.drag_sprite_item,
+                x_pos + self.drag_sprite_offset[0],
+                y_pos + self.drag_sprite_offset[1]
+            )
+        
+        # Göstergeyi yeniden çiz (yalnızca tuval öğeleri - görüntü işlenmez)
+        tag = "text_overlay" if element == "text" else "graphic_overlay"
+        self.preview_canvas.delete(tag)
+        self.draw_position_indicator(element, img_x, img_y, preview_width, preview_height)
+    
+    def end_overlay_drag(self):
+        """Sürüklemeyi bitir ve gerçek birleşik önizlemeyi render et"""
+        self.preview_scheduler.cancel("drag_base")
+        
+        # Sürükleme öğeleri yeni önizleme çizilene kadar tuvalde kalır
+        # (PhotoImage referansları bir sonraki sürüklemeye kadar tutulur)
+        self.update_preview_image()
+    
     def draw_crop_region_preview(self):
         """Tahmini kırpma bölgesini tuvalde göster"""
         if (not self.app_manager.is_cropping_active or
@@ -1454,7 +1650,7 @@ class MainWindow:
                 outline="yellow", width=2, dash=(5, 5), tags="crop_preview"
             )
         except Exception as e:
-            print(f"Error drawing crop region: {str(e)}")
+            logger.error("Error drawing crop region: %s", e)
 
     def on_text_overlay_toggled(self):
         """Metin eklemesi etkinleştirildiğinde/devre dışı bırakıldığında çağrılır"""
@@ -1586,7 +1782,7 @@ class MainWindow:
         quality = int(float(self.quality_slider.get()))
         self.app_manager.set_quality(quality)
         self.quality_label.config(text=f"{quality}%")
-        self.update_file_size_estimation()
+        self.update_file_size_estimation(quick=True)
 
     def on_format_changed(self, event=None):
         """Format aşağı açılır menüsü değiştiğinde tetiklenir"""
@@ -1598,11 +1794,54 @@ class MainWindow:
         """Boyut onay kutusu değiştiğinde tetiklenir"""
         self.app_manager.toggle_size(index, var.get())
 
-    def update_file_size_estimation(self):
-        """Dosya boyutu tahminini güncelle"""
-        # Önizleme görüntüsü zaten yüklendiyse yeniden yükle
+    def update_file_size_estimation(self, quick=False):
+        """
+        Dosya boyutu tahminini güncelle
+        
+        Args:
+            quick: True ise referans kalitelerden enterpolasyonlu tahmin hemen gösterilir
+                (kaydırıcı sürüklenirken); gerçek kodlama etkileşim durduğunda yapılır
+        """
+        # Önizleme görüntüsü zaten yüklendiyse yeniden hesapla
         if self.app_manager.current_preview_file and self.app_manager.current_original_img:
-            self.update_preview_image()
+            if quick:
+                self.request_file_size_estimation(exact=False, delay_ms=0)
+            else:
+                self.schedule_file_size_estimation()
+    
+    def schedule_file_size_estimation(self):
+        """Tam boyutlu çıktının dosya boyutu tahminini, etkileşim durduğunda çalışacak şekilde planla"""
+        # Son değişiklikten 300 ms sonra (boşta) hesapla
+        self.request_file_size_estimation(exact=True, delay_ms=300)
+    
+    def request_file_size_estimation(self, exact, delay_ms):
+        """
+        Dosya boyutu tahminini arka planda hesapla ve etiketi güncelle
+        
+        Args:
+            exact: True ise tam boyutlu render ve gerçek kodlama yapılır, False ise
+                enterpolasyonlu tahmin gösterilir ve ardından gerçek kodlama planlanır
+            delay_ms: İsteğin birleştirme süresi (milisaniye)
+        """
+        selected_file = self.app_manager.current_preview_file
+        if not selected_file:
+            return
+        
+        size_index = self.current_size_index
+        state = self.app_manager.get_preview_state()
+        
+        def on_done(estimated_size):
+            prefix = "" if exact else "~"
+            self.filesize_label.config(text=f"Tahmini boyut: {prefix}{get_file_size_str(estimated_size)}")
+            if not exact:
+                self.schedule_file_size_estimation()
+        
+        self.preview_scheduler.submit(
+            "estimate",
+            lambda: self.app_manager.estimate_preview_file_size(selected_file, size_index, exact, state),
+            on_done,
+            delay_ms
+        )
 
     def toggle_crop_control(self):
         """Özel kırpma kontrolünü etkinleştir/devre dışı bırak"""
@@ -1656,23 +1895,24 @@ class MainWindow:
             self.update_file_size_estimation()
             self.status_label.config(text="Uygulama varsayılan ayarlara sıfırlandı")
 
+    def is_important_status(self, message):
+        """Birleştirilmeden gösterilmesi gereken durum mesajlarını belirler"""
+        return (message.startswith("Error") or message.startswith("Processing cancelled")
+                or message == "All images processed successfully!")
+    
     def update_status(self, message):
-        """Durum etiketini güncelle (AppManager'dan çağrılır)"""
+        """Durum etiketini güncelle (UIBridge üzerinden ana iş parçacığında çağrılır)"""
         self.status_label.config(text=message)
-        self.root.update_idletasks()
             
-        # İşlem tamamlandıysa düğmeyi yeniden etkinleştir
+        # İşlem bittiğinde düğmeler update_job_stats tarafından yeniden etkinleştirilir
         if message == "All images processed successfully!":
             messagebox.showinfo("Tamamlandı", "Görüntü optimizasyonu başarıyla tamamlandı!")
-            self.process_button.config(state=tk.NORMAL)
         elif message.startswith("Error"):
             messagebox.showerror("Hata", message) 
-            self.process_button.config(state=tk.NORMAL)
 
     def update_progress(self, value):
-        """İlerleme çubuğunu güncelle (AppManager'dan çağrılır)"""
+        """İlerleme çubuğunu güncelle (UIBridge üzerinden ana iş parçacığında çağrılır)"""
         self.progress['value'] = value
-        self.root.update_idletasks()
 
     def start_processing(self):
         """Görüntü işleme sürecini başlat"""
@@ -1680,6 +1920,17 @@ class MainWindow:
         self.app_manager.set_source_folder(self.source_entry.get())
         self.app_manager.set_destination_folder(self.dest_entry.get())
         
+        # İşçi sayısını ayarla
+        try:
+            self.app_manager.set_worker_count(self.worker_count_var.get())
+        except (tk.TclError, ValueError):
+            messagebox.showerror("Hata", "Lütfen geçerli bir işçi sayısı girin")
+            return
+        
+        # Artımlı modu ayarla
+        self.app_manager.set_incremental_mode(self.incremental_var.get(),
+                                              self.app_manager.incremental_content_hash)
+        
         # Girişi doğrula
         if not self.app_manager.source_folder or not os.path.isdir(self.app_manager.source_folder):
             messagebox.showerror("Hata", "Lütfen geçerli bir kaynak klasör seçin")
@@ -1694,8 +1945,64 @@ class MainWindow:
             messagebox.showerror("Hata", "Lütfen en az bir çıktı boyutu seçin")
             return
         
-        # İşlem düğmesini devre dışı bırak
+        # İşlem düğmesini devre dışı bırak, işlem kontrollerini etkinleştir
         self.process_button.config(state=tk.DISABLED)
+        self.pause_button.config(state=tk.NORMAL, text="Duraklat")
+        self.cancel_button.config(state=tk.NORMAL)
         
         # İşlemeyi başlat
-        self.app_manager.process_images()
\ No newline at end of file
+        self.current_job = self.app_manager.process_images()
+        self.update_job_stats()
+    
+    def toggle_pause_processing(self):
+        """Çalışan işlemi duraklat ya da sürdür"""
+        job = self.current_job
+        if job is None or job.is_finished:
+            return
+        
+        if job.is_paused:
+            job.resume()
+            self.pause_button.config(text="Duraklat")
+        else:
+            job.pause()
+            self.pause_button.config(text="Devam Et")
+    
+    def cancel_processing(self):
+        """Çalışan işlemi iptal et (devam eden görüntüler tamamlanır)"""
+        job = self.current_job
+        if job is None or job.is_finished:
+            return
+        
+        job.cancel()
+        self.pause_button.config(state=tk.DISABLED)
+        self.cancel_button.config(state=tk.DISABLED)
+        self.status_label.config(text="Cancelling...")
+    
+    def update_job_stats(self):
+        """Çalışan işlemin istatistiklerini göster, işlem bittiğinde kontrolleri sıfırla"""
+        self.job_stats_after_id = None
+        job = self.current_job
+        if job is None:
+            return
+        
+        stats = job.get_stats()
+        text = (f"{stats['files_done']} done, {stats['files_failed']} failed - "
+                f"{stats['files_per_second']:.1f} files/s, "
+                f"{get_file_size_str(stats['bytes_in'])} → {get_file_size_str(stats['bytes_out'])}")
+        
+        if stats["state"] == job.PAUSED:
+            text += " - paused"
+        elif stats["eta"] is not None:
+            minutes, seconds = divmod(int(stats["eta"]), 60)
+            text += f" - ETA {minutes}:{seconds:02d}"
+        
+        self.job_stats_label.config(text=text)
+        
+        if job.is_finished:
+            self.current_job = None
+            self.process_button.config(state=tk.NORMAL)
+            self.pause_button.config(state=tk.DISABLED, text="Duraklat")
+            self.cancel_button.config(state=tk.DISABLED)
+            return
+        
+        self.job_stats_after_id = self.root.after(500, self.update_job_stats)
\ No newline at end of file
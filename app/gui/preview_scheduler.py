@@ -0,0 +1,167 @@
+# app/gui/preview_scheduler.py
+import queue
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class PreviewScheduler:
+    """
+    Önizleme render'larını arka plan iş parçacığında çalıştıran zamanlayıcı
+
+    Her istek bir türe ("preview", "estimate" vb.) aittir. Aynı türden art arda
+    gelen istekler debounce_ms süresince birleştirilir; yalnızca sonuncusu
+    işçi iş parçacığına gönderilir. İşçi her tür için tek bir bekleyen istek
+    tutar - yeni istek gelince eskisi çalıştırılmadan atılır. Biten render'ın
+    sonucu kuyruk üzerinden Tk ana döngüsüne taşınır ve yalnızca o tür için
+    hâlâ en güncel istekse on_done çağrılır.
+    """
+
+    def __init__(self, root, debounce_ms=80, poll_ms=15):
+        """
+        Args:
+            root: Tk kök penceresi
+            debounce_ms: Varsayılan birleştirme süresi (milisaniye)
+            poll_ms: Sonuç kuyruğunun kontrol aralığı (milisaniye)
+        """
+        self.root = root
+        self.debounce_ms = debounce_ms
+        self.poll_ms = poll_ms
+
+        # Tk iş parçacığına ait durum
+        self._generations = {}   # tür -> en son istek numarası
+        self._debounce_ids = {}  # tür -> bekleyen after kimliği
+        self._callbacks = {}     # tür -> (numara, on_done)
+        self._poll_id = None
+
+        # İşçi iş parçacığıyla paylaşılan durum
+        self._pending = {}  # tür -> (numara, render)
+        self._condition = threading.Condition()
+        self._results = queue.Queue()
+        self._stopped = False
+
+        self._worker = threading.Thread(target=self._run, name="PreviewScheduler", daemon=True)
+        self._worker.start()
+
+    def submit(self, kind, render, on_done, delay_ms=None):
+        """
+        Render isteği gönder (Tk iş parçacığından çağrılmalıdır)
+
+        Args:
+            kind: İstek türü - aynı türden eski istekler geçersiz olur
+            render: Arka planda çalıştırılacak argümansız fonksiyon
+            on_done: Ana iş parçacığında sonuçla çağrılacak fonksiyon
+            delay_ms: Birleştirme süresi (None ise debounce_ms)
+        """
+        generation = self._generations.get(kind, 0) + 1
+        self._generations[kind] = generation
+        self._callbacks[kind] = (generation, on_done)
+
+        after_id = self._debounce_ids.pop(kind, None)
+        if after_id is not None:
+            self.root.after_cancel(after_id)
+
+        delay_ms = self.debounce_ms if delay_ms is None else delay_ms
+        if delay_ms <= 0:
+            self._enqueue(kind, generation, render)
+        else:
+            self._debounce_ids[kind] = self.root.after(
+                delay_ms, lambda: self._enqueue(kind, generation, render)
+            )
+
+    def cancel(self, kind):
+        """Belirli türdeki bekleyen ve devam eden isteği geçersiz kıl"""
+        self._generations[kind] = self._generations.get(kind, 0) + 1
+        self._callbacks.pop(kind, None)
+
+        after_id = self._debounce_ids.pop(kind, None)
+        if after_id is not None:
+            self.root.after_cancel(after_id)
+
+        with self._condition:
+            self._pending.pop(kind, None)
+
+    def is_pending(self, kind):
+        """Belirli tür için sonucu beklenen bir istek varsa True"""
+        return kind in self._callbacks
+
+    def stop(self):
+        """İşçi iş parçacığını ve zamanlayıcıları durdur"""
+        for after_id in self._debounce_ids.values():
+            self.root.after_cancel(after_id)
+        self._debounce_ids.clear()
+        self._callbacks.clear()
+
+        if self._poll_id is not None:
+            self.root.after_cancel(self._poll_id)
+            self._poll_id = None
+
+        with self._condition:
+            self._stopped = True
+            self._pending.clear()
+            self._condition.notify()
+
+    def _enqueue(self, kind, generation, render):
+        """Birleştirme süresi dolan isteği işçiye ver (Tk iş parçacığı)"""
+        self._debounce_ids.pop(kind, None)
+
+        # Bu arada daha yeni bir istek geldiyse gönderme
+        if generation != self._generations.get(kind):
+            return
+
+        with self._condition:
+            # Aynı türden bekleyen eski istek varsa üzerine yazılır
+            self._pending[kind] = (generation, render)
+            self._condition.notify()
+
+        if self._poll_id is None:
+            self._poll_id = self.root.after(self.poll_ms, self._poll)
+
+    def _run(self):
+        """İşçi döngüsü - bekleyen istekleri sırayla render eder"""
+        while True:
+            with self._condition:
+                while not self._pending and not self._stopped:
+                    self._condition.wait()
+                if self._stopped:
+                    return
+
+                # Sözlük ekleme sırasını korur - en eski türü al
+                kind = next(iter(self._pending))
+                generation, render = self._pending.pop(kind)
+
+            try:
+                result, error = render(), None
+            except Exception as e:
+                result, error = None, e
+
+            self._results.put((kind, generation, result, error))
+
+    def _poll(self):
+        """Sonuç kuyruğunu boşalt ve güncel sonuçları ilet (Tk iş parçacığı)"""
+        self._poll_id = None
+        latest = {}
+
+        while True:
+            try:
+                kind, generation, result, error = self._results.get_nowait()
+            except queue.Empty:
+                break
+            latest[kind] = (generation, result, error)
+
+        for kind, (generation, result, error) in latest.items():
+            callback = self._callbacks.get(kind)
+            # Eski render'ların sonuçları atılır
+            if callback is None or callback[0] != generation:
+                continue
+            del self._callbacks[kind]
+
+            if error is not None:
+                logger.error("Preview render error (%s): %s", kind, error)
+                continue
+            callback[1](result)
+
+        # Sonucu beklenen istek kaldıysa kontrol etmeye devam et
+        if self._callbacks and self._poll_id is None:
+            self._poll_id = self.root.after(self.poll_ms, self._poll)
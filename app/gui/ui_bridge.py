@@ -0,0 +1,88 @@
+# app/gui/ui_bridge.py
+import queue
+
+
+class UIBridge:
+    """
+    Arka plan iş parçacıklarından gelen durum ve ilerleme bildirimlerini
+    Tk ana döngüsüne taşıyan köprü
+
+    post_status/post_progress herhangi bir iş parçacığından çağrılabilir; olaylar
+    bir kuyruğa eklenir ve Tk ana döngüsünde after() zamanlayıcısıyla boşaltılır.
+    Her boşaltmada ilerleme olaylarından yalnızca sonuncusu, durum mesajlarından
+    önemli olanlar ve sonuncusu iletilir. Böylece arayüz saniyede en fazla
+    max_updates_per_second kez güncellenir.
+    """
+
+    def __init__(self, root, on_status, on_progress, is_important=None, max_updates_per_second=10):
+        """
+        Args:
+            root: Tk kök penceresi
+            on_status: Ana iş parçacığında çağrılacak durum fonksiyonu (mesaj)
+            on_progress: Ana iş parçacığında çağrılacak ilerleme fonksiyonu (0-100)
+            is_important: Birleştirilmeden iletilmesi gereken mesajları seçen fonksiyon
+            max_updates_per_second: Saniyedeki en fazla arayüz güncellemesi
+        """
+        self.root = root
+        self.on_status = on_status
+        self.on_progress = on_progress
+        self.is_important = is_important or (lambda message: False)
+        self.interval_ms = max(1, int(1000 / max_updates_per_second))
+        self._queue = queue.Queue()
+        self._after_id = None
+
+    def post_status(self, message):
+        """Durum mesajını kuyruğa ekle (iş parçacığı güvenli)"""
+        self._queue.put(("status", message))
+
+    def post_progress(self, value):
+        """İlerleme değerini kuyruğa ekle (iş parçacığı güvenli)"""
+        self._queue.put(("progress", value))
+
+    def start(self):
+        """Kuyruğun düzenli olarak boşaltılmasını başlat"""
+        if self._after_id is None:
+            self._after_id = self.root.after(self.interval_ms, self._drain)
+
+    def stop(self):
+        """Zamanlayıcıyı durdur ve bekleyen olayları hemen ilet"""
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+        self.flush()
+
+    def flush(self):
+        """Kuyruktaki olayları birleştirerek ana iş parçacığında ilet"""
+        last_message = None
+        last_progress = None
+
+        while True:
+            try:
+                kind, value = self._queue.get_nowait()
+            except queue.Empty:
+                break
+
+            if kind == "progress":
+                last_progress = value
+            elif self.is_important(value):
+                # Önemli mesajdan önceki ilerleme ve durum sırayla iletilir
+                if last_progress is not None:
+                    self.on_progress(last_progress)
+                    last_progress = None
+                self.on_status(value)
+                last_message = None
+            else:
+                last_message = value
+
+        if last_message is not None:
+            self.on_status(last_message)
+        if last_progress is not None:
+            self.on_progress(last_progress)
+
+    def _drain(self):
+        """Zamanlayıcı geri çağrısı - kuyruğu boşalt ve yeniden planla"""
+        self._after_id = None
+        try:
+            self.flush()
+        finally:
+            self._after_id = self.root.after(self.interval_ms, self._drain)
@@ -1,4 +1,10 @@
 # app/utils/file_utils.py
+import os
+import queue
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
 
 def get_file_size_str(size_bytes):
     """
@@ -16,3 +22,133 @@ def get_file_size_str(size_bytes):
         return f"{size_bytes/1024:.1f} KB"
     else:
         return f"{size_bytes/(1024*1024):.2f} MB"
+
+
+def iter_image_files(folder, extensions, recursive=False, min_size=None, max_size=None):
+    """
+    Klasördeki görüntü dosyalarını os.scandir ile akış halinde döndürür
+    
+    Dosyalar bulundukça döndürülür, böylece büyük klasörlerde tüm liste
+    oluşturulmadan işleme başlanabilir ve bellek kullanımı sabit kalır.
+    
+    Args:
+        folder: Taranacak klasör
+        extensions: Kabul edilen küçük harfli uzantılar (örn. [".jpg", ".png"])
+        recursive: Alt klasörler de taransın mı
+        min_size: Bayt cinsinden en küçük dosya boyutu (None ise sınır yok)
+        max_size: Bayt cinsinden en büyük dosya boyutu (None ise sınır yok)
+        
+    Yields:
+        Klasöre göreli dosya yolları
+    """
+    pending_dirs = [""]
+    
+    while pending_dirs:
+        rel_dir = pending_dirs.pop()
+        
+        try:
+            with os.scandir(os.path.join(folder, rel_dir)) as entries:
+                for entry in entries:
+                    rel_path = os.path.join(rel_dir, entry.name) if rel_dir else entry.name
+                    
+                    try:
+                        # Dizin girdisi türü çoğu sistemde ek stat çağrısı gerektirmez
+                        if entry.is_dir(follow_symlinks=False):
+                            if recursive:
+                                pending_dirs.append(rel_path)
+                            continue
+                        
+                        if not entry.is_file():
+                            continue
+                        
+                        ext = os.path.splitext(entry.name)[1].lower()
+                        if ext not in extensions:
+                            continue
+                        
+                        # Boyut filtresi yalnızca gerektiğinde stat çağırır
+                        if min_size is not None or max_size is not None:
+                            size = entry.stat().st_size
+                            if min_size is not None and size < min_size:
+                                continue
+                            if max_size is not None and size > max_size:
+                                continue
+                    except OSError:
+                        continue
+                    
+                    yield rel_path
+        except OSError as e:
+            logger.warning("Error scanning folder %s: %s", rel_dir or folder, e)
+
+
+class BackgroundScanner:
+    """
+    Bir dosya üretecini arka plan iş parçacığında çalıştırıp sınırlı bir kuyruğa besleyen sınıf
+    
+    Yavaş dosya sistemlerinde (örn. NFS) tarama gecikmesi işlemeyi bekletmez;
+    kuyruk dolduğunda tarama durur, böylece bellek kullanımı sınırlı kalır.
+    Tüketici erken bırakırsa (iptal, üretecin kapatılması) tarama iş parçacığı
+    durur ve alttaki üreteci kapatır.
+    """
+    
+    _DONE = object()
+    
+    # Kuyruk doluyken durdurma isteğinin kontrol aralığı (saniye)
+    _PUT_TIMEOUT = 0.1
+    
+    def __init__(self, iterable, maxsize=1024):
+        self.iterable = iterable
+        self.queue = queue.Queue(maxsize=maxsize)
+        
+        # Şimdiye kadar bulunan dosya sayısı ve taramanın bitip bitmediği
+        self.count = 0
+        self.finished = False
+        
+        # Tüketici artık öğe beklemiyorsa ayarlanır
+        self._stop_event = threading.Event()
+    
+    def _put(self, item):
+        """
+        Öğeyi kuyruğa ekler; kuyruk doluyken durdurma isteğini kontrol eder
+        
+        Returns:
+            Öğe eklendiyse True, tarama durdurulduysa False
+        """
+        while not self._stop_event.is_set():
+            try:
+                self.queue.put(item, timeout=self._PUT_TIMEOUT)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def _run(self):
+        """Arka plan iş parçacığı - üreteci kuyruğa aktarır"""
+        try:
+            for item in self.iterable:
+                if not self._put(item):
+                    break
+                self.count += 1
+        finally:
+            # Üreteç kapatılır (açık scandir yineleyicileri serbest kalır)
+            close = getattr(self.iterable, "close", None)
+            if close is not None:
+                close()
+            self.finished = True
+            self._put(self._DONE)
+    
+    def stop(self):
+        """Taramayı durdur (tüketici artık öğe beklemiyorsa)"""
+        self._stop_event.set()
+    
+    def __iter__(self):
+        threading.Thread(target=self._run, daemon=True).start()
+        
+        try:
+            while True:
+                item = self.queue.get()
+                if item is self._DONE:
+                    return
+                yield item
+        finally:
+            # Üreteç erken kapatıldığında (GeneratorExit) da çalışır
+            self.stop()
@@ -0,0 +1,224 @@
+# app/utils/font_registry.py
+import os
+import json
+import logging
+import threading
+from functools import lru_cache
+from PIL import ImageFont
+
+logger = logging.getLogger(__name__)
+
+# Font adı ile font dosyası adı eşlemesi (öncelik sırasıyla)
+FONT_FILE_NAMES = {
+    'arial': ['arial.ttf', 'Arial.ttf', 'DejaVuSans.ttf'],
+    'times new roman': ['times.ttf', 'Times.ttf', 'TimesNewRoman.ttf', 'DejaVuSerif.ttf'],
+    'courier new': ['cour.ttf', 'CourierNew.ttf', 'DejaVuSansMono.ttf'],
+    'georgia': ['georgia.ttf', 'Georgia.ttf'],
+    'verdana': ['verdana.ttf', 'Verdana.ttf']
+}
+
+# Dosya sisteminde tutulan font dizininin yolu
+DEFAULT_INDEX_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'slidemaker', 'font_index.json')
+
+# Kaydedilen dizinin biçim sürümü (biçim değişince eski dizinler yeniden oluşturulur)
+INDEX_VERSION = 2
+
+
+def get_system_font_dirs():
+    """
+    İşletim sistemine göre taranacak font dizinlerini döndürür
+    """
+    if os.name == 'nt':  # Windows
+        return [os.path.join(os.environ.get('WINDIR', 'C:\\Windows'), 'Fonts')]
+
+    # Linux/Mac için yaygın font dizinleri
+    return [
+        '/usr/share/fonts',
+        '/usr/local/share/fonts',
+        os.path.expanduser('~/.fonts')
+    ]
+
+
+@lru_cache(maxsize=32)
+def load_truetype(font_path, size):
+    """
+    Font dosyasını belirtilen boyutta yükler (sınırlı LRU önbellekle)
+    """
+    return ImageFont.truetype(font_path, size)
+
+
+class FontRegistry:
+    """
+    Font dosyalarının adlarını yollarına eşleyen, bir kez oluşturulan ve diske kaydedilen dizin
+
+    Dizin ilk kullanımda oluşturulur. Diske kaydedilmiş dizin, taramada gezilen
+    tüm dizinlerin (alt dizinler dahil) değiştirilme zamanları aynı kaldığı
+    sürece yeniden kullanılır; böylece alt dizinlere kurulan fontlar da dizini
+    geçersiz kılar.
+    """
+
+    def __init__(self, font_dirs=None, index_path=DEFAULT_INDEX_PATH):
+        """
+        Args:
+            font_dirs: Taranacak font dizinleri (None ise sistem dizinleri)
+            index_path: Dizinin kaydedileceği JSON dosyası (None ise kaydedilmez)
+        """
+        self.font_dirs = font_dirs if font_dirs is not None else get_system_font_dirs()
+        self.index_path = index_path
+        self._files = None
+        self._font_paths = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _get_mtime(dir_path):
+        """Dizinin değiştirilme zamanını döndürür (yoksa None)"""
+        try:
+            return os.path.getmtime(dir_path)
+        except OSError:
+            return None
+
+    def _is_index_current(self, stamps):
+        """Kaydedilmiş dizin damgaları hâlâ geçerliyse True döndürür"""
+        # Üst düzey font dizinleri değiştiyse (eklendi/kaldırıldı) yeniden tara
+        if not isinstance(stamps, dict) or any(dir_path not in stamps for dir_path in self.font_dirs):
+            return False
+
+        return all(self._get_mtime(dir_path) == mtime for dir_path, mtime in stamps.items())
+
+    def _load_index(self):
+        """Diske kaydedilmiş dizini yükler, geçersizse None döndürür"""
+        if not self.index_path:
+            return None
+
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if data.get('version') != INDEX_VERSION or not self._is_index_current(data.get('dirs')):
+            return None
+
+        return data.get('files')
+
+    def _save_index(self, stamps, files):
+        """
+        Dizini geçici dosyaya yazıp yeniden adlandırarak kaydeder (başarısızlık önemsizdir)
+
+        İşçi süreçleri dizini aynı anda kaydedebildiğinden geçici dosya adı
+        sürece özeldir; okuyucular hiçbir zaman yarım yazılmış dosya görmez.
+        """
+        if not self.index_path:
+            return
+
+        temp_path = f"{self.index_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': INDEX_VERSION, 'dirs': stamps, 'files': files}, f)
+            os.replace(temp_path, self.index_path)
+        except OSError as e:
+            logger.warning("Could not save font index: %s", e)
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def _scan(self):
+        """
+        Font dizinlerini tarar
+
+        Returns:
+            (dosya adı -> yol eşlemesi, gezilen dizin -> değiştirilme zamanı) ikilisi
+        """
+        files = {}
+        stamps = {}
+        for dir_path in self.font_dirs:
+            # Var olmayan dizinler de kaydedilir (sonradan oluşturulursa dizin geçersiz olur)
+            stamps[dir_path] = self._get_mtime(dir_path)
+
+            for root, dirs, filenames in os.walk(dir_path):
+                stamps[root] = self._get_mtime(root)
+                for filename in filenames:
+                    # İlk bulunan dosya öncelikli
+                    files.setdefault(filename, os.path.join(root, filename))
+        return files, stamps
+
+    def _get_files(self):
+        """Dizini gerekiyorsa yükler veya oluşturur"""
+        if self._files is None:
+            with self._lock:
+                if self._files is None:
+                    files = self._load_index()
+
+                    if files is None:
+                        files, stamps = self._scan()
+                        self._save_index(stamps, files)
+
+                    self._files = files
+
+        return self._files
+
+    def rebuild(self):
+        """Dizini font dizinlerini yeniden tarayarak oluşturur"""
+        with self._lock:
+            self._files, stamps = self._scan()
+            self._font_paths = {}
+            self._save_index(stamps, self._files)
+
+    def find_font(self, font_name):
+        """
+        Font adına karşılık gelen dosya yolunu döndürür
+
+        Args:
+            font_name: Font adı (örn. "Arial")
+
+        Returns:
+            Font dosyasının yolu ya da bulunamazsa None
+        """
+        font_name = font_name.lower()
+
+        if font_name in self._font_paths:
+            return self._font_paths[font_name]
+
+        files = self._get_files()
+        font_path = None
+
+        for possible_name in FONT_FILE_NAMES.get(font_name, []):
+            if possible_name in files and os.path.exists(files[possible_name]):
+                font_path = files[possible_name]
+                break
+
+        if font_path is None:
+            logger.warning("Font not found in system: %s", font_name)
+
+        self._font_paths[font_name] = font_path
+        return font_path
+
+    def get_font(self, font_name, size):
+        """
+        Font adı ve boyutu için font nesnesi döndürür
+
+        Font bulunamazsa PIL'in varsayılan fontu döner.
+        """
+        font_path = self.find_font(font_name)
+
+        if font_path:
+            try:
+                return load_truetype(font_path, size)
+            except Exception as e:
+                logger.error("Error loading font %s: %s, using default", font_path, e)
+
+        # Varsayılan PIL fontunu kullan
+        return ImageFont.load_default()
+
+
+_default_registry = None
+
+
+def get_font_registry():
+    """
+    Süreç genelinde paylaşılan font dizinini döndürür
+    """
+    global _default_registry
+    if _default_registry is None:
+        _default_registry = FontRegistry()
+    return _default_registry
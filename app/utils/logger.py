@@ -0,0 +1,75 @@
+# app/utils/logger.py
+import logging
+import os
+
+# Uygulama modüllerinin kök kaydedicisi - modüller logging.getLogger(__name__) kullanır
+ROOT_LOGGER_NAME = "app"
+
+# Günlük seviyesini ayarlayan ortam değişkeni (örn. SLIDEMAKER_LOG_LEVEL=DEBUG)
+LOG_LEVEL_ENV = "SLIDEMAKER_LOG_LEVEL"
+
+# Hata ayıklama çıktısı varsayılan olarak kapalıdır
+DEFAULT_LOG_LEVEL = logging.INFO
+
+LOG_FORMAT = "%(asctime)s %(levelname)-7s %(processName)s %(name)s: %(message)s"
+
+
+def parse_log_level(value):
+    """
+    Seviye adını ("debug", "INFO" vb.) ya da sayısını logging seviyesine çevirir
+
+    Raises:
+        ValueError: Bilinmeyen seviye
+    """
+    if isinstance(value, int):
+        return value
+
+    text = str(value).strip()
+    if text.isdigit():
+        return int(text)
+
+    level = logging.getLevelName(text.upper())
+    if not isinstance(level, int):
+        raise ValueError(f"Unknown log level: {value}")
+    return level
+
+
+def setup_logging(level=None, log_file=None):
+    """
+    Uygulama kaydedicisini yapılandırır
+
+    Tekrar çağrılırsa önceki işleyici değiştirilir. İşçi süreçleri de aynı
+    seviyeyle bu fonksiyonu çağırır.
+
+    Args:
+        level: Günlük seviyesi (None ise ortam değişkeni ya da INFO)
+        log_file: Verilirse günlükler stderr yerine bu dosyaya yazılır
+
+    Returns:
+        Uygulanan günlük seviyesi
+    """
+    if level is None:
+        level = os.environ.get(LOG_LEVEL_ENV, DEFAULT_LOG_LEVEL)
+    level = parse_log_level(level)
+
+    logger = logging.getLogger(ROOT_LOGGER_NAME)
+
+    for handler in list(logger.handlers):
+        if getattr(handler, "_app_handler", False):
+            logger.removeHandler(handler)
+            handler.close()
+
+    handler = logging.FileHandler(log_file, encoding="utf-8") if log_file else logging.StreamHandler()
+    handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    handler._app_handler = True
+
+    logger.addHandler(handler)
+    logger.setLevel(level)
+    logger.propagate = False
+
+    return level
+
+
+def get_log_level():
+    """Uygulama kaydedicisinin geçerli seviyesini döndürür"""
+    return logging.getLogger(ROOT_LOGGER_NAME).getEffectiveLevel()
@@ -0,0 +1 @@
+# Python paket tanimlayici 
@@ -0,0 +1,456 @@
+# benchmarks/pipeline.py
+"""
+Görüntü işlem hattının tekrarlanabilir performans ölçümleri
+
+Sentetik test görüntüleri (farklı çözünürlük, en boy oranı, JPEG ve PNG)
+yerel olarak üretilir; ardından yeniden boyutlandırma/kırpma, ekleme
+yapılandırmaları, dosya boyutu tahmini ve tam toplu işlem ölçülür. Her ölçüm
+ayrı bir süreçte çalışır, böylece en yüksek bellek kullanımı (peak RSS)
+ölçümler arasında karışmaz.
+
+Kullanım:
+    python -m benchmarks.pipeline                         # ölçüm yap ve tabloyu yazdır
+    python -m benchmarks.pipeline --save baseline.json    # sonuçları kaydet
+    python -m benchmarks.pipeline --baseline baseline.json  # temel sonuçlarla karşılaştır
+
+Karşılaştırmada verimi temel sonuçtan --tolerance oranından fazla düşen
+ölçüm varsa çıkış kodu 1 olur.
+"""
+import os
+import sys
+import json
+import time
+import random
+import shutil
+import argparse
+import platform
+import tempfile
+import multiprocessing
+import PIL
+from PIL import Image, ImageDraw
+
+from app.core.image_processor import ImageProcessor
+from app.core.overlay_manager import OverlayManager
+from app.core.profiler import get_peak_rss
+
+# Sentetik görüntü tanımları: (ad, genişlik, yükseklik, format)
+IMAGE_SPECS = [
+    ("landscape_fhd", 1920, 1080, "JPEG"),
+    ("landscape_12mp", 4000, 3000, "JPEG"),
+    ("portrait_12mp", 3000, 4000, "JPEG"),
+    ("wide_24mp", 6000, 4000, "JPEG"),
+    ("square_png", 2000, 2000, "PNG"),
+    ("panorama_png", 3000, 1000, "PNG"),
+]
+
+# --quick ile kullanılan küçük görüntü kümesi
+QUICK_SPECS = ["landscape_fhd", "square_png"]
+
+# Ekleme ölçümlerinin hedef boyutu
+OVERLAY_SIZE = (1200, 600)
+
+# Görüntü üretiminde kullanılan tohum - aynı tohum aynı görüntüleri üretir
+DEFAULT_SEED = 1234
+
+# Üretilen görüntülerin sürümü (üretim kodu değişirse artırılır)
+DATA_VERSION = 1
+
+
+def _draw_synthetic(width, height, rng):
+    """Gradyan arka plan üzerinde rastgele şekillerden oluşan bir görüntü çizer"""
+    # Sıkıştırma davranışı gerçek fotoğraflara yakın olsun diye düz renk yerine gradyan
+    gradient = Image.linear_gradient("L")
+    red = gradient.resize((width, height))
+    green = gradient.rotate(90).resize((width, height))
+    blue = gradient.rotate(45).resize((width, height))
+    img = Image.merge("RGB", (red, green, blue))
+
+    draw = ImageDraw.Draw(img)
+    for _ in range(60):
+        x1 = rng.randrange(width)
+        y1 = rng.randrange(height)
+        x2 = min(width, x1 + rng.randrange(20, max(21, width // 3)))
+        y2 = min(height, y1 + rng.randrange(20, max(21, height // 3)))
+        color = (rng.randrange(256), rng.randrange(256), rng.randrange(256))
+        if rng.random() < 0.5:
+            draw.rectangle((x1, y1, x2, y2), fill=color)
+        else:
+            draw.ellipse((x1, y1, x2, y2), fill=color, outline=(0, 0, 0), width=3)
+
+    # Yüksek frekanslı ayrıntı (ince çizgiler)
+    for _ in range(200):
+        x1, y1 = rng.randrange(width), rng.randrange(height)
+        x2, y2 = rng.randrange(width), rng.randrange(height)
+        draw.line((x1, y1, x2, y2), fill=(rng.randrange(256),) * 3, width=1)
+
+    return img
+
+
+def generate_images(folder, specs=None, copies=2, seed=DEFAULT_SEED):
+    """
+    Sentetik test görüntülerini üretir (klasörde zaten varsa yeniden kullanır)
+
+    Args:
+        folder: Görüntülerin yazılacağı klasör
+        specs: IMAGE_SPECS alt kümesi (None ise tümü)
+        copies: Her tanımdan üretilecek görüntü sayısı
+        seed: Rastgele sayı üreteci tohumu
+
+    Returns:
+        Üretilen dosya adlarının listesi
+    """
+    specs = specs or IMAGE_SPECS
+    os.makedirs(folder, exist_ok=True)
+
+    files = []
+    for name, width, height, save_format in specs:
+        ext = ".jpg" if save_format == "JPEG" else ".png"
+        for index in range(copies):
+            filename = f"{name}_{index}{ext}"
+            path = os.path.join(folder, filename)
+            files.append(filename)
+
+            if os.path.exists(path):
+                continue
+
+            # Her görüntünün kendi tohumu vardır; küme değişse de görüntüler aynı kalır
+            rng = random.Random(f"{seed}-{DATA_VERSION}-{name}-{index}")
+            img = _draw_synthetic(width, height, rng)
+            if save_format == "JPEG":
+                img.save(path, format="JPEG", quality=90)
+            else:
+                img.save(path, format="PNG")
+
+    return files
+
+
+def _megapixels(folder, files):
+    """Dosyaların toplam piksel sayısını (megapiksel) döndürür"""
+    total = 0
+    for filename in files:
+        with Image.open(os.path.join(folder, filename)) as img:
+            total += img.width * img.height
+    return total / 1_000_000
+
+
+def _result(count, megapixels, seconds):
+    """Ölçüm sonucunu sözlük olarak döndürür"""
+    return {
+        "count": count,
+        "seconds": seconds,
+        "images_per_second": count / seconds if seconds > 0 else 0.0,
+        "megapixels_per_second": megapixels / seconds if seconds > 0 else 0.0,
+        "peak_rss": get_peak_rss()
+    }
+
+
+def bench_resize(folder, files):
+    """ImageProcessor.resize_image_with_custom_crop - tam çözülmüş kaynaktan Featured boyutuna"""
+    processor = ImageProcessor()
+    images = []
+    for filename in files:
+        with Image.open(os.path.join(folder, filename)) as img:
+            images.append(img.convert("RGB"))
+
+    start = time.perf_counter()
+    for img in images:
+        processor.resize_image_with_custom_crop(img, 1200, 600)
+    seconds = time.perf_counter() - start
+
+    megapixels = sum(img.width * img.height for img in images) / 1_000_000
+    return _result(len(images), megapixels, seconds)
+
+
+def _make_overlay_manager(config, graphic_path):
+    """Ölçüm için ekleme yapılandırmasını kurar"""
+    overlay_manager = OverlayManager()
+
+    if config in ("text", "all"):
+        overlay_manager.set_text_enabled(True)
+        overlay_manager.set_text("WordPress Image Optimizer")
+        overlay_manager.set_text_size(48)
+        overlay_manager.set_text_outline_width(2)
+
+    if config in ("shapes", "all"):
+        overlay_manager.set_shapes_enabled(True)
+        overlay_manager.add_shape({
+            'type': 'rectangle', 'x1': 0.05, 'y1': 0.05, 'x2': 0.4, 'y2': 0.3,
+            'fill_color': (255, 0, 0), 'outline_color': (0, 0, 0), 'outline_width': 3
+        })
+        overlay_manager.add_shape({
+            'type': 'ellipse', 'x1': 0.6, 'y1': 0.6, 'x2': 0.95, 'y2': 0.95,
+            'fill_color': None, 'outline_color': (255, 255, 255), 'outline_width': 5
+        })
+
+    if config in ("graphic", "all"):
+        overlay_manager.set_graphic(graphic_path)
+        overlay_manager.set_graphic_enabled(True)
+        overlay_manager.set_graphic_opacity(70)
+
+    return overlay_manager
+
+
+def bench_overlay(folder, files, config, cold=False):
+    """
+    OverlayManager.apply_overlay - Featured boyutundaki görüntülere eklemeler
+
+    Args:
+        config: "text", "shapes", "graphic" ya da "all"
+        cold: True ise ekleme katmanı önbelleği her görüntüde temizlenir
+            (katmanın oluşturulma maliyeti ölçülür)
+    """
+    processor = ImageProcessor()
+    bases = []
+    for filename in files:
+        with Image.open(os.path.join(folder, filename)) as img:
+            bases.append(processor.resize_image_with_custom_crop(img.convert("RGB"), *OVERLAY_SIZE))
+
+    graphic_path = os.path.join(folder, "graphic.png")
+    overlay_manager = _make_overlay_manager(config, graphic_path)
+
+    # Font ve grafik yüklemesini ölçüme katma
+    overlay_manager.apply_overlay(bases[0])
+
+    start = time.perf_counter()
+    for base in bases:
+        if cold:
+            overlay_manager._overlay_layer_cache.clear()
+            overlay_manager._scaled_graphic_cache.clear()
+        overlay_manager.apply_overlay(base)
+    seconds = time.perf_counter() - start
+
+    megapixels = len(bases) * OVERLAY_SIZE[0] * OVERLAY_SIZE[1] / 1_000_000
+    return _result(len(bases), megapixels, seconds)
+
+
+def bench_text_outline(folder, files, mode):
+    """Metin dış çizgisi çizimi (bkz. benchmarks.text_outline)"""
+    from benchmarks.text_outline import measure_text_outline
+
+    repeat = 20
+    seconds = measure_text_outline(mode, 3, OVERLAY_SIZE, repeat) * repeat
+    megapixels = repeat * OVERLAY_SIZE[0] * OVERLAY_SIZE[1] / 1_000_000
+    return _result(repeat, megapixels, seconds)
+
+
+def bench_estimate(folder, files):
+    """AppManager.estimate_file_size - Featured boyutundaki görüntülerin JPEG kodlaması"""
+    from app.core.app_manager import AppManager
+
+    app_manager = AppManager()
+    processor = ImageProcessor()
+    images = []
+    for filename in files:
+        with Image.open(os.path.join(folder, filename)) as img:
+            images.append(processor.resize_image_with_custom_crop(img.convert("RGB"), *OVERLAY_SIZE))
+
+    start = time.perf_counter()
+    for img in images:
+        app_manager.estimate_file_size(img)
+    seconds = time.perf_counter() - start
+
+    megapixels = len(images) * OVERLAY_SIZE[0] * OVERLAY_SIZE[1] / 1_000_000
+    return _result(len(images), megapixels, seconds)
+
+
+def bench_batch(folder, files, workers=1):
+    """Tam toplu işlem (BatchEngine) - AppManager'ın tüm varsayılan boyutları, metin ve grafik eklemeleri"""
+    from app.core.app_manager import AppManager
+    from app.core.batch_engine import BatchEngine
+
+    output_folder = tempfile.mkdtemp(prefix="slidemaker_bench_out_")
+    try:
+        app_manager = AppManager()
+        app_manager.set_source_folder(folder)
+        app_manager.set_destination_folder(output_folder)
+        app_manager.selected_sizes = [True] * len(app_manager.sizes)
+
+        overlay_config = _make_overlay_manager("all", os.path.join(folder, "graphic.png")).get_config()
+        app_manager.overlay_manager.apply_config(overlay_config)
+
+        settings = app_manager.get_batch_settings()
+        engine = BatchEngine(settings, workers)
+
+        start = time.perf_counter()
+        results = list(engine.run(files))
+        seconds = time.perf_counter() - start
+
+        errors = [result["error"] for result in results if result["error"]]
+        if errors:
+            raise RuntimeError(f"Batch benchmark failed: {errors[0]}")
+    finally:
+        shutil.rmtree(output_folder, ignore_errors=True)
+
+    return _result(len(files), _megapixels(folder, files), seconds)
+
+
+# Ölçüm adı -> (fonksiyon, ek argümanlar)
+BENCHMARKS = {
+    "resize": (bench_resize, ()),
+    "overlay.text": (bench_overlay, ("text",)),
+    "overlay.shapes": (bench_overlay, ("shapes",)),
+    "overlay.graphic": (bench_overlay, ("graphic",)),
+    "overlay.all": (bench_overlay, ("all",)),
+    "overlay.all.cold": (bench_overlay, ("all", True)),
+    "text_outline.offset": (bench_text_outline, ("offset",)),
+    "text_outline.stroke": (bench_text_outline, ("stroke",)),
+    "estimate": (bench_estimate, ()),
+    "batch": (bench_batch, ()),
+}
+
+
+def _run_isolated(name, folder, files, workers):
+    """Bir ölçümü çalıştırır (ayrı süreçte çağrılır)"""
+    function, args = BENCHMARKS[name]
+    if name == "batch":
+        args = (workers,)
+    return function(folder, files, *args)
+
+
+def run_benchmark(name, folder, files, repeat=3, workers=1):
+    """
+    Bir ölçümü her tekrarda yeni bir süreçte çalıştırır
+
+    Returns:
+        Medyan süreli tekrarın sonucu (peak RSS tekrarların en yükseği)
+    """
+    mp_context = multiprocessing.get_context("spawn")
+    runs = []
+
+    for _ in range(repeat):
+        with mp_context.Pool(1) as pool:
+            runs.append(pool.apply(_run_isolated, (name, folder, files, workers)))
+
+    runs.sort(key=lambda run: run["seconds"])
+    result = dict(runs[len(runs) // 2])
+
+    peaks = [run["peak_rss"] for run in runs if run["peak_rss"] is not None]
+    result["peak_rss"] = max(peaks) if peaks else None
+    result["runs"] = [run["seconds"] for run in runs]
+    return result
+
+
+def get_environment():
+    """Sonuçların yorumlanması için çalışma ortamı bilgisi"""
+    return {
+        "python": platform.python_version(),
+        "pillow": PIL.__version__,
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S")
+    }
+
+
+def compare_results(results, baseline, tolerance):
+    """
+    Sonuçları temel sonuçlarla karşılaştırır
+
+    Returns:
+        (ad, temel verim, güncel verim, oran, gerileme mi) listesi
+    """
+    rows = []
+    for name, result in results.items():
+        base = baseline.get("results", {}).get(name)
+        if base is None or base["images_per_second"] <= 0:
+            continue
+        ratio = result["images_per_second"] / base["images_per_second"]
+        rows.append((name, base["images_per_second"], result["images_per_second"],
+                     ratio, ratio < 1 - tolerance))
+    return rows
+
+
+def format_rss(peak_rss):
+    """Bellek kullanımını MB olarak biçimlendirir"""
+    return f"{peak_rss / (1024 * 1024):.0f}" if peak_rss is not None else "-"
+
+
+def build_parser():
+    """Komut satırı argüman ayrıştırıcısını oluşturur"""
+    parser = argparse.ArgumentParser(description="Reproducible benchmarks for the image pipeline")
+    parser.add_argument("names", nargs="*", metavar="NAME",
+                        help=f"Benchmarks to run (default: all). Available: {', '.join(BENCHMARKS)}")
+    parser.add_argument("--data", default=os.path.join(tempfile.gettempdir(), f"slidemaker_bench_v{DATA_VERSION}"),
+                        help="Folder for the generated images (reused between runs; default: %(default)s)")
+    parser.add_argument("--copies", type=int, default=2,
+                        help="Images generated per resolution (default: %(default)s)")
+    parser.add_argument("--quick", action="store_true",
+                        help="Only use the small images (for a fast smoke run)")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="Runs per benchmark; the median is reported (default: %(default)s)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Worker processes for the batch benchmark (default: %(default)s)")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED,
+                        help="Seed for the generated images (default: %(default)s)")
+    parser.add_argument("--save", metavar="FILE", help="Save the results as JSON")
+    parser.add_argument("--baseline", metavar="FILE", help="Compare against results saved with --save")
+    parser.add_argument("--tolerance", type=float, default=0.10,
+                        help="Allowed throughput drop against the baseline (default: %(default)s)")
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    names = args.names or list(BENCHMARKS)
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"Unknown benchmark: {', '.join(unknown)}")
+
+    specs = [spec for spec in IMAGE_SPECS if not args.quick or spec[0] in QUICK_SPECS]
+
+    # Aynı tohumla üretilen görüntüler farklı tohumlu olanlarla karışmasın
+    folder = os.path.join(args.data, f"seed{args.seed}")
+    print(f"Generating test images in {folder}...")
+    files = generate_images(folder, specs, args.copies, args.seed)
+
+    graphic_path = os.path.join(folder, "graphic.png")
+    if not os.path.exists(graphic_path):
+        graphic = _draw_synthetic(400, 200, random.Random(f"{args.seed}-graphic")).convert("RGBA")
+        graphic.save(graphic_path)
+
+    print(f"{'benchmark':<22}{'img/s':>10}{'MP/s':>10}{'seconds':>10}{'RSS MB':>9}")
+    results = {}
+    for name in names:
+        result = run_benchmark(name, folder, files, args.repeat, args.workers)
+        results[name] = result
+        print(f"{name:<22}{result['images_per_second']:>10.2f}{result['megapixels_per_second']:>10.1f}"
+              f"{result['seconds']:>10.3f}{format_rss(result['peak_rss']):>9}")
+
+    report = {
+        "environment": get_environment(),
+        "options": {"quick": args.quick, "copies": args.copies, "repeat": args.repeat,
+                    "workers": args.workers, "seed": args.seed},
+        "results": results
+    }
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Results saved to {args.save}")
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+
+        if baseline.get("options") != report["options"]:
+            print("Warning: baseline was recorded with different options", file=sys.stderr)
+
+        rows = compare_results(results, baseline, args.tolerance)
+        regressions = [row for row in rows if row[4]]
+
+        print(f"\n{'benchmark':<22}{'baseline':>10}{'current':>10}{'change':>9}")
+        for name, base_ips, current_ips, ratio, regressed in rows:
+            flag = "  REGRESSION" if regressed else ""
+            print(f"{name:<22}{base_ips:>10.2f}{current_ips:>10.2f}{(ratio - 1) * 100:>8.1f}%{flag}")
+
+        if regressions:
+            print(f"{len(regressions)} benchmark(s) slower than the baseline by more than "
+                  f"{args.tolerance * 100:.0f}%", file=sys.stderr)
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
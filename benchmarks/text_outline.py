@@ -0,0 +1,48 @@
+# benchmarks/text_outline.py
+"""
+Metin dış çizgisi çizim yöntemlerini karşılaştırır
+
+Kullanım:
+    python -m benchmarks.text_outline
+"""
+import time
+from PIL import Image
+from app.core.overlay_manager import OverlayManager
+
+
+def measure_text_outline(mode, outline_width, size=(1200, 600), repeat=10):
+    """
+    Belirli bir dış çizgi yöntemi ve kalınlığı için metin çizme süresini ölçer
+
+    Returns:
+        Çizim başına ortalama süre (saniye)
+    """
+    overlay_manager = OverlayManager()
+    overlay_manager.set_text_enabled(True)
+    overlay_manager.set_text("WordPress Image Optimizer")
+    overlay_manager.set_text_size(48)
+    overlay_manager.set_text_outline_width(outline_width)
+    overlay_manager.set_text_outline_mode(mode)
+
+    layer = Image.new("RGBA", size, (0, 0, 0, 0))
+
+    # Font yüklemesini ölçüme katma
+    overlay_manager._apply_text(layer)
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        overlay_manager._apply_text(layer)
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    print(f"{'width':>5} {'offset (ms)':>12} {'stroke (ms)':>12} {'speedup':>8}")
+    for outline_width in range(1, 6):
+        offset_time = measure_text_outline("offset", outline_width)
+        stroke_time = measure_text_outline("stroke", outline_width)
+        print(f"{outline_width:>5} {offset_time * 1000:>12.2f} {stroke_time * 1000:>12.2f} "
+              f"{offset_time / stroke_time:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
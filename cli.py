@@ -0,0 +1,242 @@
+# cli.py
+import os
+import sys
+import json
+import argparse
+from app.core.app_manager import AppManager
+from app.utils.logger import setup_logging, parse_log_level, LOG_LEVEL_ENV
+
+
+def parse_size(value, known_sizes):
+    """
+    Boyut argümanını (örn. "1200x600" ya da "Thumbnail") (genişlik, yükseklik, ad) olarak çözer
+
+    Args:
+        value: Boyut dizesi
+        known_sizes: AppManager.sizes listesi
+    """
+    for width, height, name in known_sizes:
+        if value.lower() == name.lower():
+            return width, height, name
+
+    try:
+        width, height = (int(part) for part in value.lower().split("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid size: {value} (use WIDTHxHEIGHT or a preset name)")
+
+    if width <= 0 or height <= 0:
+        raise argparse.ArgumentTypeError(f"Invalid size: {value}")
+
+    return width, height, None
+
+
+def _to_tuples(value):
+    """JSON'dan gelen renk listelerini (örn. [255, 0, 0]) demete dönüştürür"""
+    if isinstance(value, dict):
+        return {key: _to_tuples(item) for key, item in value.items()}
+    if isinstance(value, list):
+        if all(isinstance(item, (int, float)) for item in value):
+            return tuple(value)
+        return [_to_tuples(item) for item in value]
+    return value
+
+
+def load_overlay_config(path, overlay_manager):
+    """
+    JSON ekleme ayar dosyasını okur ve OverlayManager'a uygular
+
+    Dosya OverlayManager.get_config() anahtarlarının bir alt kümesini içerir.
+    Göreli graphic_path değerleri ayar dosyasının klasörüne göre çözülür.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        config = json.load(f)
+
+    if not isinstance(config, dict):
+        raise ValueError("Overlay config must be a JSON object")
+
+    unknown_keys = set(config) - set(overlay_manager.get_config())
+    if unknown_keys:
+        raise ValueError(f"Unknown overlay config keys: {', '.join(sorted(unknown_keys))}")
+
+    config = _to_tuples(config)
+
+    graphic_path = config.get("graphic_path")
+    if graphic_path and not os.path.isabs(graphic_path):
+        config["graphic_path"] = os.path.join(os.path.dirname(os.path.abspath(path)), graphic_path)
+
+    overlay_manager.apply_config(config)
+
+
+def build_parser(app_manager):
+    """Komut satırı argüman ayrıştırıcısını oluşturur"""
+    preset_names = ", ".join(f"{name} ({width}x{height})" for width, height, name in app_manager.sizes)
+
+    parser = argparse.ArgumentParser(
+        description="Headless WordPress image optimizer - processes a folder of images without the GUI"
+    )
+    parser.add_argument("source", help="Source folder with images")
+    parser.add_argument("destination", help="Destination folder for the processed images")
+    parser.add_argument("-s", "--size", dest="sizes", action="append", metavar="SIZE",
+                        help=f"Output size as WIDTHxHEIGHT or preset name; repeatable. Presets: {preset_names}")
+    parser.add_argument("-q", "--quality", type=int, default=app_manager.quality,
+                        help="JPEG/WebP quality 1-100 (default: %(default)s)")
+    parser.add_argument("-f", "--format", dest="output_format", default=app_manager.output_format,
+                        choices=["Same as input", "JPEG", "PNG", "WebP"],
+                        help="Output format (default: %(default)s)")
+    parser.add_argument("-w", "--workers", type=int, default=app_manager.worker_count,
+                        help="Number of worker processes (default: %(default)s)")
+    parser.add_argument("--memory-limit", type=int, metavar="MB",
+                        help="Bound the estimated memory of images processed at once; "
+                             "also encodes one output at a time per worker")
+    parser.add_argument("--max-megapixels", type=float, default=app_manager.image_processor.max_megapixels,
+                        metavar="MP",
+                        help=f"Pixel limit checked from the file header before decoding, e.g. "
+                             f"{app_manager.image_processor.SUGGESTED_MAX_MEGAPIXELS} on small machines; "
+                             f"0 disables it (default: no limit)")
+    parser.add_argument("--oversize", choices=["downscale", "reject"],
+                        default=app_manager.image_processor.oversize_action,
+                        help="What to do with images over the pixel limit: decode JPEGs at a reduced "
+                             "scale or reject them; other formats are always rejected (default: %(default)s)")
+    parser.add_argument("--preflight", action="store_true",
+                        help="Only read image headers and print per-file decode cost estimates")
+    parser.add_argument("-o", "--overlay-config", metavar="FILE",
+                        help="JSON file with overlay settings (OverlayManager.get_config keys)")
+    parser.add_argument("-r", "--recursive", action="store_true",
+                        help="Also process images in subfolders")
+    parser.add_argument("-i", "--incremental", action="store_true",
+                        help="Skip outputs whose source and settings did not change since the last run")
+    parser.add_argument("--content-hash", action="store_true",
+                        help="With --incremental, compare file contents when only the mtime changed")
+    parser.add_argument("--profile", action="store_true",
+                        help="Time each pipeline stage and print a p50/p95/max summary at the end")
+    parser.add_argument("--profile-trace", metavar="FILE",
+                        help="Also write every stage timing to a JSON trace file (implies --profile)")
+    parser.add_argument("--log-level", metavar="LEVEL",
+                        help=f"Diagnostic log level: DEBUG, INFO, WARNING or ERROR "
+                             f"(default: ${LOG_LEVEL_ENV} or INFO)")
+    parser.add_argument("--log-file", metavar="FILE",
+                        help="Write diagnostic logs to FILE instead of stderr")
+    parser.add_argument("--quiet", action="store_true",
+                        help="Only print errors and the final summary")
+    return parser
+
+
+def main(argv=None):
+    """
+    Arayüzsüz toplu işlem giriş noktası
+
+    Returns:
+        Çıkış kodu (0 başarılı, 1 işlenemeyen dosya var, 2 geçersiz argüman, 130 iptal edildi)
+    """
+    app_manager = AppManager()
+    parser = build_parser(app_manager)
+    args = parser.parse_args(argv)
+
+    try:
+        setup_logging(parse_log_level(args.log_level) if args.log_level else None, args.log_file)
+    except (OSError, ValueError) as e:
+        parser.error(f"Could not set up logging: {str(e)}")
+
+    if not os.path.isdir(args.source):
+        parser.error(f"Source folder does not exist: {args.source}")
+
+    if not 1 <= args.quality <= 100:
+        parser.error("Quality must be between 1 and 100")
+
+    if args.workers < 1:
+        parser.error("Worker count must be at least 1")
+
+    if args.memory_limit is not None and args.memory_limit < 1:
+        parser.error("Memory limit must be at least 1 MB")
+
+    if args.max_megapixels is not None and args.max_megapixels < 0:
+        parser.error("Megapixel limit cannot be negative")
+
+    # Boyut seçimi (verilmezse varsayılan seçim korunur)
+    if args.sizes:
+        try:
+            sizes = [parse_size(value, app_manager.sizes) for value in args.sizes]
+        except argparse.ArgumentTypeError as e:
+            parser.error(str(e))
+
+        for index in range(len(app_manager.selected_sizes)):
+            app_manager.toggle_size(index, False)
+        for width, height, name in sizes:
+            app_manager.add_size(width, height, name)
+
+    if args.overlay_config:
+        try:
+            load_overlay_config(args.overlay_config, app_manager.overlay_manager)
+        except (OSError, ValueError) as e:
+            parser.error(f"Could not load overlay config: {str(e)}")
+
+    app_manager.set_pixel_limit(args.max_megapixels or None, args.oversize)
+    app_manager.set_scan_options(recursive=args.recursive)
+
+    # Ön kontrol: yalnızca başlıklar okunur, hiçbir dosya işlenmez ya da yazılmaz
+    if args.preflight:
+        app_manager.set_source_folder(os.path.abspath(args.source))
+        report = app_manager.run_preflight()
+        print(report.format_summary())
+
+        # Sınır kapalıysa önerilen sınırı aşacak dosyaları belirt
+        suggested = app_manager.image_processor.SUGGESTED_MAX_MEGAPIXELS
+        if not app_manager.image_processor.max_megapixels and report.get_over_limit(suggested):
+            print(f"{len(report.get_over_limit(suggested))} file(s) exceed {suggested} MP; "
+                  f"use --max-megapixels {suggested} to downscale or reject them before decoding")
+        return 1 if report.get_problems() else 0
+
+    os.makedirs(args.destination, exist_ok=True)
+
+    app_manager.set_source_folder(os.path.abspath(args.source))
+    app_manager.set_destination_folder(os.path.abspath(args.destination))
+    app_manager.set_quality(args.quality)
+    app_manager.set_output_format(args.output_format)
+    app_manager.set_worker_count(args.workers)
+    app_manager.set_memory_limit(args.memory_limit)
+    app_manager.set_incremental_mode(args.incremental, args.content_hash)
+    app_manager.set_profiling(args.profile or bool(args.profile_trace), args.profile_trace)
+
+    errors = []
+    last_message = [None]
+
+    def on_status_update(message):
+        if message.startswith("Error"):
+            errors.append(message)
+            print(message, file=sys.stderr)
+        elif not args.quiet:
+            print(message)
+        last_message[0] = message
+
+    app_manager.on_status_update = on_status_update
+    app_manager.on_progress_update = lambda value: None
+
+    # İşlem arka planda çalışır; Ctrl+C işlemi temiz biçimde iptal eder
+    job = app_manager.process_images()
+    try:
+        while not job.wait(0.5):
+            pass
+    except KeyboardInterrupt:
+        print("Cancelling - waiting for images in progress...", file=sys.stderr)
+        job.cancel()
+        job.wait()
+
+    # Sessiz modda yalnızca son durum mesajını göster
+    if args.quiet and last_message[0] and not last_message[0].startswith("Error"):
+        print(last_message[0])
+
+    if app_manager.last_profile_report is not None:
+        print(app_manager.last_profile_report.format_summary())
+
+    if job.is_cancelled:
+        return 130
+
+    if errors:
+        print(f"Finished with {len(errors)} error(s)", file=sys.stderr)
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,63 +1,102 @@
 # main.py
+import time
+_start_time = time.perf_counter()
+
+import os
+import sys
 import tkinter as tk
 from tkinter import ttk
-import os
-from app.gui.main_window import MainWindow
-from app.core.app_manager import AppManager
+
+# Açılış süresi hedefi (kullanılabilir pencere)
+STARTUP_TARGET_MS = 300
+
+
+class StartupTimer:
+    """
+    Açılış aşamalarının sürelerini ölçen yardımcı sınıf
+
+    --startup-timing ile etkinleştirildiğinde pencere kullanılabilir hale
+    geldiğinde aşama sürelerini yazdırır ve uygulamayı kapatır.
+    """
+
+    def __init__(self, enabled):
+        self.enabled = enabled
+        self.marks = [("start", _start_time)]
+
+    def mark(self, name):
+        """Bir aşamanın bitişini kaydet"""
+        if self.enabled:
+            self.marks.append((name, time.perf_counter()))
+
+    def report(self):
+        """Aşama sürelerini ve toplam süreyi yazdır"""
+        print("Startup timing:")
+        for (_, previous), (name, current) in zip(self.marks, self.marks[1:]):
+            print(f"  {name:<16} {(current - previous) * 1000:7.1f} ms")
+
+        total_ms = (self.marks[-1][1] - _start_time) * 1000
+        status = "OK" if total_ms <= STARTUP_TARGET_MS else "over target"
+        print(f"  {'total':<16} {total_ms:7.1f} ms (target {STARTUP_TARGET_MS} ms: {status})")
+
 
 def main():
     """
     Ana uygulama giriş noktası
     """
-    print("Uygulama başlatılıyor...")
-    
+    timer = StartupTimer("--startup-timing" in sys.argv)
+    timer.mark("tkinter import")
+
+    # Günlük seviyesi SLIDEMAKER_LOG_LEVEL ile ayarlanır (hata ayıklama varsayılan olarak kapalı)
+    from app.utils.logger import setup_logging
+    setup_logging()
+
     root = tk.Tk()
     root.title("WordPress Image Optimizer")
     root.geometry("1920x1080")
     root.resizable(True, True)
-    
+
     # Tk stil yapılandırması
     style = ttk.Style()
     style.theme_use('clam')  # veya 'alt', 'default', 'classic' gibi diğer temalar
-    
+    timer.mark("Tk root")
+
+    # Uygulama modülleri pencere oluşturulduktan sonra yüklenir
+    from app.core.app_manager import AppManager
+    from app.gui.main_window import MainWindow
+    timer.mark("app import")
+
     # Uygulama yöneticisi oluştur
     app_manager = AppManager()
-    
-    # Klasör yollarını hazırla
-    input_path = os.path.abspath("input")
-    output_path = os.path.abspath("output")
-    graphics_path = os.path.abspath("graphics")
-    
-    print(f"Kaynak klasör yolu: {input_path}")
-    print(f"Hedef klasör yolu: {output_path}")
-    print(f"Grafikler klasör yolu: {graphics_path}")
-    
-    # AppManager'daki değerleri göster
-    print(f"Başlangıçta AppManager source_folder: {app_manager.source_folder}")
-    print(f"Başlangıçta AppManager destination_folder: {app_manager.destination_folder}")
-    
+
     # Kaynak ve hedef klasörleri ayarla
-    app_manager.set_source_folder(input_path)
-    app_manager.set_destination_folder(output_path)
-    
-    # Ayarlama sonrası değerleri göster
-    print(f"Ayarlama sonrası AppManager source_folder: {app_manager.source_folder}")
-    print(f"Ayarlama sonrası AppManager destination_folder: {app_manager.destination_folder}")
-    
+    app_manager.set_source_folder(os.path.abspath("input"))
+    app_manager.set_destination_folder(os.path.abspath("output"))
+
     # Ana pencereyi oluştur
-    app = MainWindow(root, app_manager)
-    
+    MainWindow(root, app_manager)
+    timer.mark("window build")
+
+    if timer.enabled:
+        def on_window_ready():
+            timer.mark("window ready")
+            timer.report()
+            root.destroy()
+
+        def on_window_mapped(event):
+            if event.widget is root:
+                root.unbind("<Map>")
+                root.after_idle(on_window_ready)
+
+        # Pencere ekrana çizilip olay döngüsü boşa düştüğünde hazır sayılır
+        root.bind("<Map>", on_window_mapped)
+
     # Uygulamayı başlat
     root.mainloop()
 
 if __name__ == "__main__":
-    # Gerekli klasörleri kontrol et
-    os.makedirs("app", exist_ok=True)
-    os.makedirs("app/core", exist_ok=True)
-    os.makedirs("app/gui", exist_ok=True)
-    os.makedirs("app/utils", exist_ok=True)
+    # Gerekli veri klasörlerini kontrol et
     os.makedirs("input", exist_ok=True)  # "input" klasörünü oluştur
     os.makedirs("output", exist_ok=True)  # "output" klasörünü oluştur
     os.makedirs("graphics", exist_ok=True)  # "graphics" klasörünü oluştur (grafikler için)
-    
-    main()
\ No newline at end of file
+
+    main()